@@ -0,0 +1,193 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from engine.GameConfig import GameConfig
+from engine.GameWorld import GameWorld
+from engine.InputSource import RandomInput
+from engine.SimulationClock import SimulationClock
+
+FIELDS = ["game", "seed", "params", "score", "kills", "ticks", "duration", "game_over", "peak_items",
+          "tick_mean_us", "tick_p50_us", "tick_p95_us", "tick_max_us"]
+
+def percentile(values: list, fraction: float) -> float:
+    """
+    Returns the value at the given fraction of a sorted list.
+
+    Args:
+        values (list): The sorted values.
+        fraction (float): The fraction, between 0 and 1.
+
+    Returns:
+        float: The value at the fraction, 0 for an empty list.
+    """
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def split_seed(seed: int) -> tuple:
+    """
+    Derives the seeds of the world and of the pilot from the seed of a job.
+
+    Seeding both with the job seed would make the choices of the pilot follow the spawns of the world,
+    since both would draw the same random sequence. The two seeds are drawn from a generator seeded
+    with the job seed instead, so they are independent but still only depend on the job.
+
+    Args:
+        seed (int): The seed of the job.
+
+    Returns:
+        tuple: The seed of the world and the seed of the pilot.
+    """
+    rng = random.Random(seed)
+    return rng.getrandbits(64), rng.getrandbits(64)
+
+
+def run_game(job: dict) -> dict:
+    """
+    Plays one game headless with a random pilot until it is over or the tick limit is reached.
+
+    The world and the pilot get their own random number generators, with independent seeds derived from
+    the seed of the job by split_seed(), so the result only depends on the job and not on the process that runs it.
+
+    Args:
+        job (dict): The game number, the seed, the game parameters, the tick limit and the tick length.
+
+    Returns:
+        dict: The result of the game, with the keys in FIELDS.
+    """
+    clock = SimulationClock(job["tick_length"])
+    world_seed, pilot_seed = split_seed(job["seed"])
+    world = GameWorld(clock, None, config=GameConfig(**job["params"]), seed=world_seed)
+    pilot = RandomInput(pilot_seed)
+    tick_times = []
+    peak_items = 0
+
+    for tick in range(job["max_ticks"]):
+        if world.is_over():
+            break
+        start = time.perf_counter()
+        world.apply_input(pilot.poll(tick))
+        world.update()
+        tick_times.append(time.perf_counter() - start)
+        clock.tick()
+        peak_items = max(peak_items, world.item_count())
+
+    tick_times.sort()
+    return {
+        "game": job["game"],
+        "seed": job["seed"],
+        "params": job["params"],
+        "score": world.score,
+        "kills": world.kills,
+        "ticks": clock.ticks,
+        "duration": clock.time,
+        "game_over": world.is_over(),
+        "peak_items": peak_items,
+        "tick_mean_us": sum(tick_times) / len(tick_times) * 1e6 if tick_times else 0.0,
+        "tick_p50_us": percentile(tick_times, 0.50) * 1e6,
+        "tick_p95_us": percentile(tick_times, 0.95) * 1e6,
+        "tick_max_us": tick_times[-1] * 1e6 if tick_times else 0.0,
+    }
+
+
+def parse_param(text: str) -> tuple:
+    """
+    Parses a parameter sweep given as name=value1,value2,...
+
+    Args:
+        text (str): The parameter sweep.
+
+    Returns:
+        tuple: The name of the parameter and the list of its values.
+
+    Raises:
+        argparse.ArgumentTypeError: If the text is not a sweep of a known parameter.
+    """
+    name, _, values = text.partition("=")
+    if name not in GameConfig.names() or not values:
+        raise argparse.ArgumentTypeError(f"expected one of {', '.join(GameConfig.names())} followed by =values, got {text!r}")
+    parsed = []
+    for value in values.split(","):
+        number = float(value)
+        parsed.append(int(number) if number.is_integer() and "." not in value else number)
+    return name, parsed
+
+
+def make_jobs(sweeps: list, games: int, seed: int, max_ticks: int, tick_length: float) -> list:
+    """
+    Builds the jobs for every point of the parameter grid.
+
+    Game k of every grid point uses the seed seed + k, so the grid points are compared on the same games.
+
+    Args:
+        sweeps (list): The (name, values) pairs of the swept parameters.
+        games (int): The number of games per grid point.
+        seed (int): The seed of the first game of every grid point.
+        max_ticks (int): The tick limit of a game.
+        tick_length (float): The length of one simulation tick, in seconds.
+
+    Returns:
+        list: The jobs, as accepted by run_game().
+    """
+    names = [name for name, _ in sweeps]
+    jobs = []
+    for values in itertools.product(*[values for _, values in sweeps]):
+        params = dict(zip(names, values))
+        for k in range(games):
+            jobs.append({"game": len(jobs), "seed": seed + k, "params": params, "max_ticks": max_ticks, "tick_length": tick_length})
+    return jobs
+
+
+def main():
+    """
+    The main function of the batch runner.
+
+    Spreads the games of the parameter grid over a process pool and streams the result
+    of every game to a JSONL or CSV file as soon as it is finished.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Runs many headless Space Fighters games over a grid of game parameters.")
+    parser.add_argument("--param", type=parse_param, action="append", default=[], help="parameter sweep as name=value1,value2,... (repeatable)")
+    parser.add_argument("--games", type=int, default=10, help="number of games per grid point")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game of every grid point")
+    parser.add_argument("--max-ticks", type=int, default=30000, help="tick limit of a game")
+    parser.add_argument("--tick-length", type=float, default=SimulationClock.BASE_TICK_LENGTH, help="length of one simulation tick in seconds")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--output", default="batch_results.jsonl", help="output file, CSV if it ends with .csv, JSONL otherwise")
+    args = parser.parse_args()
+
+    jobs = make_jobs(args.param, args.games, args.seed, args.max_ticks, args.tick_length)
+    as_csv = args.output.endswith(".csv")
+    start = time.perf_counter()
+
+    with open(args.output, "w", newline="") as file, ProcessPoolExecutor(args.workers) as executor:
+        writer = csv.DictWriter(file, FIELDS) if as_csv else None
+        if writer is not None:
+            writer.writeheader()
+        futures = [executor.submit(run_game, job) for job in jobs]
+        for done, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            if writer is not None:
+                writer.writerow({**result, "params": json.dumps(result["params"], sort_keys=True)})
+            else:
+                file.write(json.dumps(result) + "\n")
+            file.flush()
+            print(f"\r{done}/{len(jobs)} games", end="", flush=True)
+
+    print(f"\n{len(jobs)} games in {time.perf_counter() - start:.1f} s, results in {args.output}")
+
+
+if __name__ == '__main__':
+    main()
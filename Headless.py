@@ -0,0 +1,92 @@
+import argparse
+import time
+
+from engine.GameConfig import GameConfig
+from engine.GameWorld import GameWorld
+from engine.InputSource import InputSource, RandomInput
+from engine.SimulationClock import SimulationClock
+
+def simulate(ticks: int, input_source: InputSource, width: int = 800, height: int = 600, tick_length: float = SimulationClock.BASE_TICK_LENGTH, config: GameConfig = None, seed: int = None) -> dict:
+    """
+    Runs the game rules without Tk for the given number of ticks, as fast as the CPU allows.
+
+    When a game is over a new one is started, until all the ticks are used.
+
+    Args:
+        ticks (int): The number of simulation ticks to run.
+        input_source (InputSource): The source of the player input.
+        width (int): The width of the virtual viewport.
+        height (int): The height of the virtual viewport.
+        tick_length (float): The length of one simulation tick, in seconds.
+        config (GameConfig): The parameters of the game rules, the defaults if None.
+        seed (int): The seed of the first game, the following games use the next numbers. None to seed from the system.
+
+    Returns:
+        dict: The number of ticks and games, the scores, the peak number of items, the pool allocations of the last game, the elapsed wall time and the ticks per second.
+    """
+    clock = SimulationClock(tick_length)
+    world = GameWorld(clock, None, width, height, config, seed)
+    scores = []
+    peak_items = 0
+
+    start = time.perf_counter()
+    for tick in range(ticks):
+        if world.is_over():
+            scores.append(world.score)
+            if seed is not None:
+                seed += 1
+            world = GameWorld(clock, None, width, height, config, seed)
+        world.apply_input(input_source.poll(tick))
+        world.update()
+        clock.tick()
+        peak_items = max(peak_items, world.item_count())
+    elapsed = time.perf_counter() - start
+    scores.append(world.score)
+
+    return {
+        "ticks": ticks,
+        "games": len(scores),
+        "scores": scores,
+        "peak_items": peak_items,
+        "allocations": world.allocation_stats(),
+        "elapsed": elapsed,
+        "ticks_per_second": ticks / elapsed if elapsed > 0 else float("inf"),
+    }
+
+
+def main():
+    """
+    The main function of the headless simulation.
+
+    Parses the command line, runs the simulation and reports the ticks per second.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Runs the Space Fighters game rules without a display.")
+    parser.add_argument("--ticks", type=int, default=10000, help="number of simulation ticks to run")
+    parser.add_argument("--width", type=int, default=800, help="width of the virtual viewport")
+    parser.add_argument("--height", type=int, default=600, help="height of the virtual viewport")
+    parser.add_argument("--tick-length", type=float, default=SimulationClock.BASE_TICK_LENGTH, help="length of one simulation tick in seconds")
+    parser.add_argument("--input", choices=["none", "random"], default="random", help="input source of the player")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the random number generators")
+    args = parser.parse_args()
+
+    input_source = RandomInput(args.seed) if args.input == "random" else InputSource()
+    result = simulate(args.ticks, input_source, args.width, args.height, args.tick_length, seed=args.seed)
+
+    print(f"ticks: {result['ticks']}")
+    print(f"games: {result['games']}")
+    print(f"scores: {result['scores']}")
+    print(f"peak items: {result['peak_items']}")
+    for name, stats in result["allocations"].items():
+        print(f"{name}: {stats['created']} created, {stats['reused']} reused")
+    print(f"elapsed: {result['elapsed']:.3f} s")
+    print(f"ticks per second: {result['ticks_per_second']:.0f}")
+
+
+if __name__ == '__main__':
+    main()
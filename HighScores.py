@@ -1,42 +1,75 @@
 import os
+import tempfile
+from ScoreIndex import ScoreIndex
+from ScoreWriter import ScoreWriter
 
 class HighScores:
     """
     A class to manage high scores for a game.
 
+    The scores are kept in memory and shared by all the screens: the file is read by the first load()
+    only. With a ScoreWriter, save() hands a copy of the scores to the writer thread and returns at once.
+    The file is always written to a temporary file first and then renamed over high_scores.txt, so it
+    is never seen half written, even if the game stops in the middle of a save.
+
+    Only the top scores are kept by name. Every score ever added is also counted in a ScoreIndex, saved as
+    the number of times every score value was achieved, so a score can be ranked among all of them.
+
     Attributes:
     - filename (str): The name of the file to save the high scores to.
+    - histogram_filename (str): The name of the file to save the counts of all the scores to.
     - scores (list): A list of tuples containing the player names and scores.
+    - index (ScoreIndex): The counts of all the scores ever added.
+    - writer (ScoreWriter): The writer thread that saves the file, or None to save on the calling thread.
+    - loaded (bool): True once the file was read.
 
     Methods:
-    - __init__(): Initializes an instance of the HighScores class.
+    - __init__(writer): Initializes an instance of the HighScores class.
     - add_score(name, score): Adds a new score to the high scores list.
     - get_scores(): Returns the high scores list.
     - save(): Saves the high scores to a file.
-    - load(): Loads the high scores from a file.
+    - write(scores, histogram): Writes the given scores and score counts to their files, atomically.
+    - replace(filename, lines): Replaces a file with the given lines, atomically.
+    - load(): Loads the high scores and the score counts from their files, once.
+    - rank(score): Returns the rank of a score among all the scores.
+    - percentile(score): Returns the percentage of all the scores that are below a score.
+    - score_at_percentile(percentile): Returns the score at a percentile of all the scores.
+    - close(): Waits for the pending saves.
     """
 
     filename = "high_scores.txt"
+    histogram_filename = "score_histogram.txt"
+    writer: ScoreWriter = None
+    loaded = False
 
-    def __init__(self):
+    def __init__(self, writer: ScoreWriter = None):
         """
         Initializes an instance of the HighScores class.
 
+        Parameters:
+        - writer (ScoreWriter): The writer thread that saves the file, or None to save on the calling thread.
+
         Attributes:
         - scores (list): A list of tuples containing the player names and scores.
+        - index (ScoreIndex): The counts of all the scores ever added.
         """
         self.scores = []
+        self.index = ScoreIndex()
+        self.writer = writer
 
     def add_score(self, name, score):
         """
         Adds a new score to the high scores list. 
         If the player already exists in the list, their score is updated. 
         The list is then sorted in descending order of scores.
+        The score is counted in the index in any case, unless it is negative.
 
         Parameters:
         - name (str): The name of the player.
         - score (int): The score achieved by the player.
         """
+        if score >= 0:
+            self.index.add(score)
         contains = False
         for i, (n, s) in enumerate(self.scores):
             if n == name:
@@ -60,22 +93,119 @@ class HighScores:
 
     def save(self):
         """
-        Saves the high scores to a file.
+        Saves the high scores and the score counts to their files, on the writer thread if there is one.
+        """
+        scores = list(self.scores)
+        histogram = list(self.index.items())
+        if self.writer is not None:
+            self.writer.submit(self.write, scores, histogram)
+        else:
+            self.write(scores, histogram)
+
+    def write(self, scores: list, histogram: list):
+        """
+        Writes the given scores to the high scores file and the given score counts to the histogram file.
+
+        Parameters:
+        - scores (list): A list of tuples containing the player names and scores.
+        - histogram (list): A list of tuples containing the score values and the number of times they were achieved.
+        """
+        self.replace(self.filename, (f"{name},{score}\n" for name, score in scores))
+        self.replace(self.histogram_filename, (f"{score},{count}\n" for score, count in histogram))
+
+    def replace(self, filename: str, lines):
+        """
+        Writes the given lines to a temporary file next to a file and renames it over the file,
+        which replaces it in a single step.
+
+        Parameters:
+        - filename (str): The name of the file to replace.
+        - lines: The lines to write, with their line ends.
         """
-        with open(self.filename, "w") as file:
-            for name, score in self.scores:
-                file.write(f"{name},{score}\n")
+        directory = os.path.dirname(os.path.abspath(filename))
+        prefix = "." + os.path.splitext(os.path.basename(filename))[0] + "."
+        handle, temporary = tempfile.mkstemp(dir=directory, prefix=prefix, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w") as file:
+                file.writelines(lines)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary, filename)
+        except BaseException:
+            os.remove(temporary)
+            raise
 
     def load(self):
         """
-        Loads the high scores from a file.
+        Loads the high scores and the score counts from their files. Only the first call reads the files,
+        after that the scores in memory are newer than the files. Without a histogram file, the counts
+        start with the high scores.
         """
-        self.scores = []
-        if not os.path.exists(self.filename):
+        if self.loaded:
             return
-        with open(self.filename, "r") as file:
-            for line in file:
-                name, score = line.strip().split(",")
-                self.scores.append((name, int(score)))
-        self.scores.sort(key=lambda x: x[1], reverse=True)
-        self.scores = self.scores[:10]
+        self.loaded = True
+        self.scores = []
+        if os.path.exists(self.filename):
+            with open(self.filename, "r") as file:
+                for line in file:
+                    name, score = line.strip().split(",")
+                    self.scores.append((name, int(score)))
+            self.scores.sort(key=lambda x: x[1], reverse=True)
+            self.scores = self.scores[:10]
+
+        counts = {}
+        if os.path.exists(self.histogram_filename):
+            with open(self.histogram_filename, "r") as file:
+                for line in file:
+                    score, count = line.strip().split(",")
+                    if int(score) >= 0:
+                        counts[int(score)] = int(count)
+        else:
+            for _, score in self.scores:
+                if score >= 0:
+                    counts[score] = counts.get(score, 0) + 1
+        self.index = ScoreIndex(counts)
+
+    def rank(self, score: int) -> int:
+        """
+        Returns the rank of a score among all the scores ever added, in logarithmic time.
+
+        Parameters:
+        - score (int): The score.
+
+        Returns:
+        - int: 1 plus the number of higher scores.
+        """
+        return self.index.rank(score)
+
+    def percentile(self, score: int) -> float:
+        """
+        Returns the percentage of all the scores ever added that are below a score, in logarithmic time.
+
+        Parameters:
+        - score (int): The score.
+
+        Returns:
+        - float: The percentage, from 0 to 100.
+        """
+        return self.index.percentile(score)
+
+    def score_at_percentile(self, percentile: float):
+        """
+        Returns the lowest score that percentile percent of all the scores ever added are at or below,
+        in logarithmic time.
+
+        Parameters:
+        - percentile (float): The percentile, from 0 to 100.
+
+        Returns:
+        - int: The score, or None if there are no scores.
+        """
+        return self.index.score_at(percentile)
+
+    def close(self):
+        """
+        Waits for the pending saves and stops the writer thread. Called when the game exits.
+        """
+        if self.writer is not None:
+            self.writer.close()
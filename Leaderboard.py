@@ -0,0 +1,335 @@
+import os
+import sqlite3
+import time
+from ScoreIndex import ScoreIndex
+from ScoreWriter import ScoreWriter
+
+class Leaderboard:
+    """
+    A high scores backend kept in an SQLite database, for an unlimited history of scores.
+
+    Every score ever added is kept in the scores table. The best score of every player is kept
+    in the bests table, with the player name as its unique key, so the high scores screen reads
+    the top of an index instead of sorting the whole history. It has the same methods as
+    HighScores, so the screens can use either of them.
+
+    Like HighScores, the top scores are kept in memory once loaded and updated by add_score(),
+    and with a ScoreWriter the inserts run on the writer thread, over a connection of its own.
+    The counts of all the scores are loaded into a ScoreIndex, so ranking a score does not count rows.
+
+    Attributes:
+    - path (str): The path of the database file.
+    - connection (sqlite3.Connection): The connection to the database, for the queries.
+    - writer (ScoreWriter): The writer thread that inserts the scores, or None to insert them on the calling thread.
+    - write_connection (sqlite3.Connection): The connection the inserts go through, opened by the thread that writes.
+    - pending (list): The (name, score, time) scores added since the last save().
+    - scores (list): The top scores loaded by load(), as (name, score) tuples.
+    - index (ScoreIndex): The counts of all the scores in the history, loaded by load().
+    - size (int): The number of scores load() reads.
+    - loaded (bool): True once the top scores were read.
+
+    Methods:
+    - __init__(path, size, writer): Opens the database, creating its tables and indexes if needed.
+    - add_score(name, score): Adds a new score, written by the next save().
+    - add_scores(scores): Adds many scores at once, in a single transaction.
+    - get_scores(): Returns the top scores loaded by load().
+    - save(): Writes the pending scores, on the writer thread if there is one.
+    - write(scores): Inserts the given scores.
+    - load(): Loads the top scores and the score counts, once.
+    - top(k): Returns the k best players.
+    - page(number, size): Returns a page of the best players.
+    - best(name): Returns the best score of a player.
+    - history(name, limit): Returns the latest scores, of all players or of one.
+    - rank(score): Returns the rank of a score among all the scores.
+    - percentile(score): Returns the percentage of all the scores that are below a score.
+    - score_at_percentile(percentile): Returns the score at a percentile of all the scores.
+    - players(): Returns the number of players.
+    - count(): Returns the number of scores in the history.
+    - import_file(filename): Adds the scores of a high scores text file.
+    - close(): Writes the pending scores and closes the database.
+    - close_writer(): Closes the connection of the writer thread.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS scores (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            score INTEGER NOT NULL,
+            time REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS scores_by_name ON scores (name, time);
+        CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score);
+        CREATE TABLE IF NOT EXISTS bests (
+            name TEXT PRIMARY KEY,
+            score INTEGER NOT NULL,
+            time REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS bests_by_score ON bests (score DESC, name);
+    """
+
+    UPSERT_BEST = """
+        INSERT INTO bests (name, score, time) VALUES (?, ?, ?)
+        ON CONFLICT (name) DO UPDATE SET score = excluded.score, time = excluded.time
+        WHERE excluded.score > bests.score
+    """
+
+    path: str
+    connection: sqlite3.Connection
+    writer: ScoreWriter = None
+    write_connection: sqlite3.Connection = None
+    pending: list
+    scores: list
+    index: ScoreIndex
+    size = 10
+    loaded = False
+
+    def __init__(self, path: str = "leaderboard.db", size: int = 10, writer: ScoreWriter = None):
+        """
+        Opens the database, creating its tables and indexes if needed.
+
+        Parameters:
+        - path (str): The path of the database file.
+        - size (int): The number of scores load() reads for the high scores screen.
+        - writer (ScoreWriter): The writer thread that inserts the scores, or None to insert them on the calling thread.
+        """
+        self.path = path
+        self.size = size
+        self.writer = writer
+        self.pending = []
+        self.scores = []
+        self.index = ScoreIndex()
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        with self.connection:
+            self.connection.executescript(self.SCHEMA)
+
+    def add_score(self, name: str, score: int):
+        """
+        Adds a new score. It is written to the database by the next save(), together with
+        the other pending scores, and shown in the loaded top scores and counts right away.
+        A negative score is stored but not counted in the index, as load() leaves it out.
+
+        Parameters:
+        - name (str): The name of the player.
+        - score (int): The score achieved by the player.
+        """
+        self.pending.append((name, score, time.time()))
+        if score >= 0:
+            self.index.add(score)
+        scores = [(n, s) for n, s in self.scores if n != name]
+        previous = next((s for n, s in self.scores if n == name), None)
+        scores.append((name, score if previous is None else max(previous, score)))
+        scores.sort(key=lambda x: (-x[1], x[0]))
+        self.scores = scores[:self.size]
+
+    def add_scores(self, scores):
+        """
+        Adds many scores at once, in a single transaction, and waits until they are written.
+        The next load() reads the top scores and the score counts again.
+
+        Parameters:
+        - scores: The (name, score) pairs to add.
+        """
+        now = time.time()
+        self.pending.extend((name, score, now) for name, score in scores)
+        self.save()
+        if self.writer is not None:
+            self.writer.flush()
+        self.loaded = False
+
+    def get_scores(self) -> list:
+        """
+        Returns the top scores loaded by load().
+
+        Returns:
+        - list: A list of tuples containing the player names and scores.
+        """
+        return self.scores
+
+    def save(self):
+        """
+        Writes the pending scores, on the writer thread if there is one.
+        """
+        if not self.pending:
+            return
+        pending = self.pending
+        self.pending = []
+        if self.writer is not None:
+            self.writer.submit(self.write, pending)
+        else:
+            self.write(pending)
+
+    def write(self, scores: list):
+        """
+        Inserts the given scores into the history and updates the best score of their players,
+        in a single transaction.
+
+        Parameters:
+        - scores (list): The (name, score, time) scores.
+        """
+        if self.write_connection is None:
+            self.write_connection = sqlite3.connect(self.path) if self.writer is not None else self.connection
+        with self.write_connection:
+            self.write_connection.executemany("INSERT INTO scores (name, score, time) VALUES (?, ?, ?)", scores)
+            self.write_connection.executemany(self.UPSERT_BEST, scores)
+
+    def load(self):
+        """
+        Loads the top scores, reading only the top of the index of the best scores, and the number of
+        times every score value was achieved, from the index of the scores. Only the first call reads
+        the database, after that the scores in memory are kept up to date by add_score().
+        """
+        if self.loaded:
+            return
+        self.loaded = True
+        self.scores = self.top(self.size)
+        cursor = self.connection.execute("SELECT score, COUNT(*) FROM scores WHERE score >= 0 GROUP BY score")
+        self.index = ScoreIndex(dict(cursor.fetchall()))
+
+    def top(self, k: int = 10) -> list:
+        """
+        Returns the k best players.
+
+        Parameters:
+        - k (int): The number of players.
+
+        Returns:
+        - list: The (name, score) tuples of the best players, best first.
+        """
+        return self.page(0, k)
+
+    def page(self, number: int, size: int = 10) -> list:
+        """
+        Returns a page of the best players.
+
+        Parameters:
+        - number (int): The number of the page, 0 for the first one.
+        - size (int): The number of players per page.
+
+        Returns:
+        - list: The (name, score) tuples of the players on the page, best first.
+        """
+        cursor = self.connection.execute(
+            "SELECT name, score FROM bests ORDER BY score DESC, name LIMIT ? OFFSET ?", (size, number * size))
+        return cursor.fetchall()
+
+    def best(self, name: str):
+        """
+        Returns the best score of a player.
+
+        Parameters:
+        - name (str): The name of the player.
+
+        Returns:
+        - int: The best score of the player, or None if they have no score.
+        """
+        row = self.connection.execute("SELECT score FROM bests WHERE name = ?", (name,)).fetchone()
+        return row[0] if row is not None else None
+
+    def history(self, name: str = None, limit: int = 100) -> list:
+        """
+        Returns the latest scores, of all players or of one.
+
+        Parameters:
+        - name (str): The name of the player, None for all the players.
+        - limit (int): The maximal number of scores.
+
+        Returns:
+        - list: The (name, score, time) tuples of the scores, latest first.
+        """
+        if name is None:
+            cursor = self.connection.execute("SELECT name, score, time FROM scores ORDER BY id DESC LIMIT ?", (limit,))
+        else:
+            cursor = self.connection.execute(
+                "SELECT name, score, time FROM scores WHERE name = ? ORDER BY time DESC LIMIT ?", (name, limit))
+        return cursor.fetchall()
+
+    def rank(self, score: int) -> int:
+        """
+        Returns the rank of a score among all the scores in the history, in logarithmic time.
+
+        Parameters:
+        - score (int): The score.
+
+        Returns:
+        - int: 1 plus the number of higher scores.
+        """
+        return self.index.rank(score)
+
+    def percentile(self, score: int) -> float:
+        """
+        Returns the percentage of all the scores in the history that are below a score, in logarithmic time.
+
+        Parameters:
+        - score (int): The score.
+
+        Returns:
+        - float: The percentage, from 0 to 100.
+        """
+        return self.index.percentile(score)
+
+    def score_at_percentile(self, percentile: float):
+        """
+        Returns the lowest score that percentile percent of all the scores in the history are at or below,
+        in logarithmic time.
+
+        Parameters:
+        - percentile (float): The percentile, from 0 to 100.
+
+        Returns:
+        - int: The score, or None if there are no scores.
+        """
+        return self.index.score_at(percentile)
+
+    def players(self) -> int:
+        """
+        Returns the number of players.
+
+        Returns:
+        - int: The number of players with a best score.
+        """
+        return self.connection.execute("SELECT COUNT(*) FROM bests").fetchone()[0]
+
+    def count(self) -> int:
+        """
+        Returns the number of scores in the history.
+
+        Returns:
+        - int: The number of scores.
+        """
+        return self.connection.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def import_file(self, filename: str):
+        """
+        Adds the scores of a high scores text file, in the format written by HighScores.save().
+
+        Parameters:
+        - filename (str): The path of the text file. Nothing is added if it does not exist.
+        """
+        if not os.path.exists(filename):
+            return
+        scores = []
+        with open(filename, "r") as file:
+            for line in file:
+                name, score = line.strip().rsplit(",", 1)
+                scores.append((name, int(score)))
+        self.add_scores(scores)
+
+    def close(self):
+        """
+        Writes the pending scores, waits for the writer thread and closes the database.
+        """
+        self.save()
+        if self.writer is not None:
+            self.writer.submit(self.close_writer)
+            self.writer.close()
+        self.connection.close()
+
+    def close_writer(self):
+        """
+        Closes the connection of the writer thread, on the writer thread.
+        """
+        if self.write_connection is not None:
+            self.write_connection.close()
+            self.write_connection = None
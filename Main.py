@@ -1,24 +1,53 @@
+import argparse
 from tkinter import Tk
+from HighScores import HighScores
+from Leaderboard import Leaderboard
 from MainFrame import MainFrame
+from ScoreWriter import ScoreWriter
+from engine.SimulationClock import SimulationClock
 
 def main():
     """
     The main function that initializes the application.
 
-    This function creates a Tkinter root window, instantiates the MainFrame class,
+    This function parses the command line, creates a Tkinter root window, instantiates the MainFrame class,
     sets the window size and position, and starts the main event loop.
 
+    With --leaderboard the high scores are kept in an SQLite database instead of the text file.
+    A new database starts with the scores of the text file. Either way the scores are saved by a
+    ScoreWriter thread, and the saves still pending when the window closes are finished before exit.
+    With --record every match is recorded into a replay file, --replay plays one back in the window.
+    With --stress the stress test starts right away, see StressTest.
+
     Args:
         None
 
     Returns:
         None
     """
+    parser = argparse.ArgumentParser(description="Space Fighters")
+    parser.add_argument("--leaderboard", metavar="PATH", help="keep the high scores in this SQLite database")
+    parser.add_argument("--record", metavar="DIR", help="record every match into a replay file in this directory")
+    parser.add_argument("--replay", metavar="PATH", help="play back a recorded match")
+    parser.add_argument("--fps", type=float, default=60.0, help="number of frames per second to draw")
+    parser.add_argument("--stress", action="store_true", help="run the stress test and write its report")
+    parser.add_argument("--tick-length", type=float, default=SimulationClock.BASE_TICK_LENGTH, help="length of one simulation tick in seconds")
+    args = parser.parse_args()
+
+    if args.leaderboard:
+        high_scores = Leaderboard(args.leaderboard, writer=ScoreWriter())
+        if high_scores.players() == 0:
+            high_scores.import_file(HighScores.filename)
+    else:
+        high_scores = HighScores(ScoreWriter())
+
     root = Tk()
-    ex = MainFrame()
+    ex = MainFrame(high_scores, args.record, args.replay, args.fps, args.tick_length, args.stress)
     root.geometry("800x600+300+300")
     root.mainloop()
 
+    high_scores.close()
+
 
 if __name__ == '__main__':
     main()
@@ -1,13 +1,21 @@
+import os
 import time
 from tkinter import BOTH, Canvas, Frame
 import threading
 
 from HighScores import HighScores
+from ScoreWriter import ScoreWriter
+from engine.FramePacer import FramePacer
+from engine.Profiler import Profiler
+from engine.QualityGovernor import QualityGovernor
+from engine.SimulationClock import SimulationClock
 from screens.CreditScreen import CreditScreen
 from screens.HighScoresScreen import HighScoresScreen
 from screens.BaseScreeen import BaseScreen
 from screens.GameOverScreen import GameOverScreen
 from screens.GameScreen import GameScreen
+from screens.ReplayScreen import ReplayScreen
+from screens.StressScreen import StressScreen
 from screens.WelcomeScreen import WelcomeScreen
 
 class MainFrame(Frame):
@@ -19,47 +27,108 @@ class MainFrame(Frame):
     Attributes:
     - canvas (Canvas): The canvas widget used for drawing game elements.
     - screen (BaseScreen): The current screen being displayed.
-    - high_scores (HighScores): An instance of the HighScores class for managing high scores.
+    - drawn_screen (BaseScreen): The screen that was drawn in the last frame.
+    - drawn_ticks (int): The simulation ticks of the clock when the last frame was drawn.
+    - tick_length (float): The length of one simulation tick, in seconds. Longer ticks trade accuracy for CPU.
+    - clock (SimulationClock): The fixed-timestep clock that drives the simulation.
+    - profiler (Profiler): The phase profiler, toggled with F3. F4 dumps its events as a Chrome trace.
+    - target_fps (float): The number of frames per second the pacer aims for.
+    - pacer (FramePacer): Schedules the frames on a fixed cadence and measures their jitter.
+    - frame_budget (float): The time a frame may take to draw, in seconds, one frame interval.
+    - governor (QualityGovernor): Lowers the level of detail of the entities when the frames take longer than the budget.
+    - overlay_text (int): The canvas item of the profiler overlay, None when it is not shown.
+    - overlay_time (float): The time the profiler overlay was last refreshed.
+    - overlay_interval (float): The number of seconds between two refreshes of the profiler overlay.
+    - high_scores (HighScores): The high scores backend, a HighScores text file or a Leaderboard database.
+    - record_dir (str): The directory every match is recorded into as a replay file, or None.
 
     Methods:
     - __init__(): Initializes the MainFrame object and sets up the window.
     - set_screen(screen): Sets the current screen to the specified screen.
-    - draw(): Clears the canvas and redraws the current screen.
+    - draw(): Redraws the current screen if the simulation advanced, adapts the level of detail and schedules the next frame.
+    - on_resize(event): Passes a resize of the canvas on to the current screen.
     - show_welcome(event): Displays the welcome screen.
     - show_credit(event): Displays the credit screen.
     - start_game(event): Starts the game. Displays the game screen.
+    - show_replay(path): Plays a recorded match back. Displays the replay screen.
+    - start_stress(event): Starts the stress test. Displays the stress screen.
     - game_over(score): Displays the game over screen with the final score.
     - show_high_scores(event): Displays the high scores screen.
-    - update(): Updates the current screen at regular intervals.
+    - update(): Updates the current screen once for every simulation tick.
+    - draw_frame(screen, ticks, start): Draws a frame of the current screen and the profiler overlay.
+    - draw_overlay(): Shows the FPS, the tick time percentiles, the number of game items, the level of detail and the frame jitter.
+    - dump_trace(event): Writes the profiler events to a Chrome trace-event JSON file.
     """
 
     canvas: Canvas
     screen: BaseScreen = None
-    high_scores = HighScores()
-
-    def __init__(self):
+    drawn_screen: BaseScreen = None
+    drawn_ticks = -1
+    tick_length = SimulationClock.BASE_TICK_LENGTH
+    clock: SimulationClock
+    profiler: Profiler
+    target_fps = 60.0
+    pacer: FramePacer
+    frame_budget = 1 / 60
+    governor: QualityGovernor
+    overlay_text = None
+    overlay_time = 0.0
+    overlay_interval = 0.25
+    high_scores: HighScores
+    record_dir: str = None
+
+    def __init__(self, high_scores=None, record_dir: str = None, replay: str = None, target_fps: float = 60.0, tick_length: float = None,
+                 stress: bool = False):
         """
         Initializes the MainFrame object and sets up the window.
 
         Displays the welcome screen.
         Sets up the canvas and starts the game loop. 
 
+        Parameters:
+        - high_scores: The high scores backend, a HighScores text file saved by a ScoreWriter by default.
+        - record_dir: The directory to record every match into, or None not to record.
+        - replay: The path of a replay file to play back instead of displaying the welcome screen, or None.
+        - target_fps: The number of frames per second to draw.
+        - tick_length: The length of one simulation tick in seconds, BASE_TICK_LENGTH by default.
+          The entities are drawn interpolated between ticks, so longer ticks save CPU without judder.
+        - stress: True to start the stress test instead of displaying the welcome screen.
+
         Attributes:
         - canvas (Canvas): The canvas widget used for drawing game elements.
         - screen (BaseScreen): The current screen being displayed.
-        - high_scores (HighScores): An instance of the HighScores class for managing high scores.
+        - high_scores (HighScores): The high scores backend shared by the screens.
         """
         super().__init__()
+        self.high_scores = high_scores if high_scores is not None else HighScores(ScoreWriter())
+        self.high_scores.load()
+        self.record_dir = record_dir
 
         self.master.title("Space Fighters")
         self.pack(fill=BOTH, expand=1)
 
         self.canvas = Canvas(self)
         self.canvas.pack(fill=BOTH, expand=1)
-
+        self.canvas.bind("<Configure>", self.on_resize)
+
+        if tick_length is not None:
+            self.tick_length = tick_length
+        self.clock = SimulationClock(self.tick_length)
+        self.profiler = Profiler()
+        self.target_fps = target_fps
+        self.pacer = FramePacer(target_fps)
+        self.frame_budget = self.pacer.interval
+        self.governor = QualityGovernor(self.frame_budget)
+        self.canvas.bind_all("<F3>", self.profiler.toggle)
+        self.canvas.bind_all("<F4>", self.dump_trace)
         threading.Thread(target=self.update).start()
 
-        self.show_welcome()
+        if replay is not None:
+            self.show_replay(replay)
+        elif stress:
+            self.start_stress()
+        else:
+            self.show_welcome()
 
         self.draw()
         self.canvas.focus_set()
@@ -81,35 +150,112 @@ class MainFrame(Frame):
 
     def draw(self):
         """
-        Clears the canvas and redraws the current screen.
+        Redraws the current screen, and schedules the next frame with the pacer.
+
+        The canvas is cleared when the screen has changed since the last frame and before every
+        frame of screens that are not retained. Retained screens update their own canvas items.
+        A frame is skipped when the simulation has not ticked since the last one and the screen
+        is the same, not invalidated and settled, the canvas already shows it.
+
+        The time the screen takes to draw is given to the governor, which lowers the level of detail
+        of the entities in heavy waves and raises it again when there is headroom.
         """
-        self.canvas.delete('all')
+        start = time.perf_counter()
+        self.pacer.begin(start)
 
-        if self.screen is not None:
-            self.screen.draw()
+        screen = self.screen
+        ticks = self.clock.ticks
+        if screen is self.drawn_screen and ticks == self.drawn_ticks and (screen is None or (screen.settled and not screen.dirty)):
+            self.pacer.skip()
+        else:
+            self.draw_frame(screen, ticks, start)
+
+        self.after(self.pacer.next_delay(time.perf_counter()), self.draw)
 
-        self.after(16, self.draw)
+
+    def draw_frame(self, screen, ticks, start):
+        """
+        Draws a frame of the current screen, and the profiler overlay while the profiler is enabled.
+
+        Parameters:
+        - screen (BaseScreen): The screen to draw.
+        - ticks (int): The simulation ticks of the clock, remembered to skip the frames until it ticks again.
+        - start (float): The start of the frame, in seconds of time.perf_counter().
+        """
+        profiler = self.profiler
+        if screen is not self.drawn_screen or screen is None or not screen.retained:
+            self.canvas.delete('all')
+            self.drawn_screen = screen
+            self.overlay_text = None
+        self.drawn_ticks = ticks
+
+        if screen is not None:
+            screen.detail = self.governor.level
+            screen.draw()
+        self.governor.record(time.perf_counter() - start)
+
+        if profiler.enabled:
+            profiler.record("frame", start)
+            self.draw_overlay()
+        elif self.overlay_text is not None:
+            self.canvas.delete(self.overlay_text)
+            self.overlay_text = None
+
+
+    def on_resize(self, event):
+        """
+        Passes a resize of the canvas on to the current screen, which creates its static content again.
+
+        Parameters:
+        - event: The configure event of the canvas.
+        """
+        if self.screen is not None:
+            self.screen.on_resize(event)
 
 
     def show_welcome(self, event = None):
         """
         Displays the welcome screen.
         """
-        self.set_screen(WelcomeScreen(self.canvas, self.start_game, self.show_high_scores, self.show_credit))
+        self.set_screen(WelcomeScreen(self.canvas, self.start_game, self.show_high_scores, self.show_credit, self.start_stress))
 
 
     def show_credit(self, event = None):
         """
         Displays the credit screen.
         """
-        self.set_screen(CreditScreen(self.canvas, self.show_welcome))
+        self.set_screen(CreditScreen(self.canvas, self.show_welcome, self.clock))
 
 
     def start_game(self, event = None):
         """
         Starts the game. Displays the game screen.
+        With a record_dir, the match is recorded into a replay file named after the current time.
         """
-        self.set_screen(GameScreen(self.canvas, self.game_over))
+        record_path = None
+        if self.record_dir is not None:
+            os.makedirs(self.record_dir, exist_ok=True)
+            record_path = os.path.join(self.record_dir, time.strftime("replay-%Y%m%d-%H%M%S.sfr"))
+        self.set_screen(GameScreen(self.canvas, self.game_over, self.clock, self.profiler, record_path))
+
+
+    def show_replay(self, path):
+        """
+        Plays a recorded match back. Displays the replay screen, which goes back to the welcome screen.
+
+        Parameters:
+        - path (str): The path of the replay file.
+        """
+        self.set_screen(ReplayScreen(self.canvas, path, self.show_welcome))
+
+
+    def start_stress(self, event = None):
+        """
+        Starts the stress test. Displays the stress screen, which writes its report named after the current time
+        and goes back to the welcome screen.
+        """
+        report_path = time.strftime("stress-report-%Y%m%d-%H%M%S.json")
+        self.set_screen(StressScreen(self.canvas, self.show_welcome, self.clock, self.profiler, report_path))
 
 
     def game_over(self, score):
@@ -119,7 +265,7 @@ class MainFrame(Frame):
         Parameters:
         - score (int): The final score of the game.
         """
-        self.set_screen(GameOverScreen(self.canvas, score, self.show_high_scores))
+        self.set_screen(GameOverScreen(self.canvas, score, self.show_high_scores, self.high_scores))
 
 
     def show_high_scores(self, event = None):
@@ -132,11 +278,56 @@ class MainFrame(Frame):
 
     def update(self):
         """
-        Updates the current screen at regular intervals.
+        Updates the current screen once for every simulation tick.
+
+        The simulation clock turns the wall time that passed into fixed-length ticks, so the game
+        runs at the same speed regardless of the machine load. Between the ticks the thread sleeps
+        until the next one is due.
         """
         while True:
-            if self.screen is not None:
-                self.screen.update()
-            time.sleep(0.01)
+            for _ in range(self.clock.advance(time.perf_counter())):
+                if self.screen is not None:
+                    if self.profiler.enabled:
+                        start = time.perf_counter()
+                        self.screen.update()
+                        self.profiler.record("tick", start)
+                    else:
+                        self.screen.update()
+                self.clock.tick()
+            time.sleep(self.clock.remaining())
+
+
+    def draw_overlay(self):
+        """
+        Shows the FPS, the tick time percentiles, the number of game items, the level of detail and the frame jitter
+        in the top left corner.
+
+        The text is refreshed every overlay_interval seconds, so the overlay itself stays cheap.
+        """
+        now = time.perf_counter()
+        if self.overlay_text is not None and now - self.overlay_time < self.overlay_interval:
+            return
+        self.overlay_time = now
+
+        summary = self.profiler.summary()
+        pacing = self.pacer.stats()
+        text = (f"FPS: {summary['fps']}\n"
+                f"tick p50/p95/p99: {summary['tick_p50'] * 1e3:.2f}/{summary['tick_p95'] * 1e3:.2f}/{summary['tick_p99'] * 1e3:.2f} ms\n"
+                f"items: {summary['counters'].get('items', 0):.0f}\n"
+                f"detail: {self.governor.name()}\n"
+                f"jitter: {pacing['jitter'] * 1e3:.2f} ms, late p95: {pacing['late_p95'] * 1e3:.2f} ms\n"
+                f"skipped/dropped: {pacing['skipped']}/{pacing['dropped']}")
+        if self.overlay_text is None:
+            self.overlay_text = self.canvas.create_text(10, 10, text=text, anchor="nw", font=("Courier", 10))
+        else:
+            self.canvas.itemconfigure(self.overlay_text, text=text)
+            self.canvas.tag_raise(self.overlay_text)
+
+
+    def dump_trace(self, event = None):
+        """
+        Writes the profiler events to a Chrome trace-event JSON file named after the current time.
+        """
+        self.profiler.dump_chrome_trace(time.strftime("trace-%Y%m%d-%H%M%S.json"))
 
     
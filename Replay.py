@@ -0,0 +1,71 @@
+import argparse
+import time
+
+from engine.ReplayPlayer import ReplayPlayer
+
+def replay(path: str, seek: int = 0, until: int = None) -> dict:
+    """
+    Replays a recorded match without Tk, as fast as the CPU allows.
+
+    Args:
+        path (str): The path of the replay file.
+        seek (int): The tick to start from. The world is restored from the nearest keyframe before it.
+        until (int): The tick to stop at, None for the end of the recording.
+
+    Returns:
+        dict: The recorded ticks, the ticks replayed, the last tick, the score and lives, the time spent seeking, the elapsed wall time and the ticks per second.
+    """
+    player = ReplayPlayer(path)
+    try:
+        start = time.perf_counter()
+        world = player.start(seek)
+        seeking = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ticks = player.run(until)
+        elapsed = time.perf_counter() - start
+    finally:
+        player.close()
+
+    return {
+        "recorded": player.end,
+        "keyframes": len(player.index),
+        "ticks": ticks,
+        "tick": player.tick,
+        "score": world.score,
+        "lives": world.ship.lives,
+        "seeking": seeking,
+        "elapsed": elapsed,
+        "ticks_per_second": ticks / elapsed if elapsed > 0 else float("inf"),
+    }
+
+
+def main():
+    """
+    The main function of the replay.
+
+    Parses the command line, replays the match and reports where it ended and the ticks per second.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Replays a recorded Space Fighters match without a display.")
+    parser.add_argument("path", help="the replay file, recorded with Main.py --record")
+    parser.add_argument("--seek", type=int, default=0, help="tick to start the replay from")
+    parser.add_argument("--until", type=int, default=None, help="tick to stop the replay at")
+    args = parser.parse_args()
+
+    result = replay(args.path, args.seek, args.until)
+    print(f"recorded ticks: {result['recorded']} ({result['keyframes']} keyframes)")
+    print(f"replayed ticks: {result['ticks']}, up to tick {result['tick']}")
+    print(f"score: {result['score']}, lives: {result['lives']}")
+    print(f"seek: {result['seeking'] * 1e3:.1f} ms")
+    print(f"elapsed: {result['elapsed']:.3f} s")
+    print(f"ticks per second: {result['ticks_per_second']:.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+class ScoreIndex:
+    """
+    Counts every score ever achieved, to rank a score among all of them in logarithmic time.
+
+    The counts are kept per score value in a Fenwick tree (binary indexed tree), so adding a score,
+    counting the scores at or below a value and finding the score at a percentile all take O(log m),
+    where m is the highest score, whatever the number of scores stored. Millions of scores cost no
+    more than a few of them, only the range of the values matters.
+
+    The tree grows to the next power of two when a higher score than it can hold is added.
+
+    Attributes:
+    - counts (list): The number of scores of every value, indexed by the score.
+    - tree (list): The Fenwick tree over counts, 1-based: tree[i] sums the counts of the i & -i values up to i - 1.
+    - total (int): The number of scores.
+
+    Methods:
+    - __init__(counts): Builds the index from the counts of the scores.
+    - add(score, count): Adds a score, count times.
+    - at_most(score) -> int: Returns the number of scores at or below a score.
+    - rank(score) -> int: Returns the rank a score would have among all the scores.
+    - percentile(score) -> float: Returns the percentage of the scores that are below a score.
+    - score_at(percentile) -> int: Returns the lowest score that reaches a percentile.
+    - items(): Yields the (score, count) of every score value that was achieved.
+    """
+
+    counts: list
+    tree: list
+    total = 0
+
+    def __init__(self, counts: dict = None):
+        """
+        Builds the index from the counts of the scores, in linear time.
+
+        Parameters:
+        - counts (dict): The number of scores of every score value, or None for an empty index.
+
+        Raises:
+        - ValueError: If a score is negative.
+        """
+        if counts and min(counts) < 0:
+            raise ValueError(f"scores must be 0 or more, got {min(counts)}")
+        self.counts = [0]
+        self.tree = [0, 0]
+        self.total = 0
+        if counts:
+            self.grow(max(counts))
+            for score, count in counts.items():
+                self.counts[score] += count
+                self.total += count
+            self.build()
+
+    def __len__(self) -> int:
+        return self.total
+
+    def grow(self, score: int):
+        """
+        Makes room for the scores up to a score, doubling the size until it fits, and rebuilds the tree.
+
+        Parameters:
+        - score (int): The highest score to hold.
+        """
+        size = len(self.counts)
+        while size <= score:
+            size *= 2
+        self.counts.extend([0] * (size - len(self.counts)))
+        self.build()
+
+    def build(self):
+        """
+        Builds the Fenwick tree from the counts, in linear time.
+        """
+        size = len(self.counts)
+        tree = [0] + self.counts
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self.tree = tree
+
+    def add(self, score: int, count: int = 1):
+        """
+        Adds a score, count times.
+
+        Parameters:
+        - score (int): The score, 0 or more.
+        - count (int): The number of times to add it.
+
+        Raises:
+        - ValueError: If the score is negative.
+        """
+        if score < 0:
+            raise ValueError(f"scores must be 0 or more, got {score}")
+        if score >= len(self.counts):
+            self.grow(score)
+        self.counts[score] += count
+        self.total += count
+        tree = self.tree
+        size = len(tree)
+        i = score + 1
+        while i < size:
+            tree[i] += count
+            i += i & -i
+
+    def at_most(self, score: int) -> int:
+        """
+        Returns the number of scores at or below a score.
+
+        Parameters:
+        - score (int): The score.
+
+        Returns:
+        - int: The number of scores that are not higher than the score.
+        """
+        if score < 0:
+            return 0
+        tree = self.tree
+        i = min(score + 1, len(tree) - 1)
+        result = 0
+        while i > 0:
+            result += tree[i]
+            i -= i & -i
+        return result
+
+    def rank(self, score: int) -> int:
+        """
+        Returns the rank a score would have among all the scores: 1 plus the number of higher scores.
+
+        Parameters:
+        - score (int): The score.
+
+        Returns:
+        - int: The rank, 1 for the best score.
+        """
+        return self.total - self.at_most(score) + 1
+
+    def percentile(self, score: int) -> float:
+        """
+        Returns the percentage of the scores that are below a score.
+
+        Parameters:
+        - score (int): The score.
+
+        Returns:
+        - float: The percentage, from 0 to 100. 100 if there are no scores.
+        """
+        if self.total == 0:
+            return 100.0
+        return 100.0 * self.at_most(score - 1) / self.total
+
+    def score_at(self, percentile: float) -> int:
+        """
+        Returns the lowest score that at least percentile percent of the scores are at or below,
+        by descending the tree from its largest power of two.
+
+        Parameters:
+        - percentile (float): The percentile, from 0 to 100.
+
+        Returns:
+        - int: The score, or None if there are no scores.
+        """
+        if self.total == 0:
+            return None
+        target = max(1, int(-(-percentile * self.total // 100)))
+        tree = self.tree
+        size = len(tree) - 1
+        position = 0
+        step = 1 << (size.bit_length() - 1)
+        while step:
+            next_position = position + step
+            if next_position <= size and tree[next_position] < target:
+                position = next_position
+                target -= tree[next_position]
+            step >>= 1
+        return position
+
+    def items(self):
+        """
+        Yields the (score, count) of every score value that was achieved, lowest first.
+        """
+        for score, count in enumerate(self.counts):
+            if count:
+                yield score, count
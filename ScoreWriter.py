@@ -0,0 +1,74 @@
+import queue
+import threading
+
+class ScoreWriter:
+    """
+    A background thread that writes the high scores, so the Tk thread never waits for the disk.
+
+    The backends submit their writes as jobs. A single thread runs them one after the other in the
+    order they were submitted, so two saves can never write the same file at the same time.
+
+    Attributes:
+    - jobs (queue.Queue): The submitted jobs, as (function, args) pairs, and None to stop the thread.
+    - thread (threading.Thread): The writer thread.
+    - error (Exception): The last error raised by a job, or None.
+
+    Methods:
+    - __init__(): Starts the writer thread.
+    - submit(function, *args): Runs a function on the writer thread.
+    - flush(): Waits until all the submitted jobs have run.
+    - close(): Runs the remaining jobs and stops the writer thread.
+    """
+
+    jobs: queue.Queue
+    thread: threading.Thread
+    error = None
+
+    def __init__(self):
+        """
+        Starts the writer thread.
+        """
+        self.jobs = queue.Queue()
+        self.thread = threading.Thread(target=self.run, name="ScoreWriter", daemon=True)
+        self.thread.start()
+
+    def submit(self, function, *args):
+        """
+        Runs a function on the writer thread, after the jobs submitted before it. Returns immediately.
+
+        Parameters:
+        - function: The function to run.
+        - args: The arguments to call the function with.
+        """
+        self.jobs.put((function, args))
+
+    def flush(self):
+        """
+        Waits until all the submitted jobs have run.
+        """
+        self.jobs.join()
+
+    def close(self):
+        """
+        Runs the remaining jobs and stops the writer thread. Called on exit, so no score is lost.
+        """
+        if self.thread.is_alive():
+            self.jobs.put(None)
+            self.thread.join()
+
+    def run(self):
+        """
+        Runs the submitted jobs until close() is called. An error of a job is kept in error and does
+        not stop the thread, the next save writes the whole state again.
+        """
+        while True:
+            job = self.jobs.get()
+            try:
+                if job is None:
+                    return
+                function, args = job
+                function(*args)
+            except Exception as error:
+                self.error = error
+            finally:
+                self.jobs.task_done()
@@ -0,0 +1,267 @@
+import argparse
+import json
+import platform
+import random
+import statistics
+import time
+
+from benchmarks.Benchmark import build_world
+from engine.GameWorld import GameWorld
+from engine.WorldStore import WorldStore
+
+SIZES = [5, 20, 50, 100, 300]
+TICKS = 10
+REPS = 50
+
+class BaselineItem:
+    """
+    Stands for a game item of the baseline: a plain object with its state in its __dict__ and the items list
+    it appends its bullets to, moved, culled and collided one item at a time by BaselineGame.
+    """
+
+    def __init__(self, items: list, x: float, y: float, lives: int, speed: float = 0):
+        self.x = x
+        self.y = y
+        self.items = items
+        self.lives = lives
+        self.speed = speed
+
+    def is_alive(self) -> bool:
+        return self.lives > 0
+
+    def kill(self):
+        self.lives -= 1
+
+    def move(self):
+        self.y += self.speed
+
+    def center_x(self) -> float:
+        return self.x
+
+    def center_y(self) -> float:
+        return self.y
+
+class BaselineSpaceShip(BaselineItem):
+    width = 50
+    height = 50
+
+    def move(self):
+        pass
+
+    def center_x(self) -> float:
+        return self.x + self.width / 2
+
+    def center_y(self) -> float:
+        return self.y + self.height / 2 - 50
+
+class BaselineAsteroid(BaselineItem):
+    def center_x(self) -> float:
+        return self.x + 20
+
+    def center_y(self) -> float:
+        return self.y + 30
+
+class BaselineBullet(BaselineItem):
+    pass
+
+class BaselineOurBullet(BaselineBullet):
+    pass
+
+class BaselineTheirBullet(BaselineBullet):
+    pass
+
+class BaselineAlien(BaselineItem):
+    direction = 1
+    change_direction_time = 0
+
+    def attack(self, speed: float):
+        self.items.append(BaselineTheirBullet(self.items, self.x + 20 - 3/2, self.y + 40, 1, speed))
+
+    def move(self):
+        if self.x > 600:
+            self.x = 0
+        if self.x < 0:
+            self.x = 600
+        self.x += 1 * self.direction
+
+    def center_x(self) -> float:
+        return self.x + 20
+
+    def center_y(self) -> float:
+        return self.y
+
+BASELINE_CLASSES = {
+    WorldStore.SHIP: BaselineSpaceShip,
+    WorldStore.ALIEN: BaselineAlien,
+    WorldStore.ASTEROID: BaselineAsteroid,
+    WorldStore.OUR_BULLET: BaselineOurBullet,
+    WorldStore.THEIR_BULLET: BaselineTheirBullet,
+}
+
+class BaselineGame:
+    """
+    The update loop of the baseline GameScreen, without Tk: every tick walks the game items list to cull them,
+    checks every pair of items against each other, moves every item and runs the timers of the spawns.
+
+    The timers count ticks instead of reading time.time(), and the aliens keep their direction, so a run
+    only depends on its items and its seed.
+
+    Attributes:
+    - game_items (list): The game items, the spaceship first.
+    - ship (BaselineSpaceShip): The player's spaceship.
+    - config: The GameConfig with the spawn intervals, the alien cap and the speeds.
+    - ticks_per_second (float): The number of ticks in a second of the timers.
+    - tick (int): The number of ticks played.
+    - rng (random.Random): The random number generator of the spawns.
+    - score (int): The player's score.
+    """
+
+    def __init__(self, world: GameWorld):
+        """
+        Copies the items of a world, in the same order, with the same positions, lives and speeds.
+
+        Parameters:
+        - world (GameWorld): The world to copy.
+        """
+        self.game_items = []
+        for item in world.game_items:
+            copy = BASELINE_CLASSES[item.kind](self.game_items, float(item.x), float(item.y), item.lives, float(world.store.speed[item.row]))
+            self.game_items.append(copy)
+        self.ship = self.game_items[0]
+        self.config = world.config
+        self.ticks_per_second = 1 / world.clock.tick_length
+        self.tick = 0
+        self.rng = random.Random(0)
+        self.score = 0
+
+    def due(self, interval: float) -> bool:
+        return self.tick % max(1, round(interval * self.ticks_per_second)) == 0
+
+    def update(self):
+        """
+        Plays one tick the way the baseline GameScreen.update() did.
+        """
+        items = self.game_items
+        for item in items:
+            if not item.is_alive():
+                items.remove(item)
+            elif isinstance(item, BaselineBullet) or isinstance(item, BaselineAsteroid):
+                if item.y < 0 or item.y > 600 or item.x < 0 or item.x > 800:
+                    items.remove(item)
+
+        for i in range(len(items)-1, -1, -1):
+            for j in range(i-1, -1, -1):
+                item1 = items[i]
+                item2 = items[j]
+                if not item1.is_alive() or not item2.is_alive():
+                    continue
+                distance = ((item1.center_x() - item2.center_x())**2 + (item1.center_y() - item2.center_y())**2)**0.5
+                if distance < 20:
+                    if isinstance(item1, BaselineSpaceShip) and (isinstance(item2, BaselineAsteroid) or isinstance(item2, BaselineTheirBullet)) or (isinstance(item1, BaselineAsteroid) or isinstance(item1, BaselineTheirBullet)) and isinstance(item2, BaselineSpaceShip):
+                        item1.kill()
+                        item2.kill()
+                    if isinstance(item1, BaselineOurBullet) and (isinstance(item2, BaselineAsteroid) or isinstance(item2, BaselineAlien)) or (isinstance(item1, BaselineAsteroid) or isinstance(item1, BaselineAlien)) and isinstance(item2, BaselineOurBullet):
+                        item1.kill()
+                        item2.kill()
+                        self.score += 10
+
+        for item in items:
+            if item.is_alive():
+                item.move()
+
+        self.tick += 1
+        config = self.config
+        if self.due(config.volley_interval):
+            for item in items:
+                if item.is_alive() and isinstance(item, BaselineAlien):
+                    item.attack(config.their_bullet_speed)
+        if self.due(config.asteroid_interval):
+            items.append(BaselineAsteroid(items, self.rng.randint(0, 800), 0, 1, config.asteroid_speed))
+        if self.due(config.alien_interval) and len([item for item in items if isinstance(item, BaselineAlien)]) < config.alien_cap:
+            items.append(BaselineAlien(items, self.rng.randint(0, 800), 0, 1))
+
+
+def time_ticks(game, ticks: int, advance) -> list:
+    """
+    Plays ticks and times every one of them.
+
+    Args:
+        game: The BaselineGame or the GameWorld.
+        ticks (int): The number of ticks to play.
+        advance: The function called after every tick, outside of the timing.
+
+    Returns:
+        list: The time of every tick, in seconds.
+    """
+    times = []
+    for _ in range(ticks):
+        start = time.perf_counter()
+        game.update()
+        times.append(time.perf_counter() - start)
+        advance()
+    return times
+
+
+def measure(size: int, ticks: int, reps: int, seed: int) -> dict:
+    """
+    Plays the same worlds with the baseline loop and with GameWorld.update(), and times their ticks.
+
+    Every repetition starts from a freshly built world and only plays a few ticks, so the item count
+    stays close to the size instead of running down as the bullets leave the screen.
+
+    Args:
+        size (int): The number of game items the worlds start with.
+        ticks (int): The number of ticks to play per repetition.
+        reps (int): The number of repetitions.
+        seed (int): The seed of the first world, the others use the next seeds.
+
+    Returns:
+        dict: The mean and median tick time of both, in seconds, and how many times faster GameWorld is.
+    """
+    baseline_times = []
+    world_times = []
+    for rep in range(reps):
+        world = build_world(size, seed + rep)
+        baseline = BaselineGame(world)
+        baseline_times += time_ticks(baseline, ticks, lambda: None)
+        world_times += time_ticks(world, ticks, world.clock.tick)
+    result = {
+        "baseline_mean": statistics.fmean(baseline_times),
+        "baseline_median": statistics.median(baseline_times),
+        "world_mean": statistics.fmean(world_times),
+        "world_median": statistics.median(world_times),
+    }
+    result["speedup"] = result["baseline_median"] / result["world_median"]
+    return result
+
+
+def main():
+    """
+    The main function of the baseline comparison.
+
+    Times the ticks of the update loop of the baseline and of GameWorld on the same worlds, at the item counts
+    of a game and a little above, and prints the results as JSON.
+
+    Run from the root of the repository: python -m benchmarks.Baseline
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Compares the tick time of Space Fighters with its baseline update loop.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="numbers of game items the worlds start with")
+    parser.add_argument("--ticks", type=int, default=TICKS, help="ticks to play per repetition")
+    parser.add_argument("--reps", type=int, default=REPS, help="repetitions per size, each with a fresh world")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the worlds")
+    args = parser.parse_args()
+
+    results = {
+        "meta": {"python": platform.python_version(), "platform": platform.platform(), "ticks": args.ticks, "reps": args.reps, "seed": args.seed},
+        "results": {str(size): measure(size, args.ticks, args.reps, args.seed) for size in args.sizes},
+    }
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+
+from benchmarks.RecordingCanvas import RecordingCanvas, RecordingImage
+from engine.GameWorld import GameWorld
+from engine.QualityGovernor import LOW, HIGH
+from engine.Scene import Scene
+from engine.SimulationClock import SimulationClock
+from engine.SpriteCache import SpriteCache
+from items.Alien import Alien
+from items.Asteroid import Asteroid
+from items.Bullet import OurBullet, TheirBullet
+
+SIZES = [10, 100, 1000, 10000]
+RENDER_PHASES = ("render_create", "render_move", "render_immediate", "render_sprites", "render_sprites_move", "render_low", "render_switch")
+FRAMES = 6
+
+def build_world(size: int, seed: int) -> GameWorld:
+    """
+    Builds a world with the spaceship and size - 1 randomly placed asteroids, aliens and bullets.
+
+    The spaceship cannot die, so every phase does its full work.
+
+    Args:
+        size (int): The number of game items in the world.
+        seed (int): The seed of the world, the same seed builds the same world.
+
+    Returns:
+        GameWorld: The world.
+    """
+    world = GameWorld(SimulationClock(), None, seed=seed)
+    world.ship.lives = 10 ** 9
+    rng = world.rng
+    for _ in range(size - 1):
+        kind = rng.random()
+        x = rng.uniform(0, world.width)
+        y = rng.uniform(0, world.height)
+        if kind < 0.3:
+            item = Asteroid(world.store, x, y, 1)
+        elif kind < 0.4:
+            item = Alien(world.store, x, y, "Alien")
+        elif kind < 0.7:
+            item = OurBullet(world.store, x, y, 3, -5)
+        else:
+            item = TheirBullet(world.store, x, y, 3, 3)
+        world.add(item)
+    return world
+
+
+def measure(size: int, reps: int, seed: int) -> dict:
+    """
+    Times every phase of GameWorld.update() and the render path for a world of the given size.
+
+    Every repetition starts from a freshly built world, so all the repetitions do the same work.
+    The spawn timers are made due, so the spawn phase includes a volley of all the aliens.
+
+    The sprite path, the one the game runs, is timed over FRAMES moving frames at the highest and the lowest
+    level of detail, and for the frame that switches a scene from the highest level to the lowest, with the
+    sprites of both levels already made. The times and the canvas calls of render_sprites_move and render_low
+    are per frame.
+
+    Args:
+        size (int): The number of game items in the world.
+        reps (int): The number of repetitions.
+        seed (int): The seed of the worlds.
+
+    Returns:
+        dict: The minimum and median time of every phase in seconds and the canvas calls of every render phase.
+    """
+    samples = {phase: [] for phase in GameWorld.PHASES + ("publish", "update") + RENDER_PHASES}
+    canvas_calls = {}
+
+    for _ in range(reps):
+        world = build_world(size, seed)
+        world.clock.ticks = 1000
+        for phase in GameWorld.PHASES + ("publish",):
+            start = time.perf_counter()
+            getattr(world, phase)()
+            samples[phase].append(time.perf_counter() - start)
+
+        world = build_world(size, seed)
+        world.clock.ticks = 1000
+        start = time.perf_counter()
+        world.update()
+        samples["update"].append(time.perf_counter() - start)
+
+        canvas = RecordingCanvas()
+        scene = Scene(canvas)
+        start = time.perf_counter()
+        scene.sync(world.snapshot.entities)
+        samples["render_create"].append(time.perf_counter() - start)
+        canvas_calls["render_create"] = canvas.total()
+
+        world.move()
+        world.publish()
+        canvas.reset()
+        start = time.perf_counter()
+        scene.sync(world.snapshot.entities)
+        samples["render_move"].append(time.perf_counter() - start)
+        canvas_calls["render_move"] = canvas.total()
+
+        canvas.reset()
+        start = time.perf_counter()
+        for item in world.game_items:
+            if item.is_alive():
+                item.draw(canvas)
+        samples["render_immediate"].append(time.perf_counter() - start)
+        canvas_calls["render_immediate"] = canvas.total()
+
+        canvas = RecordingCanvas()
+        sprites = SpriteCache(canvas, RecordingImage)
+        for item in world.game_items:
+            sprites.sprite(item)
+            sprites.sprite(item, LOW)
+        scene = Scene(canvas, sprites)
+        start = time.perf_counter()
+        scene.sync(world.snapshot.entities)
+        samples["render_sprites"].append(time.perf_counter() - start)
+        canvas_calls["render_sprites"] = canvas.total()
+
+        low_canvas = RecordingCanvas()
+        low_sprites = SpriteCache(low_canvas, RecordingImage)
+        for item in world.game_items:
+            low_sprites.sprite(item, LOW)
+        low_scene = Scene(low_canvas, low_sprites)
+        low_scene.sync(world.snapshot.entities, LOW, world.width, world.height)
+        elapsed = {"render_sprites_move": 0.0, "render_low": 0.0}
+        calls = {"render_sprites_move": 0, "render_low": 0}
+        for _ in range(FRAMES):
+            world.move()
+            world.publish()
+            for phase, frame_scene, frame_canvas, detail in (("render_sprites_move", scene, canvas, HIGH), ("render_low", low_scene, low_canvas, LOW)):
+                frame_canvas.reset()
+                start = time.perf_counter()
+                frame_scene.sync(world.snapshot.entities, detail, world.width, world.height)
+                elapsed[phase] += time.perf_counter() - start
+                calls[phase] += frame_canvas.total()
+        for phase in elapsed:
+            samples[phase].append(elapsed[phase] / FRAMES)
+            canvas_calls[phase] = calls[phase] / FRAMES
+
+        canvas.reset()
+        start = time.perf_counter()
+        scene.sync(world.snapshot.entities, LOW, world.width, world.height)
+        samples["render_switch"].append(time.perf_counter() - start)
+        canvas_calls["render_switch"] = canvas.total()
+
+    return {
+        "min": {phase: min(values) for phase, values in samples.items()},
+        "median": {phase: statistics.median(values) for phase, values in samples.items()},
+        "canvas_calls": canvas_calls,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Compares the minimum phase times against a saved baseline.
+
+    Args:
+        results (dict): The results of this run.
+        baseline (dict): The results of the baseline run.
+        threshold (float): The allowed slowdown, 0.2 allows 20% more time.
+
+    Returns:
+        list: The (size, phase, baseline time, time) of every regression.
+    """
+    regressions = []
+    for size, result in results["results"].items():
+        base = baseline["results"].get(size)
+        if base is None:
+            continue
+        for phase, value in result["min"].items():
+            before = base["min"].get(phase)
+            if before is None:
+                continue
+            ratio = value / before if before > 0 else 1.0
+            marker = "REGRESSION" if ratio > 1 + threshold else ""
+            print(f"{size:>6} {phase:<17} {before * 1e3:10.3f} ms -> {value * 1e3:10.3f} ms {ratio:6.2f}x {marker}")
+            if marker:
+                regressions.append((size, phase, before, value))
+    return regressions
+
+
+def main():
+    """
+    The main function of the benchmark suite.
+
+    Times the update phases and the render path for worlds of every size, prints the results as JSON
+    or saves them, and optionally compares them against a saved baseline. Exits with status 1 when a
+    phase got slower than the threshold allows, so it can gate merges.
+
+    Run from the root of the repository: python -m benchmarks.Benchmark
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks the update phases and the render path of Space Fighters.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="numbers of game items to benchmark")
+    parser.add_argument("--reps", type=int, default=5, help="repetitions per size")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the benchmark worlds")
+    parser.add_argument("--save", help="file to save the results to")
+    parser.add_argument("--compare", help="file with baseline results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown against the baseline")
+    args = parser.parse_args()
+
+    results = {
+        "meta": {"python": platform.python_version(), "platform": platform.platform(), "reps": args.reps, "seed": args.seed},
+        "results": {str(size): measure(size, args.reps, args.seed) for size in args.sizes},
+    }
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(results, file, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.compare:
+        with open(args.compare, "r") as file:
+            baseline = json.load(file)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+import argparse
+import json
+import platform
+import tracemalloc
+
+from engine.WorldStore import WorldStore
+from items.Alien import Alien
+from items.Asteroid import Asteroid
+from items.Bullet import OurBullet, TheirBullet
+from items.SpaceShip import SpaceShip
+
+COUNT = 100000
+FACTORIES = {
+    "SpaceShip": lambda cls, store: cls(store, 400, 500, 50, 50),
+    "Alien": lambda cls, store: cls(store, 100, 0, "Alien"),
+    "Asteroid": lambda cls, store: cls(store, 100, 0, 1),
+    "OurBullet": lambda cls, store: cls(store, 100, 500, 3, -5),
+    "TheirBullet": lambda cls, store: cls(store, 100, 0, 3, 3),
+}
+CLASSES = {"SpaceShip": SpaceShip, "Alien": Alien, "Asteroid": Asteroid, "OurBullet": OurBullet, "TheirBullet": TheirBullet}
+
+# The instance attributes of every item class in the baseline, in the order the constructors set them.
+# The state of the items lived in their __dict__, with the items list every item referenced, and an alien
+# shadowed the class defaults of direction and change_direction_time at its first change of direction.
+BASELINE_ATTRIBUTES = {
+    "SpaceShip": lambda items: (("x", 400), ("y", 500), ("items", items), ("lives", 3), ("width", 50), ("height", 50)),
+    "Alien": lambda items: (("x", 100), ("y", 0), ("items", items), ("lives", 1), ("name", "Alien"),
+                            ("direction", -1), ("change_direction_time", 1.5)),
+    "Asteroid": lambda items: (("x", 100), ("y", 0), ("items", items), ("lives", 1), ("speed", 1)),
+    "OurBullet": lambda items: (("x", 100), ("y", 500), ("items", items), ("lives", 1), ("radius", 3), ("speed", -5)),
+    "TheirBullet": lambda items: (("x", 100), ("y", 0), ("items", items), ("lives", 1), ("radius", 3), ("speed", 3)),
+}
+
+class BaselineItem:
+    """
+    Stands for an item class of the baseline: a plain class whose instances keep all their state
+    in a __dict__, without __slots__ and without a row in a WorldStore.
+    """
+
+def baseline_bytes_per_item(name: str, count: int) -> float:
+    """
+    Measures the memory taken by the items of a class with the layout of the baseline.
+
+    Every class gets its own subclass of BaselineItem, so its instances share the keys of their
+    __dict__ like the instances of the baseline class did.
+
+    Args:
+        name (str): The name of the item class.
+        count (int): The number of items to create.
+
+    Returns:
+        float: The number of bytes per item.
+    """
+    cls = type(name, (BaselineItem,), {})
+    shared = []
+    attributes = BASELINE_ATTRIBUTES[name](shared)
+    items = [None] * count
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(count):
+        item = cls()
+        for attribute, value in attributes:
+            setattr(item, attribute, value)
+        items[i] = item
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / count
+
+def bytes_per_item(cls: type, factory, count: int) -> float:
+    """
+    Measures the memory taken by the items of a class, without the store that keeps their state.
+
+    The rows of the store are allocated and released before the measurement, so the items reuse them
+    and the store does not grow while tracemalloc is tracing.
+
+    Args:
+        cls (type): The item class.
+        factory: The function that creates an item of the class in a store.
+        count (int): The number of items to create.
+
+    Returns:
+        float: The number of bytes per item.
+    """
+    store = WorldStore()
+    for row in [store.allocate(0, 0, 0, 0, 0) for _ in range(count)]:
+        store.release(row)
+    items = [None] * count
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(count):
+        items[i] = factory(cls, store)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / count
+
+def store_bytes_per_row(count: int) -> float:
+    """
+    Measures the memory the WorldStore takes per item: the columns of a store grown from its default
+    capacity to hold count rows, including the rows reserved by the last doubling.
+
+    Args:
+        count (int): The number of rows to allocate.
+
+    Returns:
+        float: The number of bytes per row.
+    """
+    store = WorldStore()
+    for _ in range(count):
+        store.allocate(0, 0, 0, 0, 0)
+    return sum(getattr(store, column).nbytes for column in WorldStore.COLUMNS) / count
+
+def measure(count: int) -> dict:
+    """
+    Measures the bytes per item of every item class, with the baseline layout and with __slots__ and the WorldStore.
+
+    Args:
+        count (int): The number of items to create per class.
+
+    Returns:
+        dict: By class name, the bytes per item of the baseline, of the slotted item alone, of its row in the store,
+        and of the slotted item with its row.
+    """
+    store_row = store_bytes_per_row(count)
+    results = {}
+    for name, cls in CLASSES.items():
+        slots = bytes_per_item(cls, FACTORIES[name], count)
+        results[name] = {
+            "baseline": baseline_bytes_per_item(name, count),
+            "slots": slots,
+            "store_row": store_row,
+            "slots_with_store": slots + store_row,
+        }
+    return results
+
+def main():
+    """
+    The main function of the memory benchmark.
+
+    Prints the bytes per item of every item class as JSON, with the layout of the baseline and with the slotted
+    items and their rows in the WorldStore.
+
+    Run from the root of the repository: python -m benchmarks.Memory
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Measures the memory per game item of Space Fighters.")
+    parser.add_argument("--count", type=int, default=COUNT, help="number of items to create per class")
+    args = parser.parse_args()
+
+    results = {
+        "meta": {"python": platform.python_version(), "platform": platform.platform(), "count": args.count},
+        "results": measure(args.count),
+    }
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
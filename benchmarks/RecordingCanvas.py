@@ -0,0 +1,118 @@
+from collections import Counter
+from itertools import count
+
+
+class RecordingCanvas:
+    """
+    A stand-in for the Tk canvas that only records the calls made to it.
+
+    It lets the render path run without a display, and the number of calls tells how many
+    Tcl round-trips a frame would cost on a real canvas.
+
+    Attributes:
+    - width (int): The width reported by winfo_width().
+    - height (int): The height reported by winfo_height().
+    - calls (Counter): The number of calls, by method name.
+    - ids (count): The generator of the canvas item ids.
+
+    Methods:
+    - reset(): Forgets the recorded calls.
+    - total(): Returns the total number of recorded calls.
+    """
+
+    def __init__(self, width: int = 800, height: int = 600):
+        """
+        Initializes the RecordingCanvas object.
+
+        Parameters:
+        - width (int): The width reported by winfo_width().
+        - height (int): The height reported by winfo_height().
+        """
+        self.width = width
+        self.height = height
+        self.calls = Counter()
+        self.ids = count(1)
+
+    def reset(self):
+        """
+        Forgets the recorded calls.
+        """
+        self.calls.clear()
+
+    def total(self) -> int:
+        """
+        Returns the total number of recorded calls.
+
+        Returns:
+        - int: The number of calls.
+        """
+        return sum(self.calls.values())
+
+    def winfo_width(self) -> int:
+        return self.width
+
+    def winfo_height(self) -> int:
+        return self.height
+
+    def _create(self, name: str) -> int:
+        self.calls[name] += 1
+        return next(self.ids)
+
+    def create_oval(self, *args, **kwargs) -> int:
+        return self._create("create_oval")
+
+    def create_polygon(self, *args, **kwargs) -> int:
+        return self._create("create_polygon")
+
+    def create_rectangle(self, *args, **kwargs) -> int:
+        return self._create("create_rectangle")
+
+    def create_line(self, *args, **kwargs) -> int:
+        return self._create("create_line")
+
+    def create_text(self, *args, **kwargs) -> int:
+        return self._create("create_text")
+
+    def create_image(self, *args, **kwargs) -> int:
+        return self._create("create_image")
+
+    def move(self, *args):
+        self.calls["move"] += 1
+
+    def coords(self, *args):
+        self.calls["coords"] += 1
+
+    def itemconfigure(self, *args, **kwargs):
+        self.calls["itemconfigure"] += 1
+
+    itemconfig = itemconfigure
+
+    def delete(self, *args):
+        self.calls["delete"] += 1
+
+
+class RecordingImage:
+    """
+    A stand-in for the Tk PhotoImage that only records the calls made to it, for the SpriteCache.
+
+    Attributes:
+    - width (int): The width of the image.
+    - height (int): The height of the image.
+    - puts (int): The number of put() calls.
+    """
+
+    def __init__(self, master=None, width: int = 0, height: int = 0):
+        """
+        Initializes the RecordingImage object.
+
+        Parameters:
+        - master: The canvas the image is made for.
+        - width (int): The width of the image.
+        - height (int): The height of the image.
+        """
+        self.width = width
+        self.height = height
+        self.puts = 0
+
+    def put(self, data, to=None):
+        self.puts += 1
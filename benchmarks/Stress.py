@@ -0,0 +1,80 @@
+import argparse
+
+from benchmarks.RecordingCanvas import RecordingCanvas, RecordingImage
+from engine.Scene import Scene
+from engine.SimulationClock import SimulationClock
+from engine.SpriteCache import SpriteCache
+from engine.StressTest import StressTest
+from screens.StressScreen import StressScreen
+
+def run(plateau_length: float, target: int, max_levels: int, tick_length: float, fps: float, seed: int, report_path: str) -> StressScreen:
+    """
+    Runs the stress test without Tk, as fast as the CPU allows.
+
+    The test runs in a StressScreen on a RecordingCanvas, with the sprites of the game, so the tick times and
+    the draw times are measured by the same code as in the game, and the reports of both can be compared.
+    The draw times are the Python side of the render path, without the drawing done by Tk. The frames are
+    drawn at the given frame rate of simulation time.
+
+    Args:
+        plateau_length (float): The simulation time every level is held, in seconds.
+        target (int): The entity count that ends the test.
+        max_levels (int): The number of levels after which the test ends anyway.
+        tick_length (float): The length of one simulation tick, in seconds.
+        fps (float): The number of frames per second of simulation time.
+        seed (int): The seed of the world.
+        report_path (str): The path of the JSON report.
+
+    Returns:
+        StressScreen: The screen of the finished test, with its results and its report written.
+    """
+    clock = SimulationClock(tick_length)
+    canvas = RecordingCanvas()
+    screen = StressScreen(canvas, None, clock, None, report_path, seed)
+    screen.stress = StressTest(screen.world, plateau_length, target, max_levels)
+    screen.scene = Scene(canvas, SpriteCache(canvas, RecordingImage))
+    next_frame = 0.0
+
+    while not screen.stress.finished:
+        screen.update()
+        clock.tick()
+        if clock.time >= next_frame:
+            next_frame += 1 / fps
+            screen.draw()
+            canvas.reset()
+    screen.finish()
+    return screen
+
+
+def main():
+    """
+    The main function of the headless stress test.
+
+    Ramps up the spawn rates until the target entity count is reached, prints the tick and draw times of
+    every plateau and writes them as a JSON report, to compare the capacity of the game between releases.
+
+    Run from the root of the repository: python -m benchmarks.Stress
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Runs the Space Fighters stress test without a display.")
+    parser.add_argument("--plateau", type=float, default=StressTest.plateau_length, help="simulation seconds every level is held")
+    parser.add_argument("--target", type=int, default=StressTest.target, help="entity count that ends the test")
+    parser.add_argument("--levels", type=int, default=StressTest.max_levels, help="number of levels after which the test ends anyway")
+    parser.add_argument("--tick-length", type=float, default=SimulationClock.BASE_TICK_LENGTH, help="length of one simulation tick in seconds")
+    parser.add_argument("--fps", type=float, default=60.0, help="frames per second of simulation time")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the world")
+    parser.add_argument("--report", default="stress-report.json", help="path of the JSON report")
+    args = parser.parse_args()
+
+    screen = run(args.plateau, args.target, args.levels, args.tick_length, args.fps, args.seed, args.report)
+    print(screen.summary)
+    print(f"peak entities: {screen.stress.report()['peak_entities']}")
+    print(f"report written to {args.report}")
+
+if __name__ == "__main__":
+    main()
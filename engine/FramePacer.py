@@ -0,0 +1,124 @@
+import math
+from collections import deque
+
+
+class FramePacer:
+    """
+    Paces the frames of the Tk thread on a fixed cadence of deadlines, instead of a fixed delay after each frame.
+
+    Every frame is due interval seconds after the previous deadline, not after the previous frame ended, so a
+    slow frame does not push all the following ones back. When the Tk thread falls more than a whole interval
+    behind, the frames it missed are dropped rather than drawn back to back, and the next frame is due on the
+    cadence again. The next frame is always scheduled at least a millisecond ahead, so Tk handles the pending
+    input events between two frames even under overload.
+
+    The pacer keeps the start times of the last frames, to report the jitter of the frame intervals and how
+    late the frames started compared with their deadlines.
+
+    Attributes:
+    - target_fps (float): The number of frames per second to aim for.
+    - interval (float): The time between two frame deadlines, in seconds.
+    - deadline (float): The deadline of the next frame, in seconds of time.perf_counter(), None before the first frame.
+    - last_start (float): The start of the last frame, None before the first frame.
+    - frames (int): The number of frames drawn.
+    - skipped (int): The number of frames not drawn because nothing had changed.
+    - dropped (int): The number of frames dropped because the Tk thread was late.
+    - intervals (deque): The time between the starts of the last frames, in seconds.
+    - lateness (deque): How late the last frames started after their deadlines, in seconds.
+
+    Methods:
+    - __init__(target_fps, window): Initializes the pacer.
+    - begin(now): Records the start of a frame.
+    - skip(): Counts a frame that was not drawn.
+    - next_delay(now) -> int: Returns the delay until the deadline of the next frame, dropping the missed ones.
+    - stats() -> dict: Returns the frame rate, the jitter and the lateness of the last frames.
+    """
+
+    target_fps = 60.0
+    interval = 1 / 60
+    deadline = None
+    last_start = None
+    frames = 0
+    skipped = 0
+    dropped = 0
+
+    def __init__(self, target_fps: float = 60.0, window: int = 240):
+        """
+        Initializes the pacer.
+
+        Parameters:
+        - target_fps (float): The number of frames per second to aim for.
+        - window (int): The number of frames the statistics are computed over.
+        """
+        self.target_fps = target_fps
+        self.interval = 1 / target_fps
+        self.intervals = deque(maxlen=window)
+        self.lateness = deque(maxlen=window)
+
+    def begin(self, now: float):
+        """
+        Records the start of a frame, drawn or skipped.
+
+        Parameters:
+        - now (float): The current time, in seconds of time.perf_counter().
+        """
+        if self.deadline is None:
+            self.deadline = now
+        else:
+            self.lateness.append(max(0.0, now - self.deadline))
+        if self.last_start is not None:
+            self.intervals.append(now - self.last_start)
+        self.last_start = now
+        self.frames += 1
+
+    def skip(self):
+        """
+        Counts a frame that was not drawn, because the simulation had not advanced since the last one.
+        """
+        self.skipped += 1
+
+    def next_delay(self, now: float) -> int:
+        """
+        Moves the deadline to the next frame and returns the delay until it. If the next deadline has
+        already passed, the frames whose deadlines were missed are dropped.
+
+        Parameters:
+        - now (float): The current time, after the frame was drawn, in seconds of time.perf_counter().
+
+        Returns:
+        - int: The delay to give to after(), in milliseconds, at least 1.
+        """
+        self.deadline += self.interval
+        if now > self.deadline:
+            missed = math.ceil((now - self.deadline) / self.interval)
+            self.dropped += missed
+            self.deadline += missed * self.interval
+        return max(1, round((self.deadline - now) * 1000))
+
+    def stats(self) -> dict:
+        """
+        Returns the frame rate, the jitter and the lateness of the last frames.
+
+        Returns:
+        - dict: The fps, the mean frame interval and its standard deviation (the jitter), the 50th, 95th and 99th
+          percentile of the lateness, all in seconds, and the numbers of drawn, skipped and dropped frames.
+        """
+        intervals = list(self.intervals)
+        lateness = sorted(self.lateness)
+        mean = sum(intervals) / len(intervals) if intervals else 0.0
+        jitter = math.sqrt(sum((value - mean) ** 2 for value in intervals) / len(intervals)) if intervals else 0.0
+
+        def percentile(fraction):
+            return lateness[min(len(lateness) - 1, int(fraction * len(lateness)))] if lateness else 0.0
+
+        return {
+            "fps": 1 / mean if mean > 0 else 0.0,
+            "interval_mean": mean,
+            "jitter": jitter,
+            "late_p50": percentile(0.50),
+            "late_p95": percentile(0.95),
+            "late_p99": percentile(0.99),
+            "frames": self.frames - self.skipped,
+            "skipped": self.skipped,
+            "dropped": self.dropped,
+        }
@@ -0,0 +1,88 @@
+class FrameState:
+    """
+    An immutable snapshot of everything the renderer needs from one simulation tick.
+
+    The simulation thread builds a new FrameState at the end of every tick and publishes it by
+    replacing a single reference, which is atomic. The renderer reads that reference once per frame
+    and then only works with the snapshot, so it never sees a half-updated world and never has to
+    take a lock, while the simulation is free to change the game items for the next tick.
+
+    A FrameState must not be modified after it is published.
+
+    The snapshot also holds where every entity was at the start of the tick, so the renderer can draw
+    the entities between their previous and current positions while the next tick is not there yet.
+    An entity that moved further than max_step in the tick jumped, like an alien that wraps around the
+    screen, and is drawn at its current position instead of sliding across everything in between.
+
+    Attributes:
+    - tick (int): The simulation tick the snapshot was taken at.
+    - entities (tuple): An (item, x, y) triple for every game item that is alive.
+    - previous (tuple): The (x, y) of every entity at the start of the tick, in the order of entities.
+    - score (int): The player's score.
+    - lives (int): The lives of the player's spaceship.
+    - max_step (float): The longest distance an entity can move along one axis in a tick.
+    - published (float): The time the snapshot was published, in seconds of time.perf_counter().
+
+    Methods:
+    - __init__(tick, entities, score, lives, previous, published, max_step): Initializes the snapshot.
+    - interpolate(alpha): Returns the entities between their previous and current positions.
+    - is_over(): Checks if the game was over when the snapshot was taken.
+    """
+
+    __slots__ = ("tick", "entities", "previous", "score", "lives", "published", "max_step")
+
+    tick: int
+    entities: tuple
+    previous: tuple
+    score: int
+    lives: int
+    published: float
+    max_step: float
+
+    def __init__(self, tick: int, entities: tuple, score: int, lives: int, previous: tuple = None, published: float = 0.0,
+                 max_step: float = float("inf")):
+        """
+        Initializes the snapshot.
+
+        Parameters:
+        - tick (int): The simulation tick the snapshot was taken at.
+        - entities (tuple): An (item, x, y) triple for every game item that is alive.
+        - score (int): The player's score.
+        - lives (int): The lives of the player's spaceship.
+        - previous (tuple): The (x, y) of every entity at the start of the tick, None if they did not move.
+        - published (float): The time the snapshot was published, in seconds of time.perf_counter().
+        - max_step (float): The longest distance an entity can move along one axis in a tick, infinite by default.
+        """
+        self.tick = tick
+        self.entities = entities
+        self.previous = previous
+        self.score = score
+        self.lives = lives
+        self.published = published
+        self.max_step = max_step
+
+    def interpolate(self, alpha: float):
+        """
+        Returns the entities between their previous and current positions. The entities that moved further
+        than max_step along an axis jumped, and are returned at their current positions.
+
+        Parameters:
+        - alpha (float): The progress from the previous positions (0) to the current ones (1).
+
+        Returns:
+        - An (item, x, y) triple for every entity, the entities themselves when alpha is 1 or more.
+        """
+        if alpha >= 1 or self.previous is None:
+            return self.entities
+        step = self.max_step
+        return [(item, x, y) if abs(x - px) > step or abs(y - py) > step else (item, px + (x - px) * alpha, py + (y - py) * alpha)
+                for (item, x, y), (px, py) in zip(self.entities, self.previous)]
+
+    def is_over(self) -> bool:
+        """
+        Checks if the game was over when the snapshot was taken.
+
+        Returns:
+        - bool: True if the player's spaceship had no lives left.
+        """
+        return self.lives <= 0
@@ -0,0 +1,65 @@
+class GameConfig:
+    """
+    The tunable parameters of the game rules.
+
+    The class attributes hold the default values used by the normal game. An instance can
+    override any of them, which is how the batch runner sweeps over different settings.
+
+    Attributes:
+    - volley_interval (float): The simulation time between two volleys of the aliens, in seconds.
+    - asteroid_interval (float): The simulation time between two asteroids, in seconds.
+    - alien_interval (float): The simulation time between two aliens, in seconds.
+    - alien_cap (int): The maximum number of aliens in the game at the same time.
+    - direction_change_interval (float): The simulation time between two direction changes of an alien, in seconds.
+    - our_bullet_speed (float): The vertical speed of the player's bullets, in pixels per base tick.
+    - their_bullet_speed (float): The vertical speed of the aliens' bullets, in pixels per base tick.
+    - asteroid_speed (float): The vertical speed of the asteroids, in pixels per base tick.
+
+    Methods:
+    - __init__(**settings): Initializes the configuration, overriding the given defaults.
+    - names(): Returns the names of all the parameters.
+    - as_dict(): Returns all the parameters as a dictionary.
+    """
+
+    volley_interval = 1
+    asteroid_interval = 3
+    alien_interval = 5
+    alien_cap = 5
+    direction_change_interval = 3
+    our_bullet_speed = -5
+    their_bullet_speed = 3
+    asteroid_speed = 1
+
+    def __init__(self, **settings):
+        """
+        Initializes the configuration, overriding the given defaults.
+
+        Parameters:
+        - settings: The parameters to override, by name.
+
+        Raises:
+        - ValueError: If a setting is not a known parameter.
+        """
+        for name, value in settings.items():
+            if name not in self.names():
+                raise ValueError(f"Unknown game parameter: {name}")
+            setattr(self, name, value)
+
+    @classmethod
+    def names(cls) -> list:
+        """
+        Returns the names of all the parameters.
+
+        Returns:
+        - list: The names of the parameters.
+        """
+        return [name for name, value in vars(cls).items() if not name.startswith("_") and isinstance(value, (int, float))]
+
+    def as_dict(self) -> dict:
+        """
+        Returns all the parameters as a dictionary.
+
+        Returns:
+        - dict: The values of the parameters, by name.
+        """
+        return {name: getattr(self, name) for name in self.names()}
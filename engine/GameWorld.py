@@ -0,0 +1,777 @@
+import random
+import time
+from functools import partial
+from itertools import chain, compress
+import numpy as np
+from engine.FrameState import FrameState
+from engine.GameConfig import GameConfig
+from engine.InputSource import UP, DOWN, LEFT, RIGHT, FIRE
+from engine.ItemPool import ItemPool
+from engine.Profiler import Profiler
+from engine.RingBuffer import RingBuffer
+from engine.Scheduler import Scheduler
+from engine.SimulationClock import SimulationClock
+from engine.SpatialHash import SpatialHash
+from engine.WorldStore import WorldStore
+from items.Alien import Alien
+from items.Asteroid import Asteroid
+from items.Bullet import OurBullet, TheirBullet
+from items.SpaceShip import SpaceShip
+
+class GameWorld:
+    """
+    Represents the state and the rules of a single game, independent of Tk.
+
+    The world knows nothing about the canvas or the keyboard: the viewport is a virtual size,
+    the input comes from the pressed flags (set from the InputQueue of the GameScreen or by an InputSource)
+    and the game over is reported through a callback. This lets the same rules run in the GameScreen
+    and headless, as fast as the CPU allows.
+
+    Attributes:
+    - PHASES: The names of the methods update() runs, in order.
+    - SHIP_SPEED: The distance the spaceship moves along each axis in a tick of the base length.
+    - width: The width of the viewport. Asteroids and aliens spawn across it and items that leave it are culled.
+    - requested_width: The width asked for by resize(), applied at the start of the next tick, or None.
+    - height: The height of the viewport.
+    - clock: The simulation clock that drives the game. All the timers use its simulation time.
+    - created_ticks: The clock ticks when the world was created, the time its first timers were scheduled from.
+    - config: The GameConfig with the spawn intervals, the alien cap and the speeds.
+    - rng: The random number generator of the world. Every world has its own, so games with the same seed play out the same.
+    - profiler: The Profiler that records the time of every phase while it is enabled, or None.
+    - game_items: A list of all the game items (spaceship, aliens, asteroids, bullets), built from the containers below.
+      It is only used by the simulation thread, the renderer reads snapshot instead.
+    - aliens: The list of the aliens.
+    - asteroids: The RingBuffer of the asteroids, in spawn order.
+    - our_bullets: The RingBuffer of the player's bullets, in spawn order.
+    - their_bullets: The RingBuffer of the aliens' bullets, in spawn order.
+    - pools: The ItemPool of the asteroids and of both kinds of bullets, by kind.
+    - fire_requests: The number of times the player asked to fire, counted by fire().
+    - fire_handled: The value of fire_requests when the input was last latched.
+    - keys: The key-state bitmask latched at the start of the current tick, the input the tick is played with.
+    - input_queue: The InputQueue the key events of the Tk thread come through, drained at the start of every tick, or None.
+    - snapshot: The FrameState published at the end of the last tick.
+    - store: The WorldStore that keeps the state of the game items.
+    - ship: The player's spaceship object.
+    - scheduler: The Scheduler that runs the volleys, the spawns and the direction changes of the aliens when they are due.
+    - alien_timers: Maps an alien to its scheduled direction change, to cancel it when the alien leaves the game.
+    - ITEM_CLASSES: The item classes by kind, used to build the collision tables.
+    - collision_distance: The largest distance between the centers of two items that collide, the cell size of the collision grids.
+    - collision_pairs: The (kind, kind) pairs of kinds that collide, every pair once.
+    - DIRECT_PAIRS: Up to this many pairs of items, a pair of kinds is checked pair by pair instead of through its grid.
+    - SCALAR_ITEMS: Up to this many game items, culling, collisions and publishing use plain Python instead of NumPy arrays,
+      whose fixed cost per call is more than the work itself in a world this small.
+    - collision_grids: The spatial hash of every kind that is in a collision pair, by kind, used to find the items that may collide.
+    - collision_layers: The collision layer of every kind, by kind.
+    - collision_masks: The collision mask of every kind, by kind.
+    - collision_reach: The squared sum of the collision radii of every pair of kinds, by kind and kind.
+    - collision_handlers: Maps a (kind, kind) pair that interacts to the method that applies the outcome of its collision.
+    - up_pressed: A boolean indicating if the up arrow key is pressed.
+    - down_pressed: A boolean indicating if the down arrow key is pressed.
+    - left_pressed: A boolean indicating if the left arrow key is pressed.
+    - right_pressed: A boolean indicating if the right arrow key is pressed.
+    - score: The player's score.
+    - kills: The number of asteroids and aliens shot down by the player.
+    - game_over: A callback function to be called with the score when the game is over.
+
+    Methods:
+    - __init__(self, clock, game_over, width, height, config, seed, profiler): Initializes the GameWorld object.
+    - update(self): Updates the game state for one simulation tick, running all the PHASES.
+    - steer(self): Moves the spaceship according to the pressed arrow keys.
+    - item_rows(self): Returns the rows of the game items in the store.
+    - cull(self): Deletes the game items that are not alive or left the viewport.
+    - collide(self): Checks for collisions between game items.
+    - time_of_impact(px, py, dy, reach): Returns when a moving circle first touches another one during a tick.
+    - times_of_impact(px, py, dy, reach): Returns when many pairs of moving circles first touch during a tick.
+    - collide_few(self, items): Checks for collisions between the game items of a world with few items.
+    - apply_hits(self, items, firsts, seconds): Applies the outcome of the collisions in order.
+    - check_pairs(self, seekers, targets, reach, same_kind): Checks the pairs of two small kinds one by one.
+    - damage_ship(self, item1, item2): Applies a collision between the spaceship and an asteroid or an aliens' bullet.
+    - shoot_down(self, item1, item2): Applies a collision between a player's bullet and an asteroid or an alien.
+    - move(self): Moves the game items.
+    - spawn(self): Runs the scheduled events that are due.
+    - volley(self): Lets the aliens fire a bullet each.
+    - spawn_asteroid(self): Creates a new asteroid.
+    - spawn_alien(self): Creates a new alien, unless the alien cap is reached.
+    - change_direction(self, alien): Picks a new direction for an alien.
+    - latch_input(self): Drains the input queue, then latches the pressed flags, the fire requests and the requested width for the tick.
+    - apply_input(self, keys): Sets the pressed flags from a key-state bitmask and fires if requested.
+    - resize(self, width): Asks to change the width of the viewport from the next tick.
+    - item_count(self): Returns the number of game items.
+    - new_bullet(self, cls, x, y, speed): Creates a new bullet for the pool of its class.
+    - fire(self): Asks to fire a bullet from the spaceship in the next tick.
+    - add(self, item): Adds a game item to the container of its kind.
+    - expire(self, container, keep): Removes the expired items from the head of a ring buffer.
+    - allocation_stats(self): Returns the counters of the item pools.
+    - is_over(self): Checks if the game is over.
+    - publish(self): Publishes a FrameState of the current tick for the renderer.
+    """
+
+    PHASES = ("steer", "cull", "collide", "move", "spawn")
+    DIRECT_PAIRS = 256
+    SCALAR_ITEMS = 64
+    SHIP_SPEED = 2
+    ITEM_CLASSES = (SpaceShip, Alien, Asteroid, OurBullet, TheirBullet)
+
+    width: int
+    height: int
+    clock: SimulationClock
+    created_ticks = 0
+    config: GameConfig
+    rng: random.Random
+    profiler: Profiler = None
+    aliens: list
+    asteroids: RingBuffer
+    our_bullets: RingBuffer
+    their_bullets: RingBuffer
+    pools: dict
+    fire_requests = 0
+    fire_handled = 0
+    keys = 0
+    input_queue = None
+    requested_width = None
+    snapshot: FrameState
+    store: WorldStore
+    ship: SpaceShip
+    scheduler: Scheduler
+    alien_timers: dict
+    collision_distance: float
+    collision_pairs: list
+    collision_grids: dict
+    collision_layers: list
+    collision_masks: list
+    collision_reach: list
+    collision_handlers: dict
+
+    up_pressed = False
+    down_pressed = False
+    left_pressed = False
+    right_pressed = False
+
+    score = 0
+    kills = 0
+    game_over = None
+
+    def __init__(self, clock: SimulationClock, game_over=None, width: int = 800, height: int = 600, config: GameConfig = None, seed=None, profiler: Profiler = None):
+        """
+        Initializes the GameWorld object with the spaceship as the only game item.
+
+        Parameters:
+        - clock: The simulation clock that drives the game.
+        - game_over: A callback function to be called with the score when the game is over.
+        - width: The width of the viewport.
+        - height: The height of the viewport.
+        - config: The GameConfig to play with, the defaults if None.
+        - seed: The seed of the random number generator of the world, None to seed it from the system.
+        - profiler: The Profiler to record the phases into, or None.
+        """
+        self.clock = clock
+        self.config = config if config is not None else GameConfig()
+        self.rng = random.Random(seed)
+        self.profiler = profiler
+        self.game_over = game_over
+        self.width = width
+        self.height = height
+        self.store = WorldStore()
+        self.aliens = []
+        self.asteroids = RingBuffer()
+        self.our_bullets = RingBuffer()
+        self.their_bullets = RingBuffer()
+        self.pools = {
+            WorldStore.ASTEROID: ItemPool(partial(Asteroid, self.store)),
+            WorldStore.OUR_BULLET: ItemPool(partial(self.new_bullet, OurBullet)),
+            WorldStore.THEIR_BULLET: ItemPool(partial(self.new_bullet, TheirBullet)),
+        }
+        self.score = 0
+        self.kills = 0
+        self.collision_layers = [cls.layer for cls in self.ITEM_CLASSES]
+        self.collision_masks = [cls.mask for cls in self.ITEM_CLASSES]
+        self.collision_reach = [[(cls1.collision_radius + cls2.collision_radius) ** 2 for cls2 in self.ITEM_CLASSES] for cls1 in self.ITEM_CLASSES]
+        self.collision_handlers = {}
+        for ship_hit in (WorldStore.ASTEROID, WorldStore.THEIR_BULLET):
+            self.collision_handlers[WorldStore.SHIP, ship_hit] = self.damage_ship
+            self.collision_handlers[ship_hit, WorldStore.SHIP] = self.damage_ship
+        for target in (WorldStore.ASTEROID, WorldStore.ALIEN):
+            self.collision_handlers[WorldStore.OUR_BULLET, target] = self.shoot_down
+            self.collision_handlers[target, WorldStore.OUR_BULLET] = self.shoot_down
+        layers = self.collision_layers
+        masks = self.collision_masks
+        self.collision_pairs = [(kind1, kind2) for kind1 in range(len(layers)) for kind2 in range(kind1, len(layers))
+                                if masks[kind1] & layers[kind2] or masks[kind2] & layers[kind1]]
+        self.collision_distance = max(self.ITEM_CLASSES[kind1].collision_radius + self.ITEM_CLASSES[kind2].collision_radius
+                                      for kind1, kind2 in self.collision_pairs)
+        self.collision_grids = {kind: SpatialHash(self.collision_distance) for kind in set(chain.from_iterable(self.collision_pairs))}
+
+        self.ship = SpaceShip(self.store, 400, 500, 50, 50)
+
+        self.created_ticks = clock.ticks
+        now = self.created_ticks * clock.tick_length
+        self.alien_timers = {}
+        self.scheduler = Scheduler()
+        self.scheduler.schedule(now + self.config.volley_interval, self.volley)
+        self.scheduler.schedule(now + self.config.asteroid_interval, self.spawn_asteroid)
+        self.scheduler.schedule(now + self.config.alien_interval, self.spawn_alien)
+        self.publish()
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the state of the world for pickle, used for the keyframes of a replay. The game over callback,
+        the profiler and the input queue belong to the screen that runs the world, they are not part of its state.
+        """
+        state = self.__dict__.copy()
+        state.pop("game_over", None)
+        state.pop("profiler", None)
+        state.pop("input_queue", None)
+        return state
+
+    def new_bullet(self, cls: type, x: float, y: float, speed: float):
+        """
+        Creates a new bullet for the pool of its class.
+
+        Parameters:
+        - cls: OurBullet or TheirBullet.
+        - x: The x-coordinate of the bullet.
+        - y: The y-coordinate of the bullet.
+        - speed: The vertical speed of the bullet.
+        """
+        return cls(self.store, x, y, 3, speed)
+
+    @property
+    def game_items(self) -> list:
+        """
+        Returns a list of all the game items: the spaceship, the aliens, the asteroids and the bullets.
+        """
+        return list(chain((self.ship,), self.aliens, self.asteroids.items(), self.our_bullets.items(), self.their_bullets.items()))
+
+    def item_count(self) -> int:
+        """
+        Returns the number of game items, without building the list of game_items.
+        """
+        return 1 + len(self.aliens) + len(self.asteroids) + len(self.our_bullets) + len(self.their_bullets)
+
+    def update(self):
+        """
+        Updates the game state for one simulation tick.
+
+        The tick runs the phases in the order of PHASES: the spaceship is steered by the pressed arrow keys,
+        the game items that are not alive or left the viewport are deleted, the collisions between game items
+        are checked, the game items are moved and new game items are created.
+
+        The method also checks if the player's spaceship is alive and if not, calls the game over callback function.
+        The positions of the game items at the start of the tick are kept, and at the end of the tick
+        a new snapshot with both positions is published for the renderer.
+
+        While the profiler is enabled, every phase and the number of game items are recorded.
+        """
+        if not self.ship.is_alive():
+            return
+
+        self.latch_input()
+        self.store.remember()
+        profiler = self.profiler
+        if profiler is not None and profiler.enabled:
+            for phase in self.PHASES:
+                start = time.perf_counter()
+                getattr(self, phase)()
+                profiler.record(phase, start)
+            start = time.perf_counter()
+            self.publish()
+            profiler.record("publish", start)
+            profiler.counter("items", self.item_count())
+            return
+
+        self.steer()
+        self.cull()
+        self.collide()
+        self.move()
+        self.spawn()
+        self.publish()
+
+    def steer(self):
+        """
+        Moves the spaceship according to the latched keys and fires the requested bullet.
+        """
+        scale = self.clock.scale
+        x_speed = self.SHIP_SPEED * scale
+        y_speed = self.SHIP_SPEED * scale
+        keys = self.keys
+
+        if keys & UP:
+            self.ship.y -= y_speed
+        if keys & DOWN:
+            self.ship.y += y_speed
+        if keys & LEFT:
+            self.ship.x -= x_speed
+        if keys & RIGHT:
+            self.ship.x += x_speed
+
+        if keys & FIRE:
+            if self.ship.is_alive():
+                self.our_bullets.push(self.ship.attack(self.pools[WorldStore.OUR_BULLET], self.config.our_bullet_speed))
+
+    def item_rows(self, items: list) -> np.ndarray:
+        """
+        Returns the rows of the given game items in the store, in the same order.
+
+        Parameters:
+        - items: The game items.
+
+        Returns:
+        - The rows of the game items.
+        """
+        return np.fromiter((item.row for item in items), dtype=np.int64, count=len(items))
+
+    def cull(self):
+        """
+        Deletes the game items that are not alive and the asteroids and bullets that left the viewport.
+
+        Asteroids and bullets that left the viewport are killed in one vectorized step. The expired items
+        at the head of the ring buffers are then removed and go back to their pools, the ones that expired
+        out of order follow once they reach the head.
+        """
+        store = self.store
+        keep = store.keep_mask(self.width, self.height)
+        store.lives[:store.count][~keep] = 0
+
+        self.expire(self.asteroids, keep)
+        self.expire(self.our_bullets, keep)
+        self.expire(self.their_bullets, keep)
+
+        aliens = []
+        for alien in self.aliens:
+            if keep[alien.row]:
+                aliens.append(alien)
+            else:
+                store.release(alien.row)
+                self.scheduler.cancel(self.alien_timers.pop(alien))
+        self.aliens = aliens
+
+    def expire(self, container: RingBuffer, keep: np.ndarray):
+        """
+        Removes the expired items from the head of a ring buffer and returns them to their pool.
+
+        Parameters:
+        - container: The ring buffer of the asteroids or of one kind of bullets.
+        - keep: The mask of the store rows that stay in the game, from WorldStore.keep_mask().
+        """
+        while len(container) and not keep[container.peek().row]:
+            item = container.pop()
+            self.store.release(item.row)
+            self.pools[item.kind].release(item)
+
+    def collide(self):
+        """
+        Checks for collisions between game items and applies their outcome through collision_handlers.
+
+        Pairs of kinds that are not in each other's collision masks, like two asteroids or an alien and an
+        aliens' bullet, are never looked at. Every pair of kinds that collide is checked from one side only,
+        from the kind with fewer items alive: its items look up the items of the other kind in the collision
+        grid of that kind. So the few bullets of the player look for the many asteroids and aliens, and the
+        spaceship for the asteroids and the aliens' bullets, and no grid holds items that cannot be hit.
+
+        The pairs are swept: the collision is checked along the whole vertical path the store moves them in
+        this tick, not only at their current positions, so fast bullets and long ticks cannot tunnel through
+        their targets. The cells are only as large as the collision distance; instead, every item looks
+        further up and down by its own step and by the longest step of the kind it looks for.
+        All the pairs a grid returns are checked at once, see times_of_impact(). A pair of kinds with at most
+        DIRECT_PAIRS pairs of items, like the spaceship and a few asteroids, is checked pair by pair instead,
+        and so is every pair of kinds of a world with at most SCALAR_ITEMS items, see collide_few().
+
+        The hits are then applied in the order of their time of impact, so a bullet that passes through two
+        targets only hits the first one. Hits at the same time are applied in a fixed order, by item index.
+        """
+        items = self.game_items
+        if len(items) <= self.SCALAR_ITEMS:
+            self.collide_few(items)
+            return
+
+        store = self.store
+        rows = self.item_rows(items)
+        kinds = store.kind[rows]
+        alive = store.lives[rows] > 0
+        steps = (store.speed[rows] * self.clock.scale).astype(np.float64)
+        centers_x, centers_y = store.centers(rows)
+
+        members = {}
+        longest_steps = {}
+        for kind in self.collision_grids:
+            members[kind] = np.flatnonzero(alive & (kinds == kind))
+            longest_steps[kind] = float(np.abs(steps[members[kind]]).max(initial=0.0))
+
+        def entries(indices):
+            return list(zip(indices.tolist(), centers_x[indices].tolist(), centers_y[indices].tolist(), steps[indices].tolist()))
+
+        radii = [cls.collision_radius for cls in self.ITEM_CLASSES]
+        filled = set()
+        found = []
+        for kind1, kind2 in self.collision_pairs:
+            seekers = members[kind1]
+            targets = members[kind2]
+            if not len(seekers) or not len(targets):
+                continue
+            if len(targets) < len(seekers):
+                kind1, kind2, seekers, targets = kind2, kind1, targets, seekers
+            reach = self.collision_reach[kind1][kind2]
+            if len(seekers) * len(targets) <= self.DIRECT_PAIRS:
+                hits = self.check_pairs(entries(seekers), entries(targets), reach, kind1 == kind2)
+                if hits:
+                    found.append(tuple(np.array(column) for column in zip(*hits)))
+                continue
+            grid = self.collision_grids[kind2]
+            if kind2 not in filled:
+                grid.rebuild(centers_x, centers_y, targets)
+                filled.add(kind2)
+            distance = radii[kind1] + radii[kind2]
+            positions, j = grid.query(centers_x[seekers], centers_y[seekers], distance,
+                                      distance + longest_steps[kind2] + np.abs(steps[seekers]))
+            i = seekers[positions]
+            if kind1 == kind2:
+                i, j = i[j < i], j[j < i]
+            toi = self.times_of_impact(centers_x[i] - centers_x[j], centers_y[i] - centers_y[j], steps[i] - steps[j], reach)
+            hit = ~np.isnan(toi)
+            if hit.any():
+                found.append((toi[hit], np.maximum(i, j)[hit], np.minimum(i, j)[hit]))
+
+        if not found:
+            return
+        tois, firsts, seconds = (np.concatenate(column) for column in zip(*found))
+        order = np.lexsort((-seconds, -firsts, tois))
+        self.apply_hits(items, firsts[order].tolist(), seconds[order].tolist())
+
+    def collide_few(self, items: list):
+        """
+        Does the work of collide() for a world with at most SCALAR_ITEMS items, where the setup of the arrays
+        and the grids costs more than the checks themselves: the columns are read into plain lists once,
+        with the same arithmetic as collide(), and every pair of kinds is checked with check_pairs().
+
+        Parameters:
+        - items: The game items.
+        """
+        store = self.store
+        n = store.count
+        centers_x = (store.x[:n] + store.offset_x[:n]).tolist()
+        centers_y = (store.y[:n] + store.offset_y[:n]).tolist()
+        scale = self.clock.scale
+        steps = (store.speed[:n] if scale == 1 else store.speed[:n] * scale).tolist()
+        lives = store.lives[:n].tolist()
+        kinds = store.kind[:n].tolist()
+
+        members = {kind: [] for kind in self.collision_grids}
+        for index, item in enumerate(items):
+            row = item.row
+            if lives[row] > 0 and kinds[row] in members:
+                members[kinds[row]].append((index, centers_x[row], centers_y[row], steps[row]))
+
+        hits = []
+        for kind1, kind2 in self.collision_pairs:
+            if members[kind1] and members[kind2]:
+                hits += self.check_pairs(members[kind1], members[kind2], self.collision_reach[kind1][kind2], kind1 == kind2)
+        hits.sort(key=lambda hit: (hit[0], -hit[1], -hit[2]))
+        self.apply_hits(items, [hit[1] for hit in hits], [hit[2] for hit in hits])
+
+    def apply_hits(self, items: list, firsts: list, seconds: list):
+        """
+        Applies the outcome of the collisions through collision_handlers, in the given order. A hit is skipped
+        if one of its items already lost its last life to an earlier hit of the tick.
+
+        Parameters:
+        - items: The game items, by index.
+        - firsts: The higher index of every pair that collides.
+        - seconds: The lower index of every pair that collides.
+        """
+        for i, j in zip(firsts, seconds):
+            item1 = items[i]
+            item2 = items[j]
+            if item1.is_alive() and item2.is_alive():
+                self.collision_handlers[item1.kind, item2.kind](item1, item2)
+
+    def check_pairs(self, seekers: list, targets: list, reach: float, same_kind: bool) -> list:
+        """
+        Checks every seeker against every target one pair at a time, for the pairs of kinds with few items,
+        where the grid and the arrays would cost more than the checks themselves.
+
+        Parameters:
+        - seekers: An (index, center x, center y, vertical step) tuple for every item that looks for the targets.
+        - targets: The same tuples for the items they look for.
+        - reach: The squared sum of the collision radii of the two kinds.
+        - same_kind: True if the seekers and the targets are the same items, so every pair is checked once.
+
+        Returns:
+        - A (time of impact, higher index, lower index) triple for every pair that collides.
+        """
+        hits = []
+        time_of_impact = self.time_of_impact
+        for i, x, y, step in seekers:
+            for j, target_x, target_y, target_step in targets:
+                if same_kind and j >= i:
+                    continue
+                toi = time_of_impact(x - target_x, y - target_y, step - target_step, reach)
+                if toi is not None:
+                    hits.append((toi, i, j) if i > j else (toi, j, i))
+        return hits
+
+    @staticmethod
+    def time_of_impact(px: float, py: float, dy: float, reach: float):
+        """
+        Returns when a moving circle first touches another one during a tick, by intersecting the segment
+        of their relative motion with a circle of the sum of their radii.
+
+        Parameters:
+        - px: The x-distance between the centers of the two items at the start of the tick.
+        - py: The y-distance between the centers of the two items at the start of the tick.
+        - dy: The vertical distance the first item moves relative to the second one during the tick.
+        - reach: The squared sum of the collision radii of the two items.
+
+        Returns:
+        - The fraction of the tick at which the items touch, 0 if they already overlap, or None if they do not touch.
+        """
+        distance = px * px + py * py - reach
+        if distance < 0:
+            return 0.0
+        if dy == 0 or py * dy >= 0:
+            return None
+        # Solves (py + t*dy)^2 + px^2 = reach for the first t, the segment only gets closer while py and dy differ in sign.
+        discriminant = py * py - distance
+        if discriminant <= 0:
+            return None
+        toi = (-py - (discriminant ** 0.5 if dy > 0 else -discriminant ** 0.5)) / dy
+        return toi if toi <= 1 else None
+
+    @staticmethod
+    def times_of_impact(px: np.ndarray, py: np.ndarray, dy: np.ndarray, reach: float) -> np.ndarray:
+        """
+        Returns time_of_impact() for many pairs of items at once, with the same arithmetic.
+
+        Parameters:
+        - px: The x-distances between the centers of the pairs at the start of the tick.
+        - py: The y-distances between the centers of the pairs at the start of the tick.
+        - dy: The vertical distances the first items move relative to the second ones during the tick.
+        - reach: The squared sum of the collision radii of the two kinds.
+
+        Returns:
+        - The fraction of the tick at which every pair touches, 0 if it already overlaps, or NaN if it does not touch.
+        """
+        distance = px * px + py * py - reach
+        discriminant = py * py - distance
+        touching = (dy != 0) & (py * dy < 0) & (discriminant > 0)
+        root = np.sqrt(np.where(touching, discriminant, 0.0))
+        toi = (-py - np.where(dy > 0, root, -root)) / np.where(touching, dy, 1.0)
+        toi = np.where(touching & (toi <= 1), toi, np.nan)
+        return np.where(distance < 0, 0.0, toi)
+
+    def damage_ship(self, item1, item2):
+        """
+        Applies a collision between the spaceship and an asteroid or an aliens' bullet: both lose a life,
+        and the game over callback is called if the spaceship has no lives left.
+
+        Parameters:
+        - item1: One of the colliding items.
+        - item2: The other colliding item.
+        """
+        item1.kill()
+        item2.kill()
+        if self.ship.is_alive() == False and self.game_over is not None:
+            self.game_over(self.score)
+
+    def shoot_down(self, item1, item2):
+        """
+        Applies a collision between a player's bullet and an asteroid or an alien: both lose a life and the player scores.
+
+        Parameters:
+        - item1: One of the colliding items.
+        - item2: The other colliding item.
+        """
+        item1.kill()
+        item2.kill()
+        self.score += 10
+        self.kills += 1
+
+    def move(self):
+        """
+        Moves the asteroids and bullets, all at once in the store, and the aliens.
+        """
+        scale = self.clock.scale
+        self.store.advance(scale)
+        for alien in self.aliens:
+            if alien.is_alive():
+                alien.move(scale)
+
+    def spawn(self):
+        """
+        Runs the scheduled events that are due: the volleys of the aliens, the spawns of the asteroids and
+        aliens and the direction changes of the aliens. A tick without due events does no work.
+        """
+        self.scheduler.run(self.clock.time)
+
+    def volley(self):
+        """
+        Lets every alien that is alive fire a bullet, then schedules the next volley.
+        """
+        config = self.config
+        pool = self.pools[WorldStore.THEIR_BULLET]
+        for alien in self.aliens:
+            if alien.is_alive():
+                self.their_bullets.push(alien.attack(pool, config.their_bullet_speed))
+        self.scheduler.schedule(self.clock.time + config.volley_interval, self.volley)
+
+    def spawn_asteroid(self):
+        """
+        Creates a new asteroid at a random position at the top of the viewport, then schedules the next one.
+        """
+        config = self.config
+        self.asteroids.push(self.pools[WorldStore.ASTEROID].acquire(self.rng.randint(0, self.width), 0, config.asteroid_speed))
+        self.scheduler.schedule(self.clock.time + config.asteroid_interval, self.spawn_asteroid)
+
+    def spawn_alien(self):
+        """
+        Creates a new alien at a random position at the top of the viewport, then schedules the next one.
+        While the alien cap is reached, the spawn is retried in the next tick instead.
+        """
+        now = self.clock.time
+        config = self.config
+        if self.store.live[WorldStore.ALIEN] < config.alien_cap:
+            self.add(Alien(self.store, self.rng.randint(0, self.width), 0, "Alien"))
+            self.scheduler.schedule(now + config.alien_interval, self.spawn_alien)
+        else:
+            self.scheduler.schedule(now, self.spawn_alien)
+
+    def change_direction(self, alien: Alien):
+        """
+        Picks a new random direction for an alien, then schedules its next direction change.
+
+        Parameters:
+        - alien: The alien.
+        """
+        alien.change_direction(self.rng)
+        self.alien_timers[alien] = self.scheduler.schedule(self.clock.time + self.config.direction_change_interval, self.change_direction, alien)
+
+    def latch_input(self):
+        """
+        Latches the input for the tick: the events of the input queue are drained into the pressed flags, then
+        the pressed flags and a pending fire request become the keys bitmask, and a requested width becomes
+        the width. The Tk thread only pushes events into the queue, the tick only sees the latched values,
+        so the keys of every tick can be recorded and replayed exactly.
+        """
+        if self.input_queue is not None:
+            self.apply_input(self.input_queue.drain())
+        keys = 0
+        if self.up_pressed:
+            keys |= UP
+        if self.down_pressed:
+            keys |= DOWN
+        if self.left_pressed:
+            keys |= LEFT
+        if self.right_pressed:
+            keys |= RIGHT
+        requests = self.fire_requests
+        if requests != self.fire_handled:
+            self.fire_handled = requests
+            keys |= FIRE
+        self.keys = keys
+
+        width = self.requested_width
+        if width is not None:
+            self.requested_width = None
+            self.width = width
+
+    def apply_input(self, keys: int):
+        """
+        Sets the pressed flags from a key-state bitmask and asks to fire a bullet if the FIRE bit is set.
+
+        Parameters:
+        - keys: A combination of the UP, DOWN, LEFT, RIGHT and FIRE bits from InputSource.
+        """
+        self.up_pressed = bool(keys & UP)
+        self.down_pressed = bool(keys & DOWN)
+        self.left_pressed = bool(keys & LEFT)
+        self.right_pressed = bool(keys & RIGHT)
+        if keys & FIRE:
+            self.fire()
+
+    def fire(self):
+        """
+        Asks to fire a bullet from the spaceship. The bullet is fired in the next tick, at most one per tick.
+        """
+        self.fire_requests += 1
+
+    def resize(self, width: int):
+        """
+        Asks to change the width of the viewport. The width changes at the start of the next tick,
+        so it is safe to call from the Tk thread.
+
+        Parameters:
+        - width: The new width of the viewport.
+        """
+        if width != self.width:
+            self.requested_width = width
+
+    def add(self, item):
+        """
+        Adds a game item to the container of its kind. A new alien picks its first direction in the next tick.
+
+        Parameters:
+        - item: An alien, an asteroid or a bullet.
+        """
+        if item.kind == WorldStore.ALIEN:
+            self.aliens.append(item)
+            self.alien_timers[item] = self.scheduler.schedule(self.clock.time, self.change_direction, item)
+        elif item.kind == WorldStore.ASTEROID:
+            self.asteroids.push(item)
+        elif item.kind == WorldStore.OUR_BULLET:
+            self.our_bullets.push(item)
+        elif item.kind == WorldStore.THEIR_BULLET:
+            self.their_bullets.push(item)
+
+    def allocation_stats(self) -> dict:
+        """
+        Returns the counters of the item pools. Once the game reaches a steady state the created counters stop growing.
+
+        Returns:
+        - dict: The ItemPool.stats() of every pool, by the name of its item class.
+        """
+        names = {WorldStore.ASTEROID: "Asteroid", WorldStore.OUR_BULLET: "OurBullet", WorldStore.THEIR_BULLET: "TheirBullet"}
+        return {names[kind]: pool.stats() for kind, pool in self.pools.items()}
+
+    def publish(self):
+        """
+        Publishes a FrameState with the position of every game item that is alive, its position at the start
+        of the tick, the score and the lives. The longest step of the tick is the fastest vertical speed or the
+        speed of the spaceship, which is faster than the aliens, so a longer move is a jump.
+
+        The snapshot is built from the store columns and then made visible by replacing the snapshot
+        reference in one step, so the renderer always sees a complete tick.
+        """
+        store = self.store
+        items = self.game_items
+        if len(items) <= self.SCALAR_ITEMS:
+            n = store.count
+            x, y, previous_x, previous_y = store.x[:n].tolist(), store.y[:n].tolist(), store.previous_x[:n].tolist(), store.previous_y[:n].tolist()
+            lives = store.lives[:n].tolist()
+            speeds = store.speed[:n].tolist()
+            entities = []
+            previous = []
+            fastest = 0.0
+            for item in items:
+                row = item.row
+                fastest = max(fastest, abs(speeds[row]))
+                if lives[row] > 0:
+                    entities.append((item, x[row], y[row]))
+                    previous.append((previous_x[row], previous_y[row]))
+            entities = tuple(entities)
+            previous = tuple(previous)
+        else:
+            rows = self.item_rows(items)
+            alive = (store.lives[rows] > 0).tolist()
+            entities = tuple(compress(zip(items, store.x[rows].tolist(), store.y[rows].tolist()), alive))
+            previous = tuple(compress(zip(store.previous_x[rows].tolist(), store.previous_y[rows].tolist()), alive))
+            fastest = float(np.abs(store.speed[rows]).max(initial=0.0))
+        max_step = self.clock.scale * max(self.SHIP_SPEED, fastest)
+        self.snapshot = FrameState(self.clock.ticks, entities, self.score, self.ship.lives, previous, time.perf_counter(), max_step)
+
+    def is_over(self) -> bool:
+        """
+        Checks if the game is over.
+
+        Returns:
+        - True if the player's spaceship is no longer alive, False otherwise.
+        """
+        return not self.ship.is_alive()
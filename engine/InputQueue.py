@@ -0,0 +1,187 @@
+import time
+from engine.InputSource import UP, DOWN, LEFT, RIGHT, FIRE
+
+KEYSYMS = {"Up": UP, "Down": DOWN, "Left": LEFT, "Right": RIGHT, "space": FIRE}
+
+
+class InputQueue:
+    """
+    Carries the key events from the Tk thread to the simulation thread, as timestamped press and release edges.
+
+    The Tk thread pushes the events into a ring buffer of fixed capacity and the simulation thread drains it
+    once per tick into a key-state bitmask, so the input of a tick never changes while the tick runs. There is
+    one producer and one consumer and no lock: every attribute is written by one of the two threads only. The
+    producer fills a slot before it moves the tail past it, and the consumer moves the head only after it has
+    read the slots, so neither thread ever sees a slot the other one is writing.
+
+    Holding a key makes the keyboard repeat it. Some platforms repeat the press alone: the producer drops a
+    press of a key it already holds. X11 repeats a release and a press together: the consumer keeps a release
+    pending until repeat_gap has passed, and a press of the same key within repeat_gap cancels it, so the key
+    stays held. A real release is applied by the first drain after repeat_gap, at most one tick late.
+
+    The FIRE bit of the bitmask is set for the tick that drains a press of the space key. While the key stays
+    held it is set again after fire_delay drains, then every fire_interval drains, as the keyboard repeat used
+    to fire the spaceship. The repeats are counted in drains, one per tick, and not taken from the keyboard,
+    so the bullets fired depend on how long the key is held and not on the repeat rate of the keyboard.
+
+    When the buffer is full the event is dropped and counted. The next drain then takes the keys the producer
+    holds as the key state, so no key stays stuck after an overflow, only the presses in between are lost.
+
+    Attributes:
+    - capacity (int): The number of events the buffer holds.
+    - repeat_gap (float): The longest time between a release and a press of the same key that are a repeat, in seconds.
+    - fire_delay (int): The number of drains from a press of the space key to its first repeated FIRE while it is held.
+    - fire_interval (int): The number of drains between two repeated FIREs while the space key is held.
+    - times (list): The timestamp of the event in every slot, in seconds of time.perf_counter().
+    - keys (list): The key bit of the event in every slot.
+    - pressed (list): True if the event in the slot is a press, False if it is a release.
+    - tail (int): The number of events pushed. Written by the producer only.
+    - down (int): The bitmask of the keys the producer holds. Written by the producer only.
+    - dropped (int): The number of events dropped because the buffer was full. Written by the producer only.
+    - head (int): The number of events drained. Written by the consumer only.
+    - held (int): The bitmask of the keys held after the last drain. Written by the consumer only.
+    - pending (dict): The time of the release of every key whose release is pending. Written by the consumer only.
+    - resynced (int): The value of dropped at the last drain. Written by the consumer only.
+    - fire_wait (int): The number of drains left until the next repeated FIRE. Written by the consumer only.
+
+    Methods:
+    - __init__(capacity, repeat_gap, fire_delay, fire_interval): Initializes an empty queue.
+    - push(key, pressed, timestamp) -> bool: Pushes a press or a release of a key. Called from the Tk thread.
+    - push_event(event, pressed) -> bool: Pushes a Tk key event, if it is one of the keys of the game.
+    - drain(now) -> int: Applies the pushed events and returns the key-state bitmask of the tick. Called from the simulation thread.
+    """
+
+    capacity = 256
+    repeat_gap = 0.005
+    fire_delay = 50
+    fire_interval = 3
+    times: list
+    keys: list
+    pressed: list
+    tail = 0
+    down = 0
+    dropped = 0
+    head = 0
+    held = 0
+    pending: dict
+    resynced = 0
+    fire_wait = 0
+
+    def __init__(self, capacity: int = 256, repeat_gap: float = 0.005, fire_delay: int = 50, fire_interval: int = 3):
+        """
+        Initializes an empty queue.
+
+        Parameters:
+        - capacity (int): The number of events the buffer holds.
+        - repeat_gap (float): The longest time between a release and a press of the same key that are a repeat, in seconds.
+        - fire_delay (int): The number of drains from a press of the space key to its first repeated FIRE while it is held.
+        - fire_interval (int): The number of drains between two repeated FIREs while the space key is held.
+        """
+        self.capacity = capacity
+        self.repeat_gap = repeat_gap
+        self.fire_delay = fire_delay
+        self.fire_interval = fire_interval
+        self.times = [0.0] * capacity
+        self.keys = [0] * capacity
+        self.pressed = [False] * capacity
+        self.pending = {}
+
+    def push(self, key: int, pressed: bool, timestamp: float = None) -> bool:
+        """
+        Pushes a press or a release of a key. A press of a key that is already held and a release of a key
+        that is not held are dropped, they are repeats or the end of a press made before the game started.
+
+        Parameters:
+        - key (int): The bit of the key, UP, DOWN, LEFT, RIGHT or FIRE.
+        - pressed (bool): True for a press, False for a release.
+        - timestamp (float): The time of the event, in seconds of time.perf_counter(), now if None.
+
+        Returns:
+        - bool: True if the event was pushed.
+        """
+        if bool(self.down & key) == pressed:
+            return False
+        self.down ^= key
+        tail = self.tail
+        if tail - self.head >= self.capacity:
+            self.dropped += 1
+            return False
+        slot = tail % self.capacity
+        self.times[slot] = time.perf_counter() if timestamp is None else timestamp
+        self.keys[slot] = key
+        self.pressed[slot] = pressed
+        self.tail = tail + 1
+        return True
+
+    def push_event(self, event, pressed: bool) -> bool:
+        """
+        Pushes a Tk key event, if it is one of the keys of the game.
+
+        Parameters:
+        - event: The key event object.
+        - pressed (bool): True for a KeyPress event, False for a KeyRelease event.
+
+        Returns:
+        - bool: True if the event was pushed.
+        """
+        key = KEYSYMS.get(event.keysym)
+        if key is None:
+            return False
+        return self.push(key, pressed)
+
+    def drain(self, now: float = None) -> int:
+        """
+        Applies the events pushed since the last drain to the held keys and returns the key-state bitmask of the tick.
+
+        Parameters:
+        - now (float): The current time, in seconds of time.perf_counter(), now if None.
+
+        Returns:
+        - int: The held UP, DOWN, LEFT and RIGHT bits, and the FIRE bit if the space key was pressed since the last drain
+          or a repeat of the held space key is due.
+        """
+        if now is None:
+            now = time.perf_counter()
+        held = self.held
+        pending = self.pending
+        fire = False
+        tail = self.tail
+        for index in range(self.head, tail):
+            slot = index % self.capacity
+            key = self.keys[slot]
+            timestamp = self.times[slot]
+            if not self.pressed[slot]:
+                pending[key] = timestamp
+                continue
+            released = pending.pop(key, None)
+            if released is not None and timestamp - released <= self.repeat_gap:
+                continue
+            held |= key
+            if key == FIRE:
+                fire = True
+        self.head = tail
+
+        for key, released in list(pending.items()):
+            if now - released > self.repeat_gap:
+                held &= ~key
+                del pending[key]
+
+        dropped = self.dropped
+        if dropped != self.resynced:
+            self.resynced = dropped
+            held = self.down
+            pending.clear()
+        self.held = held
+
+        if fire:
+            self.fire_wait = self.fire_delay
+        elif held & FIRE:
+            self.fire_wait -= 1
+            if self.fire_wait <= 0:
+                fire = True
+                self.fire_wait = self.fire_interval
+
+        keys = held & ~FIRE
+        if fire:
+            keys |= FIRE
+        return keys
@@ -0,0 +1,104 @@
+import random
+from bisect import bisect_right
+
+UP = 1
+DOWN = 2
+LEFT = 4
+RIGHT = 8
+FIRE = 16
+
+
+class InputSource:
+    """
+    A source of player input for a game that is not controlled from the keyboard.
+
+    The input of a tick is a key-state bitmask made of the UP, DOWN, LEFT, RIGHT and FIRE bits,
+    see GameWorld.apply_input(). The base class presses nothing.
+
+    Methods:
+    - poll(tick): Returns the key-state bitmask for the given tick.
+    """
+
+    def poll(self, tick: int) -> int:
+        """
+        Returns the key-state bitmask for the given tick.
+
+        Parameters:
+        - tick (int): The number of the simulation tick.
+
+        Returns:
+        - int: The key-state bitmask.
+        """
+        return 0
+
+
+class ScriptedInput(InputSource):
+    """
+    Replays a fixed script of key states.
+
+    Attributes:
+    - script (list): A list of (tick, keys) pairs sorted by tick. The keys hold from their tick until the next entry.
+    - ticks (list): The ticks of the script entries, used to look them up.
+    - loop (int): If not 0, the script is repeated every loop ticks.
+    """
+
+    script: list
+    ticks: list
+    loop: int
+
+    def __init__(self, script: list, loop: int = 0):
+        """
+        Initializes the ScriptedInput object.
+
+        Parameters:
+        - script (list): A list of (tick, keys) pairs sorted by tick.
+        - loop (int): If not 0, the script is repeated every loop ticks.
+        """
+        self.script = script
+        self.ticks = [tick for tick, _ in script]
+        self.loop = loop
+
+    def poll(self, tick: int) -> int:
+        if self.loop:
+            tick %= self.loop
+        index = bisect_right(self.ticks, tick)
+        if index == 0:
+            return 0
+        return self.script[index - 1][1]
+
+
+class RandomInput(InputSource):
+    """
+    A random pilot that changes its direction from time to time and fires at a fixed rate.
+
+    Attributes:
+    - rng (random.Random): The random number generator of the pilot.
+    - hold (int): The number of ticks a direction is held.
+    - fire_every (int): The number of ticks between two shots.
+    - keys (int): The direction currently held.
+    """
+
+    rng: random.Random
+    hold: int
+    fire_every: int
+    keys = 0
+
+    def __init__(self, seed=None, hold: int = 50, fire_every: int = 25):
+        """
+        Initializes the RandomInput object.
+
+        Parameters:
+        - seed: The seed of the random number generator of the pilot.
+        - hold (int): The number of ticks a direction is held.
+        - fire_every (int): The number of ticks between two shots.
+        """
+        self.rng = random.Random(seed)
+        self.hold = hold
+        self.fire_every = fire_every
+
+    def poll(self, tick: int) -> int:
+        if tick % self.hold == 0:
+            self.keys = self.rng.choice([0, UP, DOWN, LEFT, RIGHT, UP | LEFT, UP | RIGHT, DOWN | LEFT, DOWN | RIGHT])
+        if tick % self.fire_every == 0:
+            return self.keys | FIRE
+        return self.keys
@@ -0,0 +1,153 @@
+import json
+import threading
+import time
+from itertools import count
+
+class Profiler:
+    """
+    A low-overhead phase profiler that records into a fixed-size ring buffer.
+
+    Callers check enabled before taking any timestamps, so a disabled profiler costs one attribute
+    read per instrumented block. Recording takes a slot from an atomic counter, so the simulation
+    thread and the Tk thread can record at the same time without a lock. When the buffer is full,
+    the oldest events are overwritten.
+
+    Attributes:
+    - enabled (bool): True if the instrumented code should record its phases.
+    - capacity (int): The number of events the ring buffer holds.
+    - names (list): The name of every event in the ring buffer.
+    - starts (list): The start of every event, in seconds of time.perf_counter().
+    - values (list): The duration of every span event in seconds, or the value of every counter event.
+    - spans (list): True for span events, False for counter events.
+    - threads (list): The id of the thread that recorded every event.
+    - latest (dict): The latest value of every counter.
+    - slots (count): The counter that hands out the ring buffer slots.
+
+    Methods:
+    - __init__(capacity, enabled): Initializes an empty profiler.
+    - toggle(): Turns recording on or off.
+    - record(name, start): Records a span from start until now.
+    - counter(name, value): Records the value of a counter.
+    - events(): Returns the recorded events, oldest first.
+    - durations(name): Returns the durations of the recorded spans with the given name.
+    - summary(): Returns the FPS, the tick time percentiles and the latest counters.
+    - dump_chrome_trace(path): Writes the recorded events as Chrome trace-event JSON.
+    """
+
+    enabled: bool
+    capacity: int
+
+    def __init__(self, capacity: int = 65536, enabled: bool = False):
+        """
+        Initializes an empty profiler.
+
+        Parameters:
+        - capacity (int): The number of events the ring buffer holds.
+        - enabled (bool): True to start recording right away.
+        """
+        self.enabled = enabled
+        self.capacity = capacity
+        self.names = [None] * capacity
+        self.starts = [0.0] * capacity
+        self.values = [0.0] * capacity
+        self.spans = [True] * capacity
+        self.threads = [0] * capacity
+        self.slots = count()
+        self.latest = {}
+
+    def toggle(self, event=None):
+        """
+        Turns recording on or off.
+
+        Parameters:
+        - event: The key event, if the method is bound to a key.
+        """
+        self.enabled = not self.enabled
+
+    def record(self, name: str, start: float):
+        """
+        Records a span from start until now.
+
+        Parameters:
+        - name (str): The name of the phase.
+        - start (float): The start of the phase, from time.perf_counter().
+        """
+        end = time.perf_counter()
+        slot = next(self.slots) % self.capacity
+        self.names[slot] = name
+        self.starts[slot] = start
+        self.values[slot] = end - start
+        self.spans[slot] = True
+        self.threads[slot] = threading.get_ident()
+
+    def counter(self, name: str, value: float):
+        """
+        Records the value of a counter, for example the number of game items.
+
+        Parameters:
+        - name (str): The name of the counter.
+        - value (float): The value of the counter.
+        """
+        slot = next(self.slots) % self.capacity
+        self.names[slot] = name
+        self.starts[slot] = time.perf_counter()
+        self.values[slot] = value
+        self.spans[slot] = False
+        self.threads[slot] = threading.get_ident()
+        self.latest[name] = value
+
+    def events(self) -> list:
+        """
+        Returns the recorded events, oldest first.
+
+        Returns:
+        - list: The (name, start, value, span, thread) of every event.
+        """
+        events = [event for event in zip(self.names, self.starts, self.values, self.spans, self.threads) if event[0] is not None]
+        events.sort(key=lambda event: event[1])
+        return events
+
+    def durations(self, name: str) -> list:
+        """
+        Returns the durations of the recorded spans with the given name, sorted.
+
+        Parameters:
+        - name (str): The name of the phase.
+
+        Returns:
+        - list: The durations, in seconds.
+        """
+        return sorted(value for n, value, span in zip(self.names, self.values, self.spans) if n == name and span)
+
+    def summary(self) -> dict:
+        """
+        Returns the numbers shown by the overlay: the frames per second over the last second,
+        the 50th, 95th and 99th percentile of the tick time and the latest value of every counter.
+
+        Returns:
+        - dict: The fps, the tick percentiles in seconds and the counters.
+        """
+        now = time.perf_counter()
+        frames = sum(1 for name, start in zip(self.names, self.starts) if name == "frame" and now - start <= 1.0)
+        ticks = self.durations("tick")
+
+        def percentile(fraction):
+            return ticks[min(len(ticks) - 1, int(fraction * len(ticks)))] if ticks else 0.0
+
+        return {"fps": frames, "tick_p50": percentile(0.50), "tick_p95": percentile(0.95), "tick_p99": percentile(0.99), "counters": dict(self.latest)}
+
+    def dump_chrome_trace(self, path: str):
+        """
+        Writes the recorded events as Chrome trace-event JSON, which chrome://tracing and Perfetto can open.
+
+        Parameters:
+        - path (str): The file to write to.
+        """
+        trace = []
+        for name, start, value, span, thread in self.events():
+            if span:
+                trace.append({"name": name, "ph": "X", "ts": start * 1e6, "dur": value * 1e6, "pid": 1, "tid": thread})
+            else:
+                trace.append({"name": name, "ph": "C", "ts": start * 1e6, "pid": 1, "tid": thread, "args": {name: value}})
+        with open(path, "w") as file:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, file)
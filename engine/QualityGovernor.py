@@ -0,0 +1,131 @@
+from items.ItemConstants import LOW, MEDIUM, HIGH
+
+NAMES = {LOW: "low", MEDIUM: "medium", HIGH: "high"}
+
+
+class QualityGovernor:
+    """
+    Chooses the level of detail the entities are drawn with, from the measured frame times.
+
+    The draw time of every frame is smoothed with an exponential moving average and compared with
+    the frame budget. When the average stays over the budget for down_after frames, the detail is
+    lowered one level. It is raised again only once the average has stayed under headroom times the
+    budget for up_after frames, so a level that only just fits is kept instead of flickering between
+    two levels. After every change the next settle frames are not counted, they include the redraw of
+    the entities at the new level, spread over a few frames by the Scene, and the counters start again.
+
+    The levels are:
+    - HIGH: every shape of every entity, every entity moved as soon as its position changes.
+    - MEDIUM: the aliens without their lights and stippled beam, the spaceship without its flame. The entities
+      are moved once they are more than a pixel off, the aliens and the player's bullets every other frame.
+    - LOW: the aliens and the spaceship as their bodies only, the asteroids without their crater. The entities
+      are moved once they are more than two pixels off, the aliens and the player's bullets every third frame.
+
+    With sprites every entity is a single image whatever the level, so most of the saving of the lower
+    levels comes from the fewer canvas moves, see Scene.
+
+    Attributes:
+    - budget (float): The time a frame may take, in seconds.
+    - headroom (float): The fraction of the budget the average must stay under to raise the detail.
+    - down_after (int): The number of frames over the budget before the detail is lowered.
+    - up_after (int): The number of frames under the headroom before the detail is raised.
+    - smoothing (float): The weight of the last frame in the moving average.
+    - settle (int): The number of frames not counted after a change.
+    - level (int): The current level of detail, LOW, MEDIUM or HIGH.
+    - average (float): The moving average of the frame times, in seconds.
+    - over (int): The number of frames in a row the average was over the budget.
+    - under (int): The number of frames in a row the average was under the headroom.
+    - skipped (int): The number of frames still not counted after the last change.
+    - changes (int): The number of times the level changed.
+
+    Methods:
+    - __init__(budget, headroom, down_after, up_after, smoothing): Initializes the governor at the highest detail.
+    - record(frame_time) -> bool: Records the time of a frame and changes the level if needed.
+    - change(level) -> bool: Changes the level and starts counting the frames again.
+    - name() -> str: Returns the name of the current level.
+    """
+
+    budget = 0.016
+    headroom = 0.6
+    down_after = 5
+    up_after = 60
+    smoothing = 0.2
+    settle = 10
+    level = HIGH
+    average = 0.0
+    over = 0
+    under = 0
+    skipped = 0
+    changes = 0
+
+    def __init__(self, budget: float = 0.016, headroom: float = 0.6, down_after: int = 5, up_after: int = 60, smoothing: float = 0.2):
+        """
+        Initializes the governor at the highest detail.
+
+        Parameters:
+        - budget (float): The time a frame may take, in seconds.
+        - headroom (float): The fraction of the budget the average must stay under to raise the detail.
+        - down_after (int): The number of frames over the budget before the detail is lowered.
+        - up_after (int): The number of frames under the headroom before the detail is raised.
+        - smoothing (float): The weight of the last frame in the moving average.
+        """
+        self.budget = budget
+        self.headroom = headroom
+        self.down_after = down_after
+        self.up_after = up_after
+        self.smoothing = smoothing
+
+    def record(self, frame_time: float) -> bool:
+        """
+        Records the time of a frame and lowers or raises the level of detail if needed.
+
+        Parameters:
+        - frame_time (float): The time the frame took, in seconds.
+
+        Returns:
+        - bool: True if the level changed.
+        """
+        if self.skipped > 0:
+            self.skipped -= 1
+            return False
+        self.average += self.smoothing * (frame_time - self.average)
+        if self.average > self.budget:
+            self.over += 1
+            self.under = 0
+            if self.over >= self.down_after and self.level > LOW:
+                return self.change(self.level - 1)
+        elif self.average < self.budget * self.headroom:
+            self.under += 1
+            self.over = 0
+            if self.under >= self.up_after and self.level < HIGH:
+                return self.change(self.level + 1)
+        else:
+            self.over = 0
+            self.under = 0
+        return False
+
+    def change(self, level: int) -> bool:
+        """
+        Changes the level of detail and starts counting the frames again, after the settle frames.
+
+        Parameters:
+        - level (int): The new level.
+
+        Returns:
+        - bool: True.
+        """
+        self.level = level
+        self.over = 0
+        self.under = 0
+        self.skipped = self.settle
+        self.changes += 1
+        return True
+
+    def name(self) -> str:
+        """
+        Returns the name of the current level.
+
+        Returns:
+        - str: "low", "medium" or "high".
+        """
+        return NAMES[self.level]
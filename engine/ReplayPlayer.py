@@ -0,0 +1,274 @@
+import json
+import os
+import pickle
+import threading
+import zlib
+from bisect import bisect_right
+from engine.GameConfig import GameConfig
+from engine.GameWorld import GameWorld
+from engine.ReplayRecorder import ReplayRecorder
+from engine.SimulationClock import SimulationClock
+
+R = ReplayRecorder
+
+
+class ReplayPlayer:
+    """
+    Replays a match recorded by a ReplayRecorder, tick by tick.
+
+    The player rebuilds the world from the seed and settings in the header, or restores it from the
+    nearest keyframe when it seeks, and plays it with the recorded keys. The records are read from the
+    file as the replay goes, so replays of long sessions do not have to fit in memory. The player does
+    not wait for the wall clock: Replay.py runs it as fast as the CPU allows, the ReplayScreen at 1x.
+
+    Attributes:
+    - path (str): The path of the replay file.
+    - seed (int): The seed of the recorded world.
+    - created_ticks (int): The clock ticks when the recorded world was created.
+    - start_ticks (int): The clock ticks of the first recorded update.
+    - tick_length (float): The tick length of the recorded clock.
+    - width (int): The viewport width at the start of the match.
+    - height (int): The viewport height.
+    - keyframe_interval (int): The number of ticks between two keyframes.
+    - config (dict): The GameConfig settings of the match.
+    - records_offset (int): The file offset of the first record.
+    - size (int): The size of the file.
+    - end (int): The number of recorded ticks.
+    - index (list): The (tick, offset) of every keyframe, sorted by tick.
+    - file: The replay file, None once the player is closed.
+    - world (GameWorld): The replayed world, set by start().
+    - tick (int): The number of ticks the world has played.
+    - keys (int): The keys of the current tick.
+    - pending: The next record read from the file and not yet applied, as (kind, tick, value), or None.
+    - lock (threading.Lock): Serializes step() on the simulation thread and close() on the Tk thread.
+
+    Methods:
+    - __init__(path): Opens a replay file and reads its header and index.
+    - start(tick, game_over) -> GameWorld: Prepares the world to replay from a tick.
+    - step() -> bool: Replays one tick, unless the player is closed.
+    - run(until) -> int: Replays ticks as fast as possible.
+    - finished() -> bool: Checks if all the recorded ticks were replayed.
+    - close(): Closes the replay file. Can be called more than once, from any thread.
+    """
+
+    world: GameWorld = None
+    tick = 0
+    keys = 0
+    pending = None
+    end = 0
+    lock: threading.Lock
+
+    def __init__(self, path: str):
+        """
+        Opens a replay file and reads its header and the index of its keyframes.
+
+        Parameters:
+        - path (str): The path of the replay file.
+
+        Raises:
+        - ValueError: If the file is not a replay file of a known version.
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.file = open(path, "rb")
+        header = self.file.read(R.HEADER.size)
+        if len(header) < R.HEADER.size:
+            raise ValueError(f"{path} is not a replay file")
+        magic, version, self.seed, self.created_ticks, self.start_ticks, self.tick_length, self.width, self.height, \
+            self.keyframe_interval, config_length = R.HEADER.unpack(header)
+        if magic != R.MAGIC or version != R.VERSION:
+            raise ValueError(f"{path} is not a replay file of version {R.VERSION}")
+        self.config = json.loads(self.file.read(config_length))
+        self.records_offset = self.file.tell()
+        self.index = self.read_index()
+
+    def read_index(self) -> list:
+        """
+        Reads the index of the keyframes from the end of the file, or rebuilds it by scanning the records
+        if the recording was cut short. The replay of a cut recording ends with its last complete record.
+
+        Returns:
+        - list: The (tick, offset) of every keyframe.
+        """
+        file = self.file
+        size = self.size = file.seek(0, os.SEEK_END)
+        if size - self.records_offset >= R.FOOTER.size:
+            file.seek(size - R.FOOTER.size)
+            offset, magic = R.FOOTER.unpack(file.read(R.FOOTER.size))
+            if magic == R.FOOTER_MAGIC:
+                file.seek(offset - R.END.size)
+                self.end = R.END.unpack(file.read(R.END.size))[1]
+                count = R.INDEX.unpack(file.read(R.INDEX.size))[1]
+                entries = file.read(count * R.INDEX_ENTRY.size)
+                return [R.INDEX_ENTRY.unpack_from(entries, i * R.INDEX_ENTRY.size) for i in range(count)]
+
+        index = []
+        self.end = 0
+        file.seek(self.records_offset)
+        while True:
+            offset = file.tell()
+            record = self.read_record(skip_keyframes=True)
+            if record is None:
+                return index
+            kind, tick, _ = record
+            if kind == b"K":
+                index.append((tick, offset))
+                self.end = max(self.end, tick)
+            elif kind != b"E":
+                self.end = max(self.end, tick + 1)
+            else:
+                self.end = tick
+                return index
+
+    def read_record(self, skip_keyframes: bool = False):
+        """
+        Reads the record at the current position of the file.
+
+        Parameters:
+        - skip_keyframes (bool): True to skip the pickled world of a keyframe instead of loading it.
+
+        Returns:
+        - The (kind, tick, value) of the record, where value is the keys, the width or the world of a keyframe,
+          or None at the end of the records or of a file that was cut short.
+        """
+        file = self.file
+        kind = file.read(1)
+        if kind == b"I":
+            data = file.read(R.INPUT.size - 1)
+            if len(data) < R.INPUT.size - 1:
+                return None
+            _, tick, keys = R.INPUT.unpack(kind + data)
+            return kind, tick, keys
+        if kind == b"W":
+            data = file.read(R.WIDTH.size - 1)
+            if len(data) < R.WIDTH.size - 1:
+                return None
+            _, tick, width = R.WIDTH.unpack(kind + data)
+            return kind, tick, width
+        if kind == b"K":
+            data = file.read(R.KEYFRAME.size - 1)
+            if len(data) < R.KEYFRAME.size - 1:
+                return None
+            _, tick, length = R.KEYFRAME.unpack(kind + data)
+            if skip_keyframes:
+                if file.seek(length, os.SEEK_CUR) > self.size:
+                    return None
+                return kind, tick, None
+            data = file.read(length)
+            if len(data) < length:
+                return None
+            return kind, tick, pickle.loads(zlib.decompress(data))
+        if kind == b"E":
+            data = file.read(R.END.size - 1)
+            if len(data) < R.END.size - 1:
+                return None
+            return kind, R.END.unpack(kind + data)[1], None
+        return None
+
+    def start(self, tick: int = 0, game_over=None) -> GameWorld:
+        """
+        Prepares the world to replay from a tick. The world is restored from the last keyframe before
+        the tick, or created from the header, and then played up to the tick.
+        A keyframe is written before the clock of the recorded world ticks, so the clock is set from the tick.
+        A world created from the header schedules its timers at the tick the recorded world was created at,
+        then its clock moves on to the tick of the first recorded update, as the recorded clock may have.
+
+        Parameters:
+        - tick (int): The tick to start from.
+        - game_over: The callback to call with the score when the replayed game is over.
+
+        Returns:
+        - GameWorld: The world, as it starts the tick.
+        """
+        position = bisect_right(self.index, (tick, float("inf")))
+        if position > 0:
+            _, offset = self.index[position - 1]
+            self.file.seek(offset)
+            _, self.tick, self.world = self.read_record()
+            self.world.game_over = game_over
+            self.world.profiler = None
+            self.world.clock.ticks = self.start_ticks + self.tick
+            self.keys = self.world.keys
+        else:
+            clock = SimulationClock(self.tick_length)
+            clock.ticks = self.created_ticks
+            self.file.seek(self.records_offset)
+            self.world = GameWorld(clock, game_over, self.width, self.height, GameConfig(**self.config), self.seed)
+            clock.ticks = self.start_ticks
+            self.tick = 0
+            self.keys = 0
+        self.pending = self.next_record()
+        while self.tick < tick and self.step():
+            pass
+        return self.world
+
+    def next_record(self):
+        """
+        Returns the next input or width record, skipping the keyframes, or None at the end of the records.
+        """
+        while True:
+            record = self.read_record(skip_keyframes=True)
+            if record is None or record[0] == b"E":
+                return None
+            if record[0] != b"K":
+                return record
+
+    def step(self) -> bool:
+        """
+        Replays one tick: applies the records of the tick, plays it with the recorded keys and ticks the clock.
+
+        Returns:
+        - bool: False if there was no tick left to replay or the player was closed.
+        """
+        with self.lock:
+            if self.file is None or self.finished():
+                return False
+            world = self.world
+            pending = self.pending
+            while pending is not None and pending[1] == self.tick:
+                kind, _, value = pending
+                if kind == b"I":
+                    self.keys = value
+                else:
+                    world.resize(value)
+                pending = self.next_record()
+            self.pending = pending
+            world.apply_input(self.keys)
+            world.update()
+            world.clock.tick()
+            self.tick += 1
+            return True
+
+    def run(self, until: int = None) -> int:
+        """
+        Replays ticks as fast as possible, up to a tick or to the end of the recording.
+
+        Parameters:
+        - until (int): The tick to stop at, None for the end of the recording.
+
+        Returns:
+        - int: The number of ticks replayed.
+        """
+        start = self.tick
+        while (until is None or self.tick < until) and self.step():
+            pass
+        return self.tick - start
+
+    def finished(self) -> bool:
+        """
+        Checks if all the recorded ticks were replayed.
+
+        Returns:
+        - bool: True at the end of the recording.
+        """
+        return self.tick >= self.end
+
+    def close(self):
+        """
+        Closes the replay file. The ReplayScreen closes it from the Tk thread while the simulation thread may be
+        in step(), so the file is only closed between two ticks, and the ticks after that replay nothing.
+        """
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
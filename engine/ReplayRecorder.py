@@ -0,0 +1,155 @@
+import json
+import pickle
+import struct
+import threading
+import zlib
+from engine.GameWorld import GameWorld
+
+
+class ReplayRecorder:
+    """
+    Records a match to a replay file while it is played, so it can be replayed exactly by a ReplayPlayer.
+
+    A world plays out the same for the same seed, clock and input, so the file holds the seed and the
+    settings of the world in a header, then a stream of tick-stamped records:
+
+    - an input record whenever the latched keys of a tick differ from the previous tick,
+    - a width record whenever the viewport width changes,
+    - a keyframe with the whole pickled world every keyframe_interval ticks, so a player can seek,
+    - an end record with the number of recorded ticks.
+
+    The file is written as the match goes, nothing but the last keys and width is kept in memory.
+    When the recorder is closed, an index of the keyframes and a footer pointing to it are appended.
+    A file whose recording was cut short has no index, the player then finds the keyframes by scanning.
+
+    Attributes:
+    - MAGIC (bytes): The first bytes of a replay file.
+    - VERSION (int): The version of the file format.
+    - HEADER (struct.Struct): The magic, version, seed, clock tick the world was created at, clock tick of its
+      first update, tick length, width, height, keyframe interval and the length of the JSON config that follows.
+    - START (struct.Struct): The clock tick of the first update, patched into the header at START_OFFSET.
+    - START_OFFSET (int): The file offset of the clock tick of the first update.
+    - INPUT (struct.Struct): An input record: b"I", the tick and the keys.
+    - WIDTH (struct.Struct): A width record: b"W", the tick and the width.
+    - KEYFRAME (struct.Struct): A keyframe record: b"K", the tick and the length of the compressed pickle that follows.
+    - END (struct.Struct): An end record: b"E" and the number of recorded ticks.
+    - INDEX (struct.Struct): The index record: b"X" and the number of entries that follow.
+    - INDEX_ENTRY (struct.Struct): An index entry: the tick and the file offset of a keyframe record.
+    - FOOTER (struct.Struct): The offset of the index record and b"SFRX", at the very end of the file.
+    - file: The replay file, None once the recorder is closed.
+    - keyframe_interval (int): The number of ticks between two keyframes.
+    - tick (int): The number of ticks recorded so far.
+    - keys (int): The keys of the last recorded tick.
+    - width (int): The viewport width of the last recorded tick.
+    - index (list): The (tick, offset) of every keyframe written.
+    - lock (threading.Lock): Serializes record() on the simulation thread and close() on the Tk thread.
+
+    Methods:
+    - __init__(path, world, seed, keyframe_interval): Creates the replay file and writes its header.
+    - record(world): Records the tick the world has just played.
+    - keyframe(world): Writes a keyframe of the world.
+    - close(): Writes the end record and the index and closes the file.
+    """
+
+    MAGIC = b"SFRP"
+    VERSION = 4
+    HEADER = struct.Struct("<4sHqQQdIIII")
+    START = struct.Struct("<Q")
+    START_OFFSET = struct.calcsize("<4sHqQ")
+    INPUT = struct.Struct("<cIB")
+    WIDTH = struct.Struct("<cII")
+    KEYFRAME = struct.Struct("<cII")
+    END = struct.Struct("<cI")
+    INDEX = struct.Struct("<cI")
+    INDEX_ENTRY = struct.Struct("<IQ")
+    FOOTER = struct.Struct("<Q4s")
+    FOOTER_MAGIC = b"SFRX"
+
+    keyframe_interval: int
+    tick: int
+    keys: int
+    width: int
+    index: list
+    lock: threading.Lock
+
+    def __init__(self, path: str, world: GameWorld, seed: int, keyframe_interval: int = 1000):
+        """
+        Creates the replay file and writes its header. Must be called before the world plays its first tick.
+        The clock may still tick before that, the header takes the tick of the first update from record().
+
+        Parameters:
+        - path (str): The path of the replay file.
+        - world (GameWorld): The world to record, created with the given seed.
+        - seed (int): The seed the world was created with.
+        - keyframe_interval (int): The number of ticks between two keyframes.
+        """
+        self.file = open(path, "wb")
+        self.keyframe_interval = keyframe_interval
+        self.tick = 0
+        self.keys = 0
+        self.width = world.width
+        self.index = []
+        self.lock = threading.Lock()
+        config = json.dumps(world.config.as_dict()).encode()
+        self.file.write(self.HEADER.pack(self.MAGIC, self.VERSION, seed, world.created_ticks, world.created_ticks,
+                                         world.clock.tick_length, world.width, world.height, keyframe_interval, len(config)))
+        self.file.write(config)
+
+    def record(self, world: GameWorld):
+        """
+        Records the tick the world has just played: its latched keys and width if they changed, and a keyframe
+        when one is due. The first tick also writes the clock tick it was played at into the header.
+        Closes the recorder once the game is over.
+
+        Parameters:
+        - world (GameWorld): The recorded world, right after its update().
+        """
+        with self.lock:
+            if self.file is None:
+                return
+            if self.tick == 0:
+                position = self.file.tell()
+                self.file.seek(self.START_OFFSET)
+                self.file.write(self.START.pack(world.clock.ticks))
+                self.file.seek(position)
+            if world.width != self.width:
+                self.width = world.width
+                self.file.write(self.WIDTH.pack(b"W", self.tick, world.width))
+            if world.keys != self.keys:
+                self.keys = world.keys
+                self.file.write(self.INPUT.pack(b"I", self.tick, world.keys))
+            self.tick += 1
+            if self.tick % self.keyframe_interval == 0:
+                self.keyframe(world)
+        if world.is_over():
+            self.close()
+
+    def keyframe(self, world: GameWorld):
+        """
+        Writes a keyframe of the world, the state it starts the current tick with.
+
+        Parameters:
+        - world (GameWorld): The recorded world.
+        """
+        data = zlib.compress(pickle.dumps(world, protocol=pickle.HIGHEST_PROTOCOL), 1)
+        self.index.append((self.tick, self.file.tell()))
+        self.file.write(self.KEYFRAME.pack(b"K", self.tick, len(data)))
+        self.file.write(data)
+
+    def close(self):
+        """
+        Writes the end record, the index of the keyframes and the footer, and closes the file.
+        Safe to call more than once and from another thread than record().
+        """
+        with self.lock:
+            if self.file is None:
+                return
+            file = self.file
+            self.file = None
+            file.write(self.END.pack(b"E", self.tick))
+            offset = file.tell()
+            file.write(self.INDEX.pack(b"X", len(self.index)))
+            for entry in self.index:
+                file.write(self.INDEX_ENTRY.pack(*entry))
+            file.write(self.FOOTER.pack(offset, self.FOOTER_MAGIC))
+            file.close()
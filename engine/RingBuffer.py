@@ -0,0 +1,93 @@
+class RingBuffer:
+    """
+    A first-in first-out buffer of items on a circular list.
+
+    Projectiles are spawned in order and all move the same way, so the oldest one is the first to
+    leave the screen. Keeping them in spawn order lets the expired ones be removed from the head in
+    O(1) instead of searching and shifting a list. Items that die out of order stay in place until
+    they reach the head.
+
+    Attributes:
+    - slots (list): The circular list of items, None in the free slots.
+    - head (int): The slot of the oldest item.
+    - size (int): The number of items in the buffer.
+
+    Methods:
+    - __init__(capacity): Initializes an empty buffer.
+    - push(item): Adds an item as the newest one.
+    - peek(): Returns the oldest item.
+    - pop(): Removes and returns the oldest item.
+    - items(): Returns the items as a list, oldest first.
+    """
+
+    slots: list
+    head: int
+    size: int
+
+    def __init__(self, capacity: int = 64):
+        """
+        Initializes an empty buffer.
+
+        Parameters:
+        - capacity (int): The number of slots reserved up front. The buffer doubles when it is full.
+        """
+        self.slots = [None] * capacity
+        self.head = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def push(self, item):
+        """
+        Adds an item as the newest one.
+
+        Parameters:
+        - item: The item to add.
+        """
+        capacity = len(self.slots)
+        if self.size == capacity:
+            self.slots = self.items() + [None] * capacity
+            self.head = 0
+            capacity *= 2
+        self.slots[(self.head + self.size) % capacity] = item
+        self.size += 1
+
+    def peek(self):
+        """
+        Returns the oldest item without removing it.
+
+        Returns:
+        - The oldest item, None if the buffer is empty.
+        """
+        return self.slots[self.head] if self.size else None
+
+    def pop(self):
+        """
+        Removes and returns the oldest item.
+
+        Returns:
+        - The oldest item.
+
+        Raises:
+        - IndexError: If the buffer is empty.
+        """
+        if not self.size:
+            raise IndexError("pop from an empty RingBuffer")
+        item = self.slots[self.head]
+        self.slots[self.head] = None
+        self.head = (self.head + 1) % len(self.slots)
+        self.size -= 1
+        return item
+
+    def items(self) -> list:
+        """
+        Returns the items as a list, oldest first.
+
+        Returns:
+        - list: The items.
+        """
+        end = self.head + self.size
+        if end <= len(self.slots):
+            return self.slots[self.head:end]
+        return self.slots[self.head:] + self.slots[:end - len(self.slots)]
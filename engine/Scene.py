@@ -0,0 +1,159 @@
+from tkinter import Canvas
+from engine.QualityGovernor import LOW, MEDIUM, HIGH
+from engine.SpriteCache import SpriteCache
+from engine.WorldStore import WorldStore
+
+
+class Scene:
+    """
+    A retained-mode layer over a canvas.
+
+    Every entity owns the canvas items it created, grouped under its own tag. The shapes are
+    created once, moved with a single canvas.move() when the entity moves and deleted when the
+    entity leaves the game, instead of the whole canvas being cleared and redrawn every frame.
+    With a SpriteCache every entity is a single canvas image instead of its shapes.
+
+    Once every entity is a single image, what a frame costs is the number of canvas calls, mostly
+    the moves. The lower levels of detail make fewer of them:
+    - An entity is only moved once it is more than MOVE_THRESHOLD pixels away from where it is drawn.
+    - The entities of the LOW_PRIORITY kinds, which cannot hurt the spaceship, are only moved every
+      STRIDE frames, a different share of them on every frame so the calls are spread evenly.
+    At every level, the entities outside the viewport are not drawn at all.
+
+    When the level of detail changes, the entities are not all drawn again at once, that would be the
+    very frame spike the lower level is meant to avoid. At most RESTYLE_BUDGET of them are redrawn at
+    the new level per frame, and the new entities are drawn at the new level right away.
+
+    Attributes:
+    - TAG (str): The tag shared by the canvas items of all the entities.
+    - MOVE_THRESHOLD (dict): The distance an entity may be drawn away from its position, in pixels, by level of detail.
+    - STRIDE (dict): The number of frames between two moves of a low priority entity, by level of detail.
+    - LOW_PRIORITY (frozenset): The kinds of the entities that are moved less often at the lower levels.
+    - RESTYLE_BUDGET (int): The number of entities redrawn at a new level of detail per frame.
+    - MARGIN (int): How far an entity may be above or left of the viewport and still be drawn, the size of the largest sprite.
+    - canvas (Canvas): The canvas to draw on.
+    - sprites (SpriteCache): The cache of the pre-rendered sprites, or None to draw the shapes of the entities.
+    - entities (dict): Maps an entity to [tag, x, y, detail, number], its tag, the position and the level of detail
+      its shapes are drawn at, and the number of its tag.
+    - next_id (int): The number used for the tag of the next entity.
+    - detail (int): The level of detail of the last frame, see QualityGovernor.
+    - frame (int): The number of frames synced.
+    - restyling (bool): True while some entities may still be drawn at another level of detail than detail.
+
+    Methods:
+    - __init__(canvas, sprites): Initializes an empty scene.
+    - sync(entities, detail, width, height): Updates the canvas to show the given entities.
+    - draw(item, x, y, tag, detail): Draws the canvas items of an entity.
+    - clear(): Deletes the canvas items of all the entities.
+    """
+
+    TAG = "entity"
+    MOVE_THRESHOLD = {LOW: 2.0, MEDIUM: 1.0, HIGH: 0.0}
+    STRIDE = {LOW: 3, MEDIUM: 2, HIGH: 1}
+    LOW_PRIORITY = frozenset((WorldStore.ALIEN, WorldStore.OUR_BULLET))
+    RESTYLE_BUDGET = 32
+    MARGIN = 64
+
+    canvas: Canvas
+    sprites: SpriteCache
+    entities: dict
+    next_id: int
+    detail = HIGH
+    frame = 0
+    restyling = False
+
+    def __init__(self, canvas: Canvas, sprites: SpriteCache = None):
+        """
+        Initializes an empty scene.
+
+        Parameters:
+        - canvas (Canvas): The canvas to draw on.
+        - sprites (SpriteCache): The cache of the pre-rendered sprites, or None to draw the shapes of the entities.
+        """
+        self.canvas = canvas
+        self.sprites = sprites
+        self.entities = {}
+        self.next_id = 0
+
+    def sync(self, entities, detail: int = HIGH, width: int = None, height: int = None):
+        """
+        Updates the canvas to show the given entities. Creates the shapes of the new entities, moves the
+        shapes of the entities whose position changed and deletes the shapes of the entities that are gone
+        or outside the viewport. How far and how often the entities are moved depends on the level of detail.
+
+        Parameters:
+        - entities: The (item, x, y) triples to show, usually FrameState.entities.
+        - detail (int): The level of detail to draw the entities at, see QualityGovernor.
+        - width (int): The width of the viewport, None to draw the entities whatever their position.
+        - height (int): The height of the viewport, None to draw the entities whatever their position.
+        """
+        if detail != self.detail:
+            self.detail = detail
+            self.restyling = True
+        restyling = self.restyling
+        self.frame += 1
+        frame = self.frame
+        threshold = self.MOVE_THRESHOLD[detail]
+        stride = self.STRIDE[detail]
+        lazy = threshold > 0 or stride > 1
+        low_priority = self.LOW_PRIORITY
+        restyle = self.RESTYLE_BUDGET
+        clip = width is not None and height is not None
+        margin = -self.MARGIN
+        canvas = self.canvas
+        previous = self.entities
+        shown = {}
+        for item, x, y in entities:
+            if clip and (x < margin or y < margin or x > width or y > height):
+                continue
+            entry = previous.pop(item, None)
+            if entry is None:
+                number = self.next_id
+                self.next_id += 1
+                tag = f"{self.TAG}{number}"
+                self.draw(item, x, y, tag, detail)
+                entry = [tag, x, y, detail, number]
+            elif restyling and restyle > 0 and entry[3] != detail:
+                restyle -= 1
+                canvas.delete(entry[0])
+                self.draw(item, x, y, entry[0], detail)
+                entry[1] = x
+                entry[2] = y
+                entry[3] = detail
+            elif x != entry[1] or y != entry[2]:
+                dx = x - entry[1]
+                dy = y - entry[2]
+                if not lazy or not ((-threshold <= dx <= threshold and -threshold <= dy <= threshold)
+                                    or (item.kind in low_priority and (entry[4] + frame) % stride)):
+                    canvas.move(entry[0], dx, dy)
+                    entry[1] = x
+                    entry[2] = y
+            shown[item] = entry
+        if restyle > 0:
+            self.restyling = False
+        for entry in previous.values():
+            canvas.delete(entry[0])
+        self.entities = shown
+
+    def draw(self, item, x: float, y: float, tag: str, detail: int):
+        """
+        Draws the canvas items of an entity, as a sprite if there is a SpriteCache, else as its shapes.
+
+        Parameters:
+        - item: The game item.
+        - x (float): The x-coordinate to draw the item at.
+        - y (float): The y-coordinate to draw the item at.
+        - tag (str): The own tag of the entity.
+        - detail (int): The level of detail to draw the item at.
+        """
+        if self.sprites is not None:
+            self.sprites.draw(self.canvas, item, x, y, (tag, self.TAG), detail)
+        else:
+            item.draw_at(self.canvas, x, y, (tag, self.TAG), detail)
+
+    def clear(self):
+        """
+        Deletes the canvas items of all the entities.
+        """
+        self.canvas.delete(self.TAG)
+        self.entities = {}
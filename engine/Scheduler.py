@@ -0,0 +1,82 @@
+import heapq
+
+
+class Scheduler:
+    """
+    A priority queue of timed events, driven by the simulation time.
+
+    Instead of every timer being compared with the clock in every tick, the events wait in a heap
+    ordered by their due time and only the ones that are due are run. A tick without due events costs
+    a single comparison, whatever the number of timers.
+
+    Events that are due at the same time run in the order they were scheduled, so a seeded game
+    plays out the same every time.
+
+    Attributes:
+    - events (list): The heap of [due, sequence, callback, args] events.
+    - sequence (int): The sequence number of the next event, to break ties between events.
+
+    Methods:
+    - __init__(): Initializes an empty scheduler.
+    - schedule(due, callback, *args) -> list: Schedules a callback to run once the simulation time passes due.
+    - cancel(event): Cancels a scheduled event.
+    - run(now) -> int: Runs the events that are due.
+    """
+
+    events: list
+    sequence: int
+
+    def __init__(self):
+        """
+        Initializes an empty scheduler.
+        """
+        self.events = []
+        self.sequence = 0
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def schedule(self, due: float, callback, *args) -> list:
+        """
+        Schedules a callback to run once the simulation time passes due.
+
+        Parameters:
+        - due (float): The simulation time after which the callback runs, in seconds.
+        - callback: The function to call. Recurring events schedule themselves again.
+        - args: The arguments to call the callback with.
+
+        Returns:
+        - list: The event, to cancel it.
+        """
+        event = [due, self.sequence, callback, args]
+        self.sequence += 1
+        heapq.heappush(self.events, event)
+        return event
+
+    def cancel(self, event: list):
+        """
+        Cancels a scheduled event. The event stays in the heap and is dropped once it is due.
+
+        Parameters:
+        - event (list): The event returned by schedule().
+        """
+        event[2] = None
+
+    def run(self, now: float) -> int:
+        """
+        Runs the events whose due time is before now, in the order of their due times.
+
+        Parameters:
+        - now (float): The current simulation time, in seconds.
+
+        Returns:
+        - int: The number of events that ran.
+        """
+        events = self.events
+        ran = 0
+        while events and events[0][0] < now:
+            _, _, callback, args = heapq.heappop(events)
+            if callback is not None:
+                callback(*args)
+                ran += 1
+        return ran
@@ -0,0 +1,100 @@
+class SimulationClock:
+    """
+    A fixed-timestep clock that drives the simulation independently of the wall clock.
+
+    The wall time that passes is collected in an accumulator and turned into whole ticks of
+    tick_length seconds. When the machine falls behind, the missing ticks are run as catch-up
+    ticks, but never more than max_catch_up at once, the rest of the backlog is dropped so a
+    long stall slows the game down instead of freezing it.
+
+    All the speeds in the game are given in pixels per base tick (BASE_TICK_LENGTH).
+    A clock with a different tick length scales them by scale, so the gameplay speed does not
+    depend on the tick rate.
+
+    Attributes:
+    - BASE_TICK_LENGTH (float): The tick length the speeds in the game are given for, in seconds.
+    - tick_length (float): The length of one tick, in seconds.
+    - max_catch_up (int): The maximum number of ticks run for a single advance() call.
+    - ticks (int): The number of ticks run so far.
+    - accumulator (float): The wall time not yet turned into ticks, in seconds.
+    - last_time (float): The wall time of the last advance() call, None before the first one.
+
+    Methods:
+    - __init__(tick_length, max_catch_up): Initializes the clock.
+    - advance(now): Returns the number of ticks to run for the wall time that passed.
+    - tick(): Counts one tick as run.
+    - remaining(): Returns the wall time until the next tick is due.
+    - time: The simulation time, in seconds.
+    - scale: The factor to multiply the per base tick speeds with.
+    """
+
+    BASE_TICK_LENGTH = 0.01
+
+    tick_length: float
+    max_catch_up: int
+    ticks: int
+    accumulator: float
+    last_time: float
+
+    def __init__(self, tick_length: float = BASE_TICK_LENGTH, max_catch_up: int = 5):
+        """
+        Initializes the clock.
+
+        Parameters:
+        - tick_length (float): The length of one tick, in seconds.
+        - max_catch_up (int): The maximum number of ticks run for a single advance() call.
+        """
+        self.tick_length = tick_length
+        self.max_catch_up = max_catch_up
+        self.ticks = 0
+        self.accumulator = 0.0
+        self.last_time = None
+
+    @property
+    def time(self) -> float:
+        """
+        Returns the simulation time, in seconds.
+        """
+        return self.ticks * self.tick_length
+
+    @property
+    def scale(self) -> float:
+        """
+        Returns the factor to multiply the per base tick speeds with.
+        """
+        return self.tick_length / self.BASE_TICK_LENGTH
+
+    def advance(self, now: float) -> int:
+        """
+        Adds the wall time that passed since the last call to the accumulator
+        and returns the number of ticks that are due.
+
+        Parameters:
+        - now (float): The current wall time, in seconds, for example time.perf_counter().
+
+        Returns:
+        - int: The number of ticks to run, at most max_catch_up.
+        """
+        if self.last_time is not None:
+            self.accumulator += now - self.last_time
+        self.last_time = now
+
+        due = int(self.accumulator // self.tick_length)
+        if due > self.max_catch_up:
+            due = self.max_catch_up
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= due * self.tick_length
+        return due
+
+    def tick(self):
+        """
+        Counts one tick as run. Must be called once for every tick returned by advance().
+        """
+        self.ticks += 1
+
+    def remaining(self) -> float:
+        """
+        Returns the wall time until the next tick is due, in seconds.
+        """
+        return max(0.0, self.tick_length - self.accumulator)
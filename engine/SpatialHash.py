@@ -0,0 +1,107 @@
+import numpy as np
+
+
+class SpatialHash:
+    """
+    A uniform grid used as the broad phase of the collision detection.
+
+    Every item is put into the cell that contains its center. An item can only be inside a rectangle
+    if its cell overlaps the rectangle, so only the items of those cells have to reach the exact check.
+
+    The grid is kept as the cell keys of its items, sorted, with a column in the high bits of a key and a
+    row in the low bits. The items of the cells from one row to another in a column are then one slice
+    of the sorted keys, found with two binary searches, and all the rectangles are looked up at once.
+
+    Attributes:
+    - cell_size (float): The width and height of a single cell.
+    - keys (numpy.ndarray): The sorted cell keys of the items in the grid.
+    - indices (numpy.ndarray): The indices of the items in the grid, in the order of keys.
+
+    Methods:
+    - __init__(cell_size): Initializes an empty grid.
+    - key(columns, rows): Returns the cell keys of columns and rows.
+    - rebuild(centers_x, centers_y, indices): Puts the given items into the grid.
+    - query(centers_x, centers_y, half_width, half_heights): Returns the items whose cells overlap each of a set of rectangles.
+    """
+
+    cell_size: float
+    keys: np.ndarray
+    indices: np.ndarray
+
+    def __init__(self, cell_size: float):
+        """
+        Initializes an empty grid.
+
+        Parameters:
+        - cell_size (float): The width and height of a single cell. Must not be smaller than the collision distance.
+        """
+        self.cell_size = cell_size
+        self.keys = np.zeros(0, dtype=np.int64)
+        self.indices = np.zeros(0, dtype=np.int64)
+
+    @staticmethod
+    def key(columns: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """
+        Returns the cell keys of columns and rows. The keys sort by column, then by row.
+
+        Parameters:
+        - columns (numpy.ndarray): The columns of the cells.
+        - rows (numpy.ndarray): The rows of the cells.
+
+        Returns:
+        - numpy.ndarray: The keys of the cells.
+        """
+        return (columns << 32) + rows
+
+    def rebuild(self, centers_x: np.ndarray, centers_y: np.ndarray, indices: np.ndarray):
+        """
+        Puts the given items into the grid, in place of the ones it held. Must be called every tick, after the items have moved.
+
+        Parameters:
+        - centers_x (numpy.ndarray): The x-coordinates of the centers of all the items, by item index.
+        - centers_y (numpy.ndarray): The y-coordinates of the centers of all the items, by item index.
+        - indices (numpy.ndarray): The indices of the items to put into the grid.
+        """
+        size = self.cell_size
+        keys = self.key(np.floor(centers_x[indices] / size).astype(np.int64), np.floor(centers_y[indices] / size).astype(np.int64))
+        order = np.argsort(keys, kind="stable")
+        self.keys = keys[order]
+        self.indices = indices[order]
+
+    def query(self, centers_x: np.ndarray, centers_y: np.ndarray, half_width: float, half_heights: np.ndarray) -> tuple:
+        """
+        Returns the items in the cells that overlap each of a set of rectangles, as pairs of a rectangle
+        and an item. Every item whose center is inside a rectangle is returned with it, and some around it.
+
+        Parameters:
+        - centers_x (numpy.ndarray): The x-coordinates of the centers of the rectangles.
+        - centers_y (numpy.ndarray): The y-coordinates of the centers of the rectangles.
+        - half_width (float): Half the width of every rectangle.
+        - half_heights (numpy.ndarray): Half the height of every rectangle.
+
+        Returns:
+        - tuple: The positions of the rectangles in centers_x and the indices of the items, one pair per position.
+        """
+        size = self.cell_size
+        first_columns = np.floor((centers_x - half_width) / size).astype(np.int64)
+        last_columns = np.floor((centers_x + half_width) / size).astype(np.int64)
+        first_rows = np.floor((centers_y - half_heights) / size).astype(np.int64)
+        last_rows = np.floor((centers_y + half_heights) / size).astype(np.int64)
+        keys = self.keys
+
+        starts = []
+        counts = []
+        for offset in range(int((last_columns - first_columns).max(initial=0)) + 1):
+            columns = first_columns + offset
+            start = np.searchsorted(keys, self.key(columns, first_rows), "left")
+            end = np.searchsorted(keys, self.key(columns, last_rows), "right")
+            starts.append(start)
+            counts.append(np.where(columns <= last_columns, end - start, 0))
+
+        # Every slice becomes its run of positions in keys: the run of the k-th slice starts where the
+        # slices before it end in the output, so the output index minus that is the offset in the slice.
+        rectangles = np.tile(np.arange(len(centers_x)), len(starts))
+        starts = np.concatenate(starts)
+        counts = np.concatenate(counts)
+        positions = np.arange(int(counts.sum())) + np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        return np.repeat(rectangles, counts), self.indices[positions]
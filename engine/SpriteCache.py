@@ -0,0 +1,221 @@
+import math
+from tkinter import Canvas, PhotoImage
+from engine.QualityGovernor import HIGH
+
+
+class SpriteRaster:
+    """
+    A stand-in for the Tk canvas that records the shapes an item draws and rasterizes them into pixels.
+
+    The items draw themselves with draw_at() as usual, so their look is defined in one place only.
+    Ovals get the 1 pixel black outline the canvas gives them by default, polygons have none, and the
+    gray50 stipple keeps every other pixel, like on the canvas.
+
+    Attributes:
+    - shapes (list): The recorded (kind, coords, fill, stipple) shapes, in drawing order.
+
+    Methods:
+    - create_oval(x1, y1, x2, y2, fill, stipple, tags): Records an oval.
+    - create_polygon(*coords, fill, stipple, tags): Records a polygon.
+    - bounds() -> tuple: Returns the bounding box of all the recorded shapes.
+    - rasterize() -> tuple: Returns the pixels of the recorded shapes.
+    """
+
+    shapes: list
+
+    def __init__(self):
+        """
+        Initializes an empty raster.
+        """
+        self.shapes = []
+
+    def create_oval(self, x1, y1, x2, y2, fill="", stipple="", tags=None):
+        self.shapes.append(("oval", (x1, y1, x2, y2), fill, stipple))
+
+    def create_polygon(self, *coords, fill="black", stipple="", tags=None):
+        self.shapes.append(("polygon", coords, fill, stipple))
+
+    def bounds(self) -> tuple:
+        """
+        Returns the bounding box of all the recorded shapes, widened to whole pixels.
+
+        Returns:
+        - tuple: The (left, top, right, bottom) pixel coordinates.
+        """
+        xs = [x for _, coords, _, _ in self.shapes for x in coords[0::2]]
+        ys = [y for _, coords, _, _ in self.shapes for y in coords[1::2]]
+        return math.floor(min(xs)), math.floor(min(ys)), math.ceil(max(xs)) + 1, math.ceil(max(ys)) + 1
+
+    def rasterize(self) -> tuple:
+        """
+        Returns the pixels of the recorded shapes. Every pixel takes the fill of the last shape that covers
+        its center, like the stacking order of the canvas.
+
+        Returns:
+        - tuple: The (left, top, pixels) of the sprite, where pixels is a list of rows of color names,
+          None for the transparent pixels.
+        """
+        left, top, right, bottom = self.bounds()
+        pixels = [[None] * (right - left) for _ in range(bottom - top)]
+        for kind, coords, fill, stipple in self.shapes:
+            for row, line in enumerate(pixels):
+                py = top + row + 0.5
+                for column in range(len(line)):
+                    px = left + column + 0.5
+                    if stipple == "gray50" and (row + column) % 2:
+                        continue
+                    if kind == "oval":
+                        color = self.oval_color(coords, fill, px, py)
+                    else:
+                        color = fill if self.inside_polygon(coords, px, py) else None
+                    if color:
+                        line[column] = color
+        return left, top, pixels
+
+    @staticmethod
+    def oval_color(coords: tuple, fill: str, px: float, py: float):
+        """
+        Returns the color of an oval at a point: black on its outline, its fill inside and None outside.
+        """
+        x1, y1, x2, y2 = coords
+        cx, cy = (x1 + x2) / 2, (y1 + y2) / 2
+        rx, ry = abs(x2 - x1) / 2, abs(y2 - y1) / 2
+        if rx <= 0 or ry <= 0 or ((px - cx) / rx) ** 2 + ((py - cy) / ry) ** 2 > 1:
+            return None
+        if rx <= 1 or ry <= 1 or ((px - cx) / (rx - 1)) ** 2 + ((py - cy) / (ry - 1)) ** 2 > 1:
+            return "black"
+        return fill
+
+    @staticmethod
+    def inside_polygon(coords: tuple, px: float, py: float) -> bool:
+        """
+        Checks if a point is inside a polygon, with the even-odd rule.
+        """
+        points = list(zip(coords[0::2], coords[1::2]))
+        inside = False
+        for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1]):
+            if (y1 > py) != (y2 > py) and px < x1 + (py - y1) * (x2 - x1) / (y2 - y1):
+                inside = not inside
+        return inside
+
+
+class SpriteCache:
+    """
+    Rasterizes every kind of item once into an image, so an item is drawn as a single canvas image
+    instead of up to nine shapes.
+
+    The sprite of an item is made on first use and kept for all the items with the same sprite_key(),
+    for example every alien, or every bullet of the same radius, and for every level of detail.
+
+    Attributes:
+    - COLORS (dict): The RGB values of the color names the items use, so they need no Tk round-trip.
+      Every cache copies it, and adds the names it asks Tk for to its own copy.
+    - canvas (Canvas): The canvas the images are made for.
+    - image_class (type): The class of the images, PhotoImage by default.
+    - sprites (dict): Maps a sprite key and a level of detail to (image, left, top), the image and its offset from the item's position.
+
+    Methods:
+    - __init__(canvas, image_class): Initializes an empty cache.
+    - sprite(item, detail) -> tuple: Returns the sprite of an item, making it on first use.
+    - draw(canvas, item, x, y, tags, detail) -> int: Draws an item as a single image at the given position.
+    - rgb(color) -> str: Returns the #rrggbb value of a color name.
+    """
+
+    COLORS = {
+        "black": "#000000",
+        "blue": "#0000ff",
+        "darkgrey": "#a9a9a9",
+        "grey": "#bebebe",
+        "lightblue": "#add8e6",
+        "lightyellow": "#ffffe0",
+        "orange": "#ffa500",
+        "red": "#ff0000",
+        "silver": "#c0c0c0",
+        "yellow": "#ffff00",
+    }
+
+    canvas: Canvas
+    image_class: type
+    sprites: dict
+
+    def __init__(self, canvas: Canvas, image_class: type = PhotoImage):
+        """
+        Initializes an empty cache.
+
+        Parameters:
+        - canvas (Canvas): The canvas the images are made for.
+        - image_class (type): The class of the images, called with master, width and height.
+        """
+        self.canvas = canvas
+        self.image_class = image_class
+        self.sprites = {}
+        # The names looked up by rgb() depend on the Tk of the canvas, so they are not shared between caches.
+        self.COLORS = dict(self.COLORS)
+
+    def sprite(self, item, detail: int = HIGH) -> tuple:
+        """
+        Returns the sprite of an item, rasterizing it on first use.
+
+        Parameters:
+        - item: The game item.
+        - detail (int): The level of detail, see QualityGovernor.
+
+        Returns:
+        - tuple: The (image, left, top) of the sprite, left and top being the offset of the image from the item's position.
+        """
+        key = (item.sprite_key(), detail)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            raster = SpriteRaster()
+            item.draw_at(raster, 0, 0, None, detail)
+            left, top, pixels = raster.rasterize()
+            image = self.image_class(master=self.canvas, width=len(pixels[0]), height=len(pixels))
+            for y, line in enumerate(pixels):
+                x = 0
+                while x < len(line):
+                    if line[x] is None:
+                        x += 1
+                        continue
+                    end = x
+                    while end < len(line) and line[end] is not None:
+                        end += 1
+                    image.put("{" + " ".join(self.rgb(color) for color in line[x:end]) + "}", to=(x, y))
+                    x = end
+            sprite = self.sprites[key] = (image, left, top)
+        return sprite
+
+    def draw(self, canvas: Canvas, item, x: float, y: float, tags=None, detail: int = HIGH) -> int:
+        """
+        Draws an item as a single image at the given position.
+
+        Parameters:
+        - canvas (Canvas): The canvas to draw on.
+        - item: The game item.
+        - x (float): The x-coordinate to draw the item at.
+        - y (float): The y-coordinate to draw the item at.
+        - tags: The canvas tags to give to the image.
+        - detail (int): The level of detail, see QualityGovernor.
+
+        Returns:
+        - int: The id of the canvas image item.
+        """
+        image, left, top = self.sprite(item, detail)
+        return canvas.create_image(x + left, y + top, image=image, anchor="nw", tags=tags)
+
+    def rgb(self, color: str) -> str:
+        """
+        Returns the #rrggbb value of a color name, asking Tk for the names that are not in COLORS.
+
+        Parameters:
+        - color (str): The color name or #rrggbb value.
+
+        Returns:
+        - str: The #rrggbb value.
+        """
+        if color.startswith("#"):
+            return color
+        value = self.COLORS.get(color)
+        if value is None:
+            red, green, blue = self.canvas.winfo_rgb(color)
+            value = self.COLORS[color] = f"#{red >> 8:02x}{green >> 8:02x}{blue >> 8:02x}"
+        return value
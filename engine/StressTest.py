@@ -0,0 +1,220 @@
+import json
+import statistics
+from engine.GameConfig import GameConfig
+from engine.GameWorld import GameWorld
+
+
+class StressTest:
+    """
+    Drives a world through ever denser waves, to measure how the game copes with thousands of entities.
+
+    The test runs in levels. Every level doubles the spawn rates of the asteroids and the aliens, doubles
+    the alien cap and fires the volleys more often, by replacing the GameConfig of the world, and then
+    holds them for plateau_length seconds of simulation time. Once the entity count has settled, in the
+    second half of the plateau, the tick times and the draw times of the frames are collected. At the end of every
+    plateau they are summed up into a result, until the entity count reaches target or the last level
+    is done. The spaceship cannot die during the test.
+
+    The spawns run from the scheduler of the world, at most one of every kind per tick, so the entity
+    count of a level also depends on the tick length.
+
+    Attributes:
+    - LIVES (int): The lives of the spaceship, so it outlives the test.
+    - world (GameWorld): The world under test.
+    - plateau_length (float): The simulation time every level is held, in seconds.
+    - target (int): The entity count that ends the test.
+    - max_levels (int): The number of levels after which the test ends anyway.
+    - level (int): The current level, from 0.
+    - level_start (float): The simulation time the current level started at.
+    - ticks (list): The tick times of the current plateau, in seconds.
+    - frames (list): The draw times of the frames of the current plateau, in seconds.
+    - counts (list): The entity count after every tick of the current plateau.
+    - results (list): The summary of every finished plateau.
+    - finished (bool): True once the test is over.
+
+    Methods:
+    - __init__(world, plateau_length, target, max_levels): Starts the test at level 0.
+    - config(level) -> GameConfig: Returns the game parameters of a level.
+    - start_level(level): Starts a level.
+    - measuring() -> bool: Checks if the current plateau is settled and measured.
+    - record_tick(seconds): Records the time a tick took.
+    - record_frame(seconds): Records the time the drawing of a frame took.
+    - advance(): Moves on to the next level at the end of a plateau.
+    - summarize(name, values, scale) -> dict: Returns the statistics of some samples.
+    - report() -> dict: Returns the results and the settings of the test.
+    - write_report(path): Writes the report as JSON.
+    - summary() -> str: Returns the results as a table.
+    """
+
+    LIVES = 10 ** 9
+
+    world: GameWorld
+    plateau_length = 5.0
+    target = 5000
+    max_levels = 10
+    level = 0
+    level_start = 0.0
+    finished = False
+
+    def __init__(self, world: GameWorld, plateau_length: float = 5.0, target: int = 5000, max_levels: int = 10):
+        """
+        Starts the test at level 0.
+
+        Parameters:
+        - world (GameWorld): The world under test, just created.
+        - plateau_length (float): The simulation time every level is held, in seconds.
+        - target (int): The entity count that ends the test.
+        - max_levels (int): The number of levels after which the test ends anyway.
+        """
+        self.world = world
+        self.plateau_length = plateau_length
+        self.target = target
+        self.max_levels = max_levels
+        self.results = []
+        world.ship.lives = self.LIVES
+        self.start_level(0)
+
+    @staticmethod
+    def config(level: int) -> GameConfig:
+        """
+        Returns the game parameters of a level: the defaults at level 0, with the spawn rates,
+        the alien cap and the volley rate doubled at every level after it.
+
+        Parameters:
+        - level (int): The level, from 0.
+
+        Returns:
+        - GameConfig: The parameters of the level.
+        """
+        factor = 2 ** level
+        return GameConfig(asteroid_interval=GameConfig.asteroid_interval / factor,
+                          alien_interval=GameConfig.alien_interval / factor,
+                          alien_cap=GameConfig.alien_cap * factor,
+                          volley_interval=GameConfig.volley_interval / factor)
+
+    def start_level(self, level: int):
+        """
+        Starts a level: replaces the parameters of the world and clears the samples.
+
+        Parameters:
+        - level (int): The level to start.
+        """
+        self.level = level
+        self.level_start = self.world.clock.time
+        self.world.config = self.config(level)
+        self.ticks = []
+        self.frames = []
+        self.counts = []
+
+    def measuring(self) -> bool:
+        """
+        Checks if the current plateau is settled, in its second half, so its samples are recorded.
+
+        Returns:
+        - bool: True if the samples are recorded.
+        """
+        return self.world.clock.time - self.level_start >= self.plateau_length / 2
+
+    def record_tick(self, seconds: float):
+        """
+        Records the time a tick took, and the entity count after it, once the plateau is settled.
+
+        Parameters:
+        - seconds (float): The time world.update() took.
+        """
+        if self.measuring():
+            self.ticks.append(seconds)
+            self.counts.append(self.world.item_count())
+
+    def record_frame(self, seconds: float):
+        """
+        Records the time the drawing of a frame took, once the plateau is settled. Called from the Tk thread.
+
+        Parameters:
+        - seconds (float): The time the screen took to draw the frame, without the wait between two frames.
+        """
+        if self.measuring():
+            self.frames.append(seconds)
+
+    def advance(self):
+        """
+        Ends the current plateau once it was held for plateau_length: sums up its samples into a result,
+        then starts the next level or ends the test. Called after every tick.
+        """
+        if self.finished or self.world.clock.time - self.level_start < self.plateau_length:
+            return
+        result = {"level": self.level, "config": self.world.config.as_dict()}
+        result.update(self.summarize("entities", self.counts, 1))
+        result.update(self.summarize("tick_ms", self.ticks, 1e3))
+        result.update(self.summarize("frame_ms", self.frames, 1e3))
+        self.results.append(result)
+        if result["entities_mean"] >= self.target or self.level + 1 >= self.max_levels:
+            self.finished = True
+        else:
+            self.start_level(self.level + 1)
+
+    @staticmethod
+    def summarize(name: str, values: list, scale: float) -> dict:
+        """
+        Returns the mean, 50th, 95th and 99th percentile and maximum of some samples.
+
+        Parameters:
+        - name (str): The prefix of the keys.
+        - values (list): The samples.
+        - scale (float): The factor to multiply the samples with, 1e3 for milliseconds.
+
+        Returns:
+        - dict: The statistics, by name_mean, name_p50, name_p95, name_p99 and name_max, 0 without samples.
+        """
+        values = sorted(value * scale for value in values)
+        if not values:
+            return {f"{name}_{stat}": 0 for stat in ("mean", "p50", "p95", "p99", "max")}
+
+        def percentile(fraction):
+            return values[min(len(values) - 1, int(fraction * len(values)))]
+
+        return {
+            f"{name}_mean": statistics.fmean(values),
+            f"{name}_p50": percentile(0.50),
+            f"{name}_p95": percentile(0.95),
+            f"{name}_p99": percentile(0.99),
+            f"{name}_max": values[-1],
+        }
+
+    def report(self) -> dict:
+        """
+        Returns the results and the settings of the test.
+
+        Returns:
+        - dict: The tick length, the plateau length, the target, the highest entity count reached and the results of every plateau.
+        """
+        return {
+            "tick_length": self.world.clock.tick_length,
+            "plateau_length": self.plateau_length,
+            "target": self.target,
+            "peak_entities": max((result["entities_max"] for result in self.results), default=0),
+            "plateaus": self.results,
+        }
+
+    def write_report(self, path: str):
+        """
+        Writes the report as JSON.
+
+        Parameters:
+        - path (str): The path of the report file.
+        """
+        with open(path, "w") as file:
+            json.dump(self.report(), file, indent=2)
+
+    def summary(self) -> str:
+        """
+        Returns the results as a table, a line for every plateau.
+
+        Returns:
+        - str: The table.
+        """
+        lines = [f"{'level':>5} {'entities':>9} {'tick p50':>9} {'tick p99':>9} {'frame p50':>10} {'frame p99':>10}"]
+        for result in self.results:
+            lines.append(f"{result['level']:>5} {result['entities_mean']:>9.0f} {result['tick_ms_p50']:>7.2f}ms {result['tick_ms_p99']:>7.2f}ms "
+                         f"{result['frame_ms_p50']:>8.2f}ms {result['frame_ms_p99']:>8.2f}ms")
+        return "\n".join(lines)
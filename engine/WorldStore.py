@@ -0,0 +1,196 @@
+import numpy as np
+from items import ItemConstants
+
+
+class WorldStore:
+    """
+    Keeps the state of all the game items in contiguous NumPy columns (structure of arrays).
+
+    Every item owns one row of the store. The item classes are thin views that read and write
+    their row, while the per-tick work that is the same for many items (moving the asteroids and
+    bullets, culling the items that left the screen) is done with one vectorized operation per column.
+
+    Attributes:
+    - x (numpy.ndarray): The x-coordinates of the items.
+    - y (numpy.ndarray): The y-coordinates of the items.
+    - previous_x (numpy.ndarray): The x-coordinates of the items at the start of the tick, for interpolated rendering.
+    - previous_y (numpy.ndarray): The y-coordinates of the items at the start of the tick.
+    - speed (numpy.ndarray): The vertical speed of the items, 0 for the items that are not moved by the store.
+    - lives (numpy.ndarray): The number of lives of the items.
+    - kind (numpy.ndarray): The kind of the items (one of the kind constants below).
+    - offset_x (numpy.ndarray): The distance between the x-coordinate and the center of the items.
+    - offset_y (numpy.ndarray): The distance between the y-coordinate and the center of the items.
+    - count (int): The number of rows in use, including the released ones below it.
+    - free (list): The released rows that can be reused.
+    - live (list): The number of allocated rows of every kind, by kind.
+    - COLUMNS (dict): The NumPy type of every column, by name. A row takes 37 bytes.
+    - SCALAR_ROWS (int): Up to this many rows, keep_mask() works row by row instead of with array operations.
+
+    Methods:
+    - __init__(capacity): Initializes an empty store.
+    - allocate(kind, x, y, speed, lives): Allocates a row for a new item.
+    - release(row): Releases the row of an item that has left the game.
+    - remember(): Keeps the positions of all the items as their previous positions.
+    - advance(scale): Moves all the asteroids and bullets.
+    - keep_mask(width, height): Returns which rows stay in the game after culling.
+    - centers(rows): Returns the centers of the items in the given rows.
+    """
+
+    # The kinds of the items, from ItemConstants.
+    SHIP = ItemConstants.SHIP
+    ALIEN = ItemConstants.ALIEN
+    ASTEROID = ItemConstants.ASTEROID
+    OUR_BULLET = ItemConstants.OUR_BULLET
+    THEIR_BULLET = ItemConstants.THEIR_BULLET
+
+    # Kinds that are removed from the game once they leave the screen, indexed by kind.
+    CULLED = np.array([False, False, True, True, True])
+    # The same kinds as a set, for keep_mask() row by row.
+    CULLED_KINDS = frozenset(np.flatnonzero(CULLED).tolist())
+
+    # Up to this many rows, keep_mask() checks the rows one by one, faster than the fixed cost of the array operations.
+    SCALAR_ROWS = 64
+
+    # The columns and their types. On a screen a few thousand pixels wide, float32 keeps positions and speeds
+    # to about 1/10000 of a pixel. Lives stay below the 2**31 of int32, even the 10**9 of the stress test.
+    COLUMNS = {
+        "x": np.float32,
+        "y": np.float32,
+        "previous_x": np.float32,
+        "previous_y": np.float32,
+        "speed": np.float32,
+        "lives": np.int32,
+        "kind": np.int8,
+        "offset_x": np.float32,
+        "offset_y": np.float32,
+    }
+
+    count: int
+    free: list
+    live: list
+
+    def __init__(self, capacity: int = 64):
+        """
+        Initializes an empty store.
+
+        Parameters:
+        - capacity (int): The number of rows to reserve up front. The store grows when it is full.
+        """
+        for name, dtype in self.COLUMNS.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+        self.count = 0
+        self.free = []
+        self.live = [0] * len(self.CULLED)
+
+    def allocate(self, kind: int, x: float, y: float, speed: float, lives: int) -> int:
+        """
+        Allocates a row for a new item. Released rows are reused before the store grows.
+
+        Parameters:
+        - kind (int): The kind of the item.
+        - x (float): The x-coordinate of the item.
+        - y (float): The y-coordinate of the item.
+        - speed (float): The vertical speed of the item.
+        - lives (int): The number of lives of the item.
+
+        Returns:
+        - int: The row of the item.
+        """
+        if self.free:
+            row = self.free.pop()
+        else:
+            if self.count == len(self.x):
+                self._grow()
+            row = self.count
+            self.count += 1
+        self.x[row] = x
+        self.y[row] = y
+        self.previous_x[row] = x
+        self.previous_y[row] = y
+        self.speed[row] = speed
+        self.lives[row] = lives
+        self.kind[row] = kind
+        self.offset_x[row] = 0
+        self.offset_y[row] = 0
+        self.live[kind] += 1
+        return row
+
+    def release(self, row: int):
+        """
+        Releases the row of an item that has left the game.
+
+        Parameters:
+        - row (int): The row to release.
+        """
+        self.live[self.kind[row]] -= 1
+        self.speed[row] = 0
+        self.lives[row] = 0
+        self.free.append(row)
+
+    def remember(self):
+        """
+        Keeps the positions of all the items as their previous positions, at the start of a tick.
+        A new item starts with its first position as its previous one, so it does not slide in.
+        """
+        count = self.count
+        self.previous_x[:count] = self.x[:count]
+        self.previous_y[:count] = self.y[:count]
+
+    def advance(self, scale: float = 1):
+        """
+        Moves all the asteroids and bullets vertically by their speed.
+
+        Parameters:
+        - scale (float): The factor to multiply the speeds with, see SimulationClock.scale.
+        """
+        n = self.count
+        if scale == 1:
+            self.y[:n] += self.speed[:n]
+        else:
+            self.y[:n] += self.speed[:n] * scale
+
+    def keep_mask(self, width: int, height: int) -> np.ndarray:
+        """
+        Returns which rows stay in the game: the items that are alive and, for the asteroids
+        and bullets, still inside the screen.
+
+        Parameters:
+        - width (int): The width of the screen.
+        - height (int): The height of the screen.
+
+        Returns:
+        - numpy.ndarray: A boolean value for every row.
+        """
+        n = self.count
+        if n <= self.SCALAR_ROWS:
+            culled = self.CULLED_KINDS
+            return np.array([lives > 0 and not (kind in culled and (y < 0 or y > height or x < 0 or x > width))
+                             for x, y, lives, kind in zip(self.x[:n].tolist(), self.y[:n].tolist(), self.lives[:n].tolist(), self.kind[:n].tolist())],
+                            dtype=bool)
+        x = self.x[:n]
+        y = self.y[:n]
+        outside = (y < 0) | (y > height) | (x < 0) | (x > width)
+        return (self.lives[:n] > 0) & ~(outside & self.CULLED[self.kind[:n]])
+
+    def centers(self, rows: np.ndarray) -> tuple:
+        """
+        Returns the centers of the items in the given rows, in double precision for the collision checks.
+
+        Parameters:
+        - rows (numpy.ndarray): The rows of the items.
+
+        Returns:
+        - tuple: The arrays of the x-coordinates and y-coordinates of the centers.
+        """
+        return (self.x[rows] + self.offset_x[rows]).astype(np.float64), (self.y[rows] + self.offset_y[rows]).astype(np.float64)
+
+    def _grow(self):
+        """
+        Doubles the number of rows of every column.
+        """
+        capacity = len(self.x) * 2
+        for name in self.COLUMNS:
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
@@ -1,7 +1,12 @@
 import random
-import time
+from typing import TYPE_CHECKING
 from items.BaseItem import BaseItem
 from items.Bullet import TheirBullet
+from items.ItemConstants import ALIEN, OUR_BULLET, LOW, HIGH, layer_bit
+
+if TYPE_CHECKING:
+    from engine.ItemPool import ItemPool
+    from engine.WorldStore import WorldStore
 
 class Alien(BaseItem):
     """
@@ -10,84 +15,108 @@ class Alien(BaseItem):
     Inherits from the BaseItem class.
 
     Attributes:
-        change_direction_time (float): The time when the alien changes its direction.
         direction (int): The direction in which the alien is moving (-1 for left, 1 for right).
         width (int): The width of the alien.
         height (int): The height of the alien.
         name (str): The name of the alien.
 
     Args:
-        items (list): The list of items in the game.
+        store (WorldStore): The store that keeps the state of the alien.
         x (int): The initial x-coordinate of the alien.
         y (int): The initial y-coordinate of the alien.
         name (str): The name of the alien.
     """
 
-    change_direction_time = 0
-    direction = 1
+    __slots__ = ("direction", "name")
+    kind = ALIEN
+    layer = layer_bit(ALIEN)
+    mask = layer_bit(OUR_BULLET)
     width = 50
     height = 50
+    # The saucer is width wide and height / 2 high, the circle is as wide as the saucer.
+    collision_radius = width / 2
 
-    def __init__(self, items: list, x: int, y: int, name: str):
+    def __init__(self, store: "WorldStore", x: int, y: int, name: str):
         """
         Initializes a new instance of the Alien class.
 
         Args:
-            items (list): The list of items in the game.
+            store (WorldStore): The store that keeps the state of the alien.
             x (int): The initial x-coordinate of the alien.
             y (int): The initial y-coordinate of the alien.
             name (str): The name of the alien.
         """
-        super().__init__(items, x, y, 1)
+        super().__init__(store, x, y, 1)
+        self.direction = 1
         self.name = name
 
-    def draw(self, canvas):
+    def draw_at(self, canvas, x: float, y: float, tags=None, detail: int = HIGH):
         """
-        Draws the alien on the canvas.
+        Draws the alien on the canvas at the given position.
+        Below the HIGH level of detail it has no lights and no beam, at the LOW level no dome either.
 
         Args:
             canvas: The canvas on which to draw the alien.
+            x: The x-coordinate to draw the alien at.
+            y: The y-coordinate to draw the alien at.
+            tags: The canvas tags to give to the shapes of the alien.
+            detail: The level of detail, see QualityGovernor.
         """
-        body_top = canvas.create_oval(self.x, self.y, self.x + self.width, self.y + self.height // 2, fill='silver')
-        body_bottom = canvas.create_oval(self.x + self.width // 8, self.y + self.height // 4, self.x + self.width * 7 // 8, self.y + self.height * 3 // 4, fill='darkgrey')
+        body_top = canvas.create_oval(x, y, x + self.width, y + self.height // 2, fill='silver', tags=tags)
+        body_bottom = canvas.create_oval(x + self.width // 8, y + self.height // 4, x + self.width * 7 // 8, y + self.height * 3 // 4, fill='darkgrey', tags=tags)
+        if detail == LOW:
+            return
 
         dome_width = self.width // 4
         dome_height = self.height // 4
-        dome_x = self.x + self.width // 2 - dome_width // 2
-        dome_y = self.y - dome_height // 2
-        dome = canvas.create_oval(dome_x, dome_y, dome_x + dome_width, dome_y + dome_height, fill='lightblue')
+        dome_x = x + self.width // 2 - dome_width // 2
+        dome_y = y - dome_height // 2
+        dome = canvas.create_oval(dome_x, dome_y, dome_x + dome_width, dome_y + dome_height, fill='lightblue', tags=tags)
+        if detail < HIGH:
+            return
 
         for i in range(5):
-            light_x = self.x + self.width // 8 + (self.width * 3 // 4) * i // 5
-            light_y = self.y + self.height // 2 - 5
-            canvas.create_oval(light_x, light_y, light_x + 9, light_y + 11, fill='yellow')
-        beam = canvas.create_polygon(self.x + self.width // 4, self.y + self.height // 2, self.x + self.width * 3 // 4, self.y + self.height // 2, self.x + self.width // 2, self.y + self.height * 1.5, fill='lightyellow', stipple='gray50')
+            light_x = x + self.width // 8 + (self.width * 3 // 4) * i // 5
+            light_y = y + self.height // 2 - 5
+            canvas.create_oval(light_x, light_y, light_x + 9, light_y + 11, fill='yellow', tags=tags)
+        beam = canvas.create_polygon(x + self.width // 4, y + self.height // 2, x + self.width * 3 // 4, y + self.height // 2, x + self.width // 2, y + self.height * 1.5, fill='lightyellow', stipple='gray50', tags=tags)
 
-    def attack(self):
+    def attack(self, pool: "ItemPool", speed: float = 3) -> TheirBullet:
         """
-        Creates a bullet object and adds it to the list of items.
+        Takes a bullet from the pool and places it at the top center of the alien.
+
+        Args:
+            pool (ItemPool): The pool of the aliens' bullets.
+            speed (float): The vertical speed of the bullet.
 
-        The bullet is created at the top center of the alien.
+        Returns:
+            TheirBullet: The bullet, to be added to the game by the caller.
         """
-        bullet = TheirBullet(self.items, self.x + 20 - 3/2, self.y + 40, 3, 3)
-        self.items.append(bullet)
+        return pool.acquire(self.x + 20 - 3/2, self.y + 40, speed)
 
-    def move(self):
+    def move(self, scale: float = 1):
         """
-        Moves the alien horizontally across the screen.
+        Moves the alien horizontally across the screen, in its current direction.
 
-        The alien changes its direction randomly every 3 seconds.
+        Args:
+            scale (float): The factor to multiply the speed with, see SimulationClock.scale.
         """
         if self.x > 600:
             self.x = 0
         if self.x < 0:
             self.x = 600
 
-        if time.time() - self.change_direction_time > 3:
-            self.direction = random.choice([-1, 1])
-            self.change_direction_time = time.time()
+        self.x += 1 * self.direction * scale
 
-        self.x += 1 * self.direction
+    def change_direction(self, rng=random):
+        """
+        Picks a new random direction for the alien. Called by the world's Scheduler every
+        direction_change_interval seconds of simulation time.
+
+        Args:
+            rng: The random number generator used to pick the direction, the random module by default.
+        """
+        self.direction = rng.choice([-1, 1])
 
     def center_x(self) -> int:
         """
@@ -96,7 +125,7 @@ class Alien(BaseItem):
         Returns:
             int: The x-coordinate of the center of the alien.
         """
-        return self.x + 20
+        return self.x + self.width / 2
     
     def center_y(self) -> int:
         """
@@ -105,4 +134,4 @@ class Alien(BaseItem):
         Returns:
             int: The y-coordinate of the center of the alien.
         """
-        return self.y
\ No newline at end of file
+        return self.y + self.height / 4
\ No newline at end of file
@@ -1,4 +1,9 @@
+from typing import TYPE_CHECKING
 from items.BaseItem import BaseItem
+from items.ItemConstants import SHIP, ASTEROID, OUR_BULLET, LOW, HIGH, layer_bit
+
+if TYPE_CHECKING:
+    from engine.WorldStore import WorldStore
 
 class Asteroid(BaseItem):
     """
@@ -13,43 +18,56 @@ class Asteroid(BaseItem):
     - y: The y-coordinate of the asteroid's position.
 
     Methods:
-    - __init__(items: list, x: int, y: int, speed): Initializes the Asteroid object.
-    - draw(canvas): Draws the asteroid on the canvas.
-    - move(): Moves the asteroid vertically.
+    - __init__(store: WorldStore, x: int, y: int, speed): Initializes the Asteroid object.
+    - draw_at(canvas, x, y, tags, detail): Draws the asteroid on the canvas at the given position.
+    - move(): Moves the asteroid vertically. All the asteroids are moved at once by WorldStore.advance().
     - center_x() -> int: Returns the x-coordinate of the center of the asteroid.
     - center_y() -> int: Returns the y-coordinate of the center of the asteroid.
     """
 
+    __slots__ = ()
+    kind = ASTEROID
+    layer = layer_bit(ASTEROID)
+    mask = layer_bit(SHIP) | layer_bit(OUR_BULLET)
     diameter = 35
+    collision_radius = diameter / 2
 
-    def __init__(self, items: list, x: int, y: int, speed):
+    def __init__(self, store: "WorldStore", x: int, y: int, speed):
         """
         Initializes the Asteroid object.
 
         Parameters:
-        - items: A list of items in the game.
+        - store: The store that keeps the state of the asteroid.
         - x: The x-coordinate of the asteroid's position.
         - y: The y-coordinate of the asteroid's position.
         - speed: The speed at which the asteroid moves.
         """
-        super().__init__(items, x, y, 1)
-        self.speed = speed
+        super().__init__(store, x, y, 1, speed)
 
-    def draw(self, canvas):
+    def draw_at(self, canvas, x: float, y: float, tags=None, detail: int = HIGH):
         """
-        Draws the asteroid on the canvas.
+        Draws the asteroid on the canvas at the given position. At the LOW level of detail it has no crater.
 
         Parameters:
         - canvas: The canvas on which the asteroid is drawn.
+        - x: The x-coordinate to draw the asteroid at.
+        - y: The y-coordinate to draw the asteroid at.
+        - tags: The canvas tags to give to the shapes of the asteroid.
+        - detail: The level of detail, see QualityGovernor.
         """
-        canvas.create_oval(self.x, self.y, self.x + self.diameter, self.y + self.diameter, fill='grey')
-        canvas.create_oval(self.x + self.diameter // 6, self.y + self.diameter // 6, self.x + self.diameter * 3 // 6, self.y + self.diameter * 3 // 6, fill='darkgrey') 
+        canvas.create_oval(x, y, x + self.diameter, y + self.diameter, fill='grey', tags=tags)
+        if detail == LOW:
+            return
+        canvas.create_oval(x + self.diameter // 6, y + self.diameter // 6, x + self.diameter * 3 // 6, y + self.diameter * 3 // 6, fill='darkgrey', tags=tags)
 
-    def move(self):
+    def move(self, scale: float = 1):
         """
         Moves the asteroid vertically.
+
+        Parameters:
+        - scale: The factor to multiply the speed with, see SimulationClock.scale.
         """
-        self.y += self.speed
+        self.y += self.speed * scale
 
     def center_x(self) -> int:
         """
@@ -58,7 +76,7 @@ class Asteroid(BaseItem):
         Returns:
         - The x-coordinate of the center of the asteroid.
         """
-        return self.x + 20
+        return self.x + self.diameter / 2
     
     def center_y(self) -> int:
         """
@@ -67,4 +85,4 @@ class Asteroid(BaseItem):
         Returns:
         - The y-coordinate of the center of the asteroid.
         """
-        return self.y + 30
\ No newline at end of file
+        return self.y + self.diameter / 2
\ No newline at end of file
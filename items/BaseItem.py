@@ -1,47 +1,140 @@
-from tkinter import Canvas
+from typing import TYPE_CHECKING
+from items.ItemConstants import HIGH
+
+if TYPE_CHECKING:
+    from tkinter import Canvas
+    from engine.WorldStore import WorldStore
 
 class BaseItem:
     """
     Represents a base item in the game.
 
+    The position, speed and lives of the item are kept in a row of the WorldStore,
+    the item itself is a thin view over that row. The item classes declare __slots__,
+    so an item only holds the slots of its class and no __dict__.
+
     Attributes:
-        items (list): A list of items in the game.
-        x (int): The x-coordinate of the item.
-        y (int): The y-coordinate of the item.
+        kind (int): The kind of the item in the WorldStore, set by the derived classes.
+        layer (int): The collision layer of the item, a single bit.
+        mask (int): The collision layers the item interacts with. Pairs whose layers are not in each other's masks never collide.
+        collision_radius (float): The radius of the item for the collision check, around its center.
+        store (WorldStore): The store that keeps the state of the item.
+        row (int): The row of the item in the store.
+        x (float): The x-coordinate of the item.
+        y (float): The y-coordinate of the item.
+        speed (float): The vertical speed of the item.
         lives (int): The number of lives the item has.
     """
 
-    items: list
-    x: int
-    y: int
-    lives: int
+    __slots__ = ("store", "row")
 
-    def __init__(self, items: list, x: int, y: int, lives: int):
+    kind: int
+    layer = 0
+    mask = 0
+    collision_radius = 10
+    store: "WorldStore"
+    row: int
+
+    def __init__(self, store: "WorldStore", x: int, y: int, lives: int, speed: float = 0):
         """
         Initializes a new instance of the BaseItem class.
 
+        Derived classes must set the attributes used by center_x() and center_y() before calling this method.
+
+        Args:
+            store (WorldStore): The store that keeps the state of the item.
+            x (int): The x-coordinate of the item.
+            y (int): The y-coordinate of the item.
+            lives (int): The number of lives the item has.
+            speed (float): The vertical speed of the item, moved by WorldStore.advance().
+        """
+        self.store = store
+        self.place(x, y, lives, speed)
+
+    def place(self, x: int, y: int, lives: int, speed: float = 0):
+        """
+        Allocates a new row in the store for the item. Used when the item is created and when an
+        item from an ItemPool is reused, after its previous row was released.
+
         Args:
-            items (list): A list of items in the game.
             x (int): The x-coordinate of the item.
             y (int): The y-coordinate of the item.
             lives (int): The number of lives the item has.
+            speed (float): The vertical speed of the item.
+        """
+        store = self.store
+        self.row = store.allocate(self.kind, x, y, speed, lives)
+        store.offset_x[self.row] = self.center_x() - x
+        store.offset_y[self.row] = self.center_y() - y
+
+    @property
+    def x(self) -> float:
+        return self.store.x[self.row]
+
+    @x.setter
+    def x(self, value: float):
+        self.store.x[self.row] = value
+
+    @property
+    def y(self) -> float:
+        return self.store.y[self.row]
+
+    @y.setter
+    def y(self, value: float):
+        self.store.y[self.row] = value
+
+    @property
+    def speed(self) -> float:
+        return self.store.speed[self.row]
+
+    @speed.setter
+    def speed(self, value: float):
+        self.store.speed[self.row] = value
+
+    @property
+    def lives(self) -> int:
+        return int(self.store.lives[self.row])
+
+    @lives.setter
+    def lives(self, value: int):
+        self.store.lives[self.row] = value
+
+    def draw(self, canvas: "Canvas", tags=None, detail: int = HIGH):
+        """
+        Draws the item on the canvas at its current position.
+
+        Args:
+            canvas (Canvas): The canvas object to draw on.
+            tags: The canvas tags to give to the shapes of the item.
+            detail (int): The level of detail, see QualityGovernor.
+        """
+        self.draw_at(canvas, self.x, self.y, tags, detail)
+
+    def sprite_key(self) -> tuple:
+        """
+        Returns the key of the sprite of the item in the SpriteCache. Items with the same key look the same.
+
+        Returns:
+            tuple: The key, the class of the item. Derived classes add the attributes that change their look.
         """
-        self.x = x
-        self.y = y
-        self.items = items
-        self.lives = lives
+        return (type(self),)
 
-    def draw(self, canvas: Canvas):
+    def draw_at(self, canvas: "Canvas", x: float, y: float, tags=None, detail: int = HIGH):
         """
-        Draws the item on the canvas.
+        Draws the item on the canvas at the given position. Below the HIGH level of detail,
+        derived classes leave out the shapes that matter least.
 
         Args:
             canvas (Canvas): The canvas object to draw on.
+            x (float): The x-coordinate to draw the item at.
+            y (float): The y-coordinate to draw the item at.
+            tags: The canvas tags to give to the shapes of the item.
+            detail (int): The level of detail, see QualityGovernor.
 
         Raises:
             NotImplementedError: This method must be implemented in derived classes.
         """
-        raise NotImplementedError("Draw method must be implemented in derived classes")
+        raise NotImplementedError("draw_at method must be implemented in derived classes")
     
     def center_x(self) -> int:
         """
@@ -74,10 +167,10 @@ class BaseItem:
         Returns:
             bool: True if the item is alive, False otherwise.
         """
-        return self.lives > 0
+        return self.store.lives[self.row] > 0
     
     def kill(self):
         """
         Decreases the number of lives of the item by 1.
         """
-        self.lives -= 1
\ No newline at end of file
+        self.store.lives[self.row] -= 1
@@ -1,5 +1,10 @@
-from tkinter import Canvas
+from typing import TYPE_CHECKING
 from items.BaseItem import BaseItem
+from items.ItemConstants import SHIP, ALIEN, ASTEROID, OUR_BULLET, THEIR_BULLET, HIGH, layer_bit
+
+if TYPE_CHECKING:
+    from tkinter import Canvas
+    from engine.WorldStore import WorldStore
 
 
 class Bullet(BaseItem):
@@ -9,48 +14,67 @@ class Bullet(BaseItem):
     Inherits from the BaseItem class.
 
     Attributes:
-    - items (list): A list of all items in the game.
     - x (int): The x-coordinate of the bullet.
     - y (int): The y-coordinate of the bullet.
     - radius (int): The radius of the bullet.
     - speed (int): The speed at which the bullet moves.
 
     Methods:
-    - move(): Moves the bullet vertically.
-    - draw(canvas: Canvas): Draws the bullet on the canvas.
+    - move(): Moves the bullet vertically. All the bullets are moved at once by WorldStore.advance().
+    - sprite_key() -> tuple: Returns the key of the sprite of the bullet.
+    - draw_at(canvas: Canvas, x, y, tags, detail): Draws the bullet on the canvas at the given position.
     - center_x() -> int: Returns the x-coordinate of the center of the bullet.
     - center_y() -> int: Returns the y-coordinate of the center of the bullet.
     """
 
-    def __init__(self, items: list, x: int, y: int, radius: int, speed: int):
+    __slots__ = ("radius",)
+    # The radius the bullets of the game are fired and drawn with.
+    collision_radius = 3
+
+    def __init__(self, store: "WorldStore", x: int, y: int, radius: int, speed: int):
         """
         Initializes a new instance of the Bullet class.
 
         Parameters:
-        - items (list): A list of all items in the game.
+        - store (WorldStore): The store that keeps the state of the bullet.
         - x (int): The x-coordinate of the bullet.
         - y (int): The y-coordinate of the bullet.
         - radius (int): The radius of the bullet.
         - speed (int): The speed at which the bullet moves.
         """
-        super().__init__(items, x, y, 1)
         self.radius = radius
-        self.speed = speed
+        super().__init__(store, x, y, 1, speed)
 
-    def move(self):
+    def move(self, scale: float = 1):
         """
         Moves the bullet vertically.
+
+        Parameters:
+        - scale (float): The factor to multiply the speed with, see SimulationClock.scale.
         """
-        self.y += self.speed
+        self.y += self.speed * scale
 
-    def draw(self, canvas: Canvas):
+    def sprite_key(self) -> tuple:
         """
-        Draws the bullet on the canvas.
+        Returns the key of the sprite of the bullet, which depends on its radius.
+
+        Returns:
+        - tuple: The class and the radius of the bullet.
+        """
+        return (type(self), self.radius)
+
+    def draw_at(self, canvas: "Canvas", x: float, y: float, tags=None, detail: int = HIGH):
+        """
+        Draws the bullet on the canvas at the given position. A bullet is a single shape at every level of detail.
 
         Parameters:
         - canvas (Canvas): The canvas on which to draw the bullet.
+        - x: The x-coordinate to draw the bullet at.
+        - y: The y-coordinate to draw the bullet at.
+        - tags: The canvas tags to give to the shape of the bullet.
+        - detail: The level of detail, see QualityGovernor.
         """
-        canvas.create_oval(self.x - self.radius, self.y - self.radius, self.x + self.radius, self.y + self.radius, fill="red")
+        canvas.create_oval(x - self.radius, y - self.radius, x + self.radius, y + self.radius, fill="red", tags=tags)
 
     def center_x(self) -> int:
         """
@@ -77,18 +101,23 @@ class OurBullet(Bullet):
     Inherits from the Bullet class.
     """
 
-    def __init__(self, items: list, x: int, y: int, radius: int, speed: int):
+    __slots__ = ()
+    kind = OUR_BULLET
+    layer = layer_bit(OUR_BULLET)
+    mask = layer_bit(ASTEROID) | layer_bit(ALIEN)
+
+    def __init__(self, store: "WorldStore", x: int, y: int, radius: int, speed: int):
         """
         Initializes a new instance of the OurBullet class.
 
         Parameters:
-        - items (list): A list of all items in the game.
+        - store (WorldStore): The store that keeps the state of the bullet.
         - x (int): The x-coordinate of the bullet.
         - y (int): The y-coordinate of the bullet.
         - radius (int): The radius of the bullet.
         - speed (int): The speed at which the bullet moves.
         """
-        super().__init__(items, x, y, radius, speed)
+        super().__init__(store, x, y, radius, speed)
 
 class TheirBullet(Bullet):
     """
@@ -97,15 +126,20 @@ class TheirBullet(Bullet):
     Inherits from the Bullet class.
     """
 
-    def __init__(self, items: list, x: int, y: int, radius: int, speed: int):
+    __slots__ = ()
+    kind = THEIR_BULLET
+    layer = layer_bit(THEIR_BULLET)
+    mask = layer_bit(SHIP)
+
+    def __init__(self, store: "WorldStore", x: int, y: int, radius: int, speed: int):
         """
         Initializes a new instance of the TheirBullet class.
 
         Parameters:
-        - items (list): A list of all items in the game.
+        - store (WorldStore): The store that keeps the state of the bullet.
         - x (int): The x-coordinate of the bullet.
         - y (int): The y-coordinate of the bullet.
         - radius (int): The radius of the bullet.
         - speed (int): The speed at which the bullet moves.
         """
-        super().__init__(items, x, y, radius, speed)
+        super().__init__(store, x, y, radius, speed)
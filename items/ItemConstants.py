@@ -0,0 +1,24 @@
+# The kinds of the game items: the kind of their rows in the WorldStore and the index of their class in GameWorld.ITEM_CLASSES.
+SHIP = 0
+ALIEN = 1
+ASTEROID = 2
+OUR_BULLET = 3
+THEIR_BULLET = 4
+
+# The levels of detail the items are drawn at, chosen by the QualityGovernor.
+LOW = 0
+MEDIUM = 1
+HIGH = 2
+
+
+def layer_bit(kind: int) -> int:
+    """
+    Returns the collision layer bit of a kind, used to build the collision masks of the item classes.
+
+    Parameters:
+    - kind (int): The kind of the items.
+
+    Returns:
+    - int: The bit of the kind.
+    """
+    return 1 << kind
@@ -1,6 +1,12 @@
-from tkinter import Canvas
+from typing import TYPE_CHECKING
 from items.BaseItem import BaseItem
 from items.Bullet import OurBullet
+from items.ItemConstants import SHIP, ASTEROID, THEIR_BULLET, LOW, HIGH, layer_bit
+
+if TYPE_CHECKING:
+    from tkinter import Canvas
+    from engine.ItemPool import ItemPool
+    from engine.WorldStore import WorldStore
 
 class SpaceShip(BaseItem):
     """
@@ -13,51 +19,76 @@ class SpaceShip(BaseItem):
     - height (int): The height of the spaceship.
 
     Methods:
-    - __init__(items: list, x: int, y: int, width: int, height: int): Initializes a new instance of the SpaceShip class.
-    - draw(canvas: Canvas): Draws the spaceship on the canvas.
+    - __init__(store: WorldStore, x: int, y: int, width: int, height: int): Initializes a new instance of the SpaceShip class.
+    - sprite_key() -> tuple: Returns the key of the sprite of the spaceship.
+    - draw_at(canvas: Canvas, x, y, tags, detail): Draws the spaceship on the canvas at the given position.
     - move(): Moves the spaceship.
-    - attack(): Performs an attack action by creating a bullet.
+    - attack(pool, speed): Performs an attack action by taking a bullet from the pool.
     - center_x() -> int: Returns the x-coordinate of the center of the spaceship.
     - center_y() -> int: Returns the y-coordinate of the center of the spaceship.
     """
 
+    __slots__ = ("width", "height")
+    kind = SHIP
+    layer = layer_bit(SHIP)
+    mask = layer_bit(ASTEROID) | layer_bit(THEIR_BULLET)
+    # Half the width of the 50 x 50 spaceship of the game, around the middle of its body.
+    collision_radius = 25
     width: int
     height: int
 
-    def __init__(self, items: list, x: int, y: int, width: int, height: int):
+    def __init__(self, store: "WorldStore", x: int, y: int, width: int, height: int):
         """
         Initializes a new instance of the SpaceShip class.
 
         Parameters:
-        - items (list): The list of items in the game.
+        - store (WorldStore): The store that keeps the state of the spaceship.
         - x (int): The x-coordinate of the spaceship.
         - y (int): The y-coordinate of the spaceship.
         - width (int): The width of the spaceship.
         - height (int): The height of the spaceship.
         """
-        super().__init__(items, x, y, 3)
         self.width = width
         self.height = height
+        super().__init__(store, x, y, 3)
+
 
+    def sprite_key(self) -> tuple:
+        """
+        Returns the key of the sprite of the spaceship, which depends on its size.
+
+        Returns:
+        - tuple: The class, the width and the height of the spaceship.
+        """
+        return (type(self), self.width, self.height)
 
-    def draw(self, canvas: Canvas):
+    def draw_at(self, canvas: "Canvas", x: float, y: float, tags=None, detail: int = HIGH):
         """
-        Draws the spaceship on the canvas.
+        Draws the spaceship on the canvas at the given position.
+        Below the HIGH level of detail it has no flame, at the LOW level it is its hull only.
 
         Parameters:
         - canvas (Canvas): The canvas to draw on.
+        - x: The x-coordinate to draw the spaceship at.
+        - y: The y-coordinate to draw the spaceship at.
+        - tags: The canvas tags to give to the shapes of the spaceship.
+        - detail: The level of detail, see QualityGovernor.
         """
-        canvas.create_polygon(self.x, self.y, self.x + self.width // 2, self.y - self.height, self.x + self.width, self.y, fill='grey')
+        canvas.create_polygon(x, y, x + self.width // 2, y - self.height, x + self.width, y, fill='grey', tags=tags)
+        if detail == LOW:
+            return
 
         cockpit_width = self.width // 4
         cockpit_height = self.height // 4
-        cockpit_x = self.x + self.width // 2 - cockpit_width // 2
-        cockpit_y = self.y - self.height // 2
-        canvas.create_oval(cockpit_x, cockpit_y, cockpit_x + cockpit_width, cockpit_y + cockpit_height, fill='blue')
+        cockpit_x = x + self.width // 2 - cockpit_width // 2
+        cockpit_y = y - self.height // 2
+        canvas.create_oval(cockpit_x, cockpit_y, cockpit_x + cockpit_width, cockpit_y + cockpit_height, fill='blue', tags=tags)
 
-        canvas.create_polygon(self.x, self.y, self.x - self.width // 2, self.y + self.height // 2, self.x, self.y + self.height // 2, fill='red')
-        canvas.create_polygon(self.x + self.width, self.y, self.x + self.width * 1.5, self.y + self.height // 2, self.x + self.width, self.y + self.height // 2, fill='red')
-        canvas.create_polygon(self.x + self.width // 4, self.y, self.x + 3 * self.width // 4, self.y, self.x + self.width // 2, self.y + self.height // 2, fill='orange')
+        canvas.create_polygon(x, y, x - self.width // 2, y + self.height // 2, x, y + self.height // 2, fill='red', tags=tags)
+        canvas.create_polygon(x + self.width, y, x + self.width * 1.5, y + self.height // 2, x + self.width, y + self.height // 2, fill='red', tags=tags)
+        if detail < HIGH:
+            return
+        canvas.create_polygon(x + self.width // 4, y, x + 3 * self.width // 4, y, x + self.width // 2, y + self.height // 2, fill='orange', tags=tags)
 
 
     def move(self):
@@ -66,12 +97,18 @@ class SpaceShip(BaseItem):
         """
         pass
 
-    def attack(self):
+    def attack(self, pool: "ItemPool", speed: float = -5) -> OurBullet:
         """
-        Performs an attack action by creating a bullet.
+        Performs an attack action by taking a bullet from the pool.
+
+        Parameters:
+        - pool (ItemPool): The pool of the player's bullets.
+        - speed (float): The vertical speed of the bullet.
+
+        Returns:
+        - OurBullet: The bullet, to be added to the game by the caller.
         """
-        bullet = OurBullet(self.items, self.x + self.width / 2 - 3/2, self.y - 3/2, 3, -5)
-        self.items.append(bullet)
+        return pool.acquire(self.x + self.width / 2 - 3/2, self.y - 3/2, speed)
 
     def center_x(self) -> int:
         """
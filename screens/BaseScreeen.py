@@ -1,15 +1,38 @@
 from tkinter import Canvas
+from engine.QualityGovernor import HIGH
 
 
 class BaseScreen:
     """
     Represents a base screen for a game.
 
+    The static content of a screen is created once by draw_static() and kept on the canvas. It is only
+    deleted and created again when the screen is invalidated, on a resize of the canvas or when a state
+    change of the screen calls invalidate(). State that changes often, like a typed name or a scroll
+    position, is better applied to the existing canvas items in draw().
+
     Attributes:
+        TAG (str): The tag of the canvas items created by draw_static().
         canvas (Canvas): The canvas object to draw on.
+        retained (bool): True if the screen keeps its canvas items between frames,
+            False if the canvas is cleared before every draw().
+        dirty (bool): True if the static content has to be created again in the next frame.
+        width (int): The width of the canvas, updated on resize.
+        height (int): The height of the canvas, updated on resize.
+        detail (int): The level of detail to draw at, set by the QualityGovernor of the MainFrame.
+        settled (bool): True if the screen looks the same until the simulation ticks again or the screen
+            is invalidated, so the MainFrame can skip drawing it. Animated screens set it to False.
     """
 
+    TAG = "static"
+
     canvas: Canvas
+    retained = True
+    dirty = True
+    width: int
+    height: int
+    detail = HIGH
+    settled = True
 
     def __init__(self, canvas: Canvas):
         """
@@ -19,6 +42,8 @@ class BaseScreen:
             canvas (Canvas): The canvas object to draw on.
         """
         self.canvas = canvas
+        self.width = canvas.winfo_width()
+        self.height = canvas.winfo_height()
 
     def update(self):
         """
@@ -28,18 +53,47 @@ class BaseScreen:
 
     def draw(self):
         """
-        Draws the screen.
+        Draws the screen. Creates the static content again if the screen was invalidated.
+
+        Unless the screen is retained, the canvas is cleared before every call.
+        """
+        if self.dirty or not self.retained:
+            self.dirty = False
+            self.canvas.delete(self.TAG)
+            self.draw_static()
+
+    def draw_static(self):
+        """
+        Creates the canvas items of the static content of the screen, tagged with TAG.
         """
         pass
 
+    def invalidate(self):
+        """
+        Marks the static content to be created again in the next frame.
+        """
+        self.dirty = True
+
+    def on_resize(self, event):
+        """
+        Handles the <Configure> event of the canvas: remembers its new size and invalidates the screen.
+
+        Args:
+            event: The configure event, with the new width and height of the canvas.
+        """
+        if event.width != self.width or event.height != self.height:
+            self.width = event.width
+            self.height = event.height
+            self.invalidate()
+
     def bind_keys(self):
         """
         Binds the necessary keys for the screen.
         """
         pass
-    
+
     def unbind_keys(self):
         """
         Unbinds the keys bound to the screen.
         """
-        pass
\ No newline at end of file
+        pass
@@ -10,10 +10,13 @@ class CreditScreen(BaseScreen):
     - canvas: The canvas object on which the screen is drawn.
     - show_welcome: A function that shows the welcome screen.
     - title_y: The y-coordinate of the title text.
+    - clock: The simulation clock that drives the screen.
+    - shown_y: The y-coordinate the title text is currently shown at.
 
     Methods:
-    - __init__(self, canvas, show_welcome): Initializes the CreditScreen object.
-    - draw(self): Draws the credit screen on the canvas.
+    - __init__(self, canvas, show_welcome, clock): Initializes the CreditScreen object.
+    - draw_static(self): Draws the credit screen on the canvas.
+    - draw(self): Scrolls the credit text to the current position.
     - update(self): Updates the position of the title text.
     - bind_keys(self): Binds the 'b' key to the show_welcome function.
     - unbind_keys(self): Unbinds the 'b' key from the show_welcome function.
@@ -21,33 +24,47 @@ class CreditScreen(BaseScreen):
 
     show_welcome = None
     title_y = 0
+    shown_y = 0
 
-    def __init__(self, canvas, show_welcome):
+    def __init__(self, canvas, show_welcome, clock):
         """
         Initializes the CreditScreen object.
 
         Parameters:
         - canvas: The canvas object on which the screen is drawn.
         - show_welcome: A function that shows the welcome screen.
+        - clock: The simulation clock that drives the screen.
         """
         super().__init__(canvas)
         self.show_welcome = show_welcome
-        self.title_y = self.canvas.winfo_height()
+        self.clock = clock
+        self.title_y = self.height
 
-    def draw(self):
+    def draw_static(self):
         """
-        Draws the credit screen on the canvas.
+        Draws the credit screen on the canvas, at the current position of the title text.
         """
-        center_x = self.canvas.winfo_width() / 2        
+        center_x = self.width / 2
         title_gap = 50
-        self.canvas.create_text(center_x, self.title_y + 0 * title_gap, text="Developed by:", font=("Helvetica", 30))
-        self.canvas.create_text(center_x, self.title_y + 1 * title_gap, text="Anna Glushchenko", font=("Helvetica", 30))
+        self.shown_y = self.title_y
+        self.canvas.create_text(center_x, self.shown_y + 0 * title_gap, text="Developed by:", font=("Helvetica", 30), tags=self.TAG)
+        self.canvas.create_text(center_x, self.shown_y + 1 * title_gap, text="Anna Glushchenko", font=("Helvetica", 30), tags=self.TAG)
+
+    def draw(self):
+        """
+        Draws the credit screen, and moves the text to the current position of the title instead of creating it again.
+        """
+        super().draw()
+        title_y = self.title_y
+        if title_y != self.shown_y:
+            self.canvas.move(self.TAG, 0, title_y - self.shown_y)
+            self.shown_y = title_y
 
     def update(self):
         """
         Updates the position of the title text.
         """
-        self.title_y -= 1
+        self.title_y -= 1 * self.clock.scale
         if self.title_y < 0:
             self.show_welcome()
 
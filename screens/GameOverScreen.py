@@ -10,11 +10,17 @@ class GameOverScreen(BaseScreen):
     Attributes:
     - score (int): The player's score.
     - name (str): The player's name.
-    - high_scores (HighScores): An instance of the HighScores class.
+    - high_scores (HighScores): The high scores backend, a HighScores text file or a Leaderboard database.
+    - rank (int): The rank of the score among all the scores played before.
+    - percentile (float): The percentage of the scores played before that are below the score.
+    - played (int): The number of scores played before.
+    - name_text (int): The canvas item showing the typed name.
+    - shown_name (str): The name currently shown on the canvas.
 
     Methods:
-    - __init__(self, canvas, score, show_high_scores): Initializes the GameOverScreen object.
-    - draw(self): Draws the game over screen.
+    - __init__(self, canvas, score, show_high_scores, high_scores): Initializes the GameOverScreen object.
+    - draw_static(self): Draws the game over screen.
+    - draw(self): Updates the typed name on the canvas.
     - on_key_press(self, event): Handles key press events.
     - bind_keys(self): Binds key events to the canvas.
     - unbind_keys(self): Unbinds key events from the canvas.
@@ -22,9 +28,14 @@ class GameOverScreen(BaseScreen):
 
     score = 0
     name = ""
-    high_scores = HighScores()
-
-    def __init__(self, canvas, score, show_high_scores):
+    high_scores: HighScores = None
+    rank = 1
+    percentile = 100.0
+    played = 0
+    name_text = None
+    shown_name = None
+
+    def __init__(self, canvas, score, show_high_scores, high_scores: HighScores):
         """
         Initializes the GameOverScreen object.
 
@@ -32,26 +43,36 @@ class GameOverScreen(BaseScreen):
         - canvas: The canvas on which to draw the screen.
         - score (int): The player's score.
         - show_high_scores (function): A function to show the high scores screen.
+        - high_scores: The high scores shared with the other screens, a HighScores text file or a Leaderboard database.
         """
         super().__init__(canvas)
         self.score = score
         self.show_high_scores = show_high_scores
+        self.high_scores = high_scores
+        self.high_scores.load()
+        self.rank = high_scores.rank(score)
+        self.percentile = high_scores.percentile(score)
+        self.played = len(high_scores.index)
 
 
-    def draw(self):
+    def draw_static(self):
         """
-        Draws the game over screen.
+        Draws the game over screen. It is created once and kept until the canvas is resized.
         """
-        center_x = self.canvas.winfo_width() / 2
+        center_x = self.width / 2
         game_over_y = 100
         game_over_gap = 50
         enter_your_name_y = 300
         enter_your_name_gap = 40
 
-        self.canvas.create_text(center_x, game_over_y + 0 * game_over_gap, text="Game Over", font=("Helvetica", 30))
-        self.canvas.create_text(center_x, game_over_y + 1 * game_over_gap, text=f"Your score is {self.score}", font=("Helvetica", 20))
+        self.canvas.create_text(center_x, game_over_y + 0 * game_over_gap, text="Game Over", font=("Helvetica", 30), tags=self.TAG)
+        self.canvas.create_text(center_x, game_over_y + 1 * game_over_gap, text=f"Your score is {self.score}", font=("Helvetica", 20), tags=self.TAG)
+        if self.played > 0:
+            self.canvas.create_text(center_x, game_over_y + 2 * game_over_gap,
+                                    text=f"Rank {self.rank} of {self.played + 1}, better than {self.percentile:.1f}% of all scores",
+                                    font=("Helvetica", 15), tags=self.TAG)
 
-        self.canvas.create_text(center_x, enter_your_name_y + 0 * enter_your_name_gap, text="Please enter your name and press Enter", font=("Helvetica", 15))
+        self.canvas.create_text(center_x, enter_your_name_y + 0 * enter_your_name_gap, text="Please enter your name and press Enter", font=("Helvetica", 15), tags=self.TAG)
 
         box_font_size = 20
         box_width = 300
@@ -61,8 +82,18 @@ class GameOverScreen(BaseScreen):
         box_top = enter_your_name_y + 1 * enter_your_name_gap - box_font_size
         box_bottom = enter_your_name_y + 1 * enter_your_name_gap + box_height - box_font_size
 
-        self.canvas.create_polygon(box_left, box_top, box_right, box_top, box_right, box_bottom, box_left, box_bottom, fill="white", outline="black")
-        self.canvas.create_text(center_x, enter_your_name_y + 1 * enter_your_name_gap, text=self.name, font=("Helvetica", box_font_size, "bold"))
+        self.canvas.create_polygon(box_left, box_top, box_right, box_top, box_right, box_bottom, box_left, box_bottom, fill="white", outline="black", tags=self.TAG)
+        self.name_text = self.canvas.create_text(center_x, enter_your_name_y + 1 * enter_your_name_gap, text=self.name, font=("Helvetica", box_font_size, "bold"), tags=self.TAG)
+        self.shown_name = self.name
+
+    def draw(self):
+        """
+        Draws the game over screen, and updates the typed name on the canvas when it changed.
+        """
+        super().draw()
+        if self.name != self.shown_name:
+            self.canvas.itemconfigure(self.name_text, text=self.name)
+            self.shown_name = self.name
 
 
     def on_key_press(self, event):
@@ -1,217 +1,193 @@
 import random
 import time
-from tkinter import Canvas
 from screens.BaseScreeen import BaseScreen
-from items.Alien import Alien
-from items.Asteroid import Asteroid
-from items.Bullet import Bullet, OurBullet, TheirBullet
-from items.SpaceShip import SpaceShip
+from engine.GameWorld import GameWorld
+from engine.InputQueue import InputQueue
+from engine.Profiler import Profiler
+from engine.ReplayRecorder import ReplayRecorder
+from engine.Scene import Scene
+from engine.SpriteCache import SpriteCache
+from engine.SimulationClock import SimulationClock
 
 class GameScreen(BaseScreen):
     """
     Represents the game screen where the gameplay takes place.
     Inherits from the BaseScreen class.
 
+    The rules of the game live in the GameWorld, the screen connects it to the canvas and the keyboard.
+    The world is always created with a known seed, so the match can be recorded and replayed exactly.
+
     Attributes:
-    - game_items: A list to store all the game items (spaceship, bullets, asteroids, aliens).
-    - ship: The player's spaceship object.
-    - bullet_created_time: The time when the last bullet was created.
-    - asteroid_created_time: The time when the last asteroid was created.
-    - alien_created_time: The time when the last alien was created.
-    - up_pressed: A boolean indicating if the up arrow key is pressed.
-    - down_pressed: A boolean indicating if the down arrow key is pressed.
-    - left_pressed: A boolean indicating if the left arrow key is pressed.
-    - right_pressed: A boolean indicating if the right arrow key is pressed.
-    - score: The player's score.
-    - game_over: A callback function to be called when the game is over.
+    - world: The GameWorld that holds the game items and runs the rules of the game.
+    - seed: The seed the world was created with.
+    - follow_width: True if the viewport of the world follows the width of the canvas.
+    - interpolate: True to draw the entities between their positions of the last two ticks.
+    - settled: True if the last frame showed the latest tick fully, so nothing moves until the next tick.
+    - profiler: The Profiler that records the drawing phases while it is enabled, or None.
+    - input_queue: The InputQueue that carries the key events to the world, drained by the simulation thread.
+    - recorder: The ReplayRecorder that records the match, or None.
+    - scene: The retained scene that keeps the canvas items of the game items between frames.
+    - score_text: The canvas item showing the score.
+    - lives_text: The canvas item showing the lives.
+    - shown_hud: The score and lives currently shown on the canvas.
 
     Methods:
-    - __init__(self, canvas, game_over): Initializes the GameScreen object.
-    - draw(self): Draws the game items on the canvas.
+    - __init__(self, canvas, game_over, clock, profiler, record_path, seed, world): Initializes the GameScreen object.
+    - draw(self): Updates the canvas items of the game items, the score and the lives.
+    - hud(self, snapshot): Returns the two lines of the head-up display.
     - update(self): Updates the game state.
-    - on_arrow_press(self, event): Handles the arrow key press events.
-    - on_arrow_release(self, event): Handles the arrow key release events.
-    - on_space_press(self, event): Handles the space key press event.
+    - on_key_press(self, event): Pushes a key press into the input queue.
+    - on_key_release(self, event): Pushes a key release into the input queue.
     - bind_keys(self): Binds the keyboard events to the canvas.
     - unbind_keys(self): Unbinds the keyboard events from the canvas.
     """
-    game_items = []
-    ship: SpaceShip
-    bullet_created_time = time.time()
-    asteroid_created_time = time.time()
-    alien_created_time = time.time()
-
-    up_pressed = False
-    down_pressed = False
-    left_pressed = False
-    right_pressed = False
-
-    score = 0
-    game_over = None
-
-    def __init__(self, canvas, game_over):
+    world: GameWorld
+    seed: int = None
+    follow_width = True
+    interpolate = True
+    profiler: Profiler = None
+    input_queue: InputQueue
+    recorder: ReplayRecorder = None
+    scene: Scene
+    score_text = None
+    lives_text = None
+    shown_hud = None
+
+    def __init__(self, canvas, game_over, clock: SimulationClock, profiler: Profiler = None, record_path: str = None, seed: int = None,
+                 world: GameWorld = None):
         """
         Initializes the GameScreen object.
 
         Parameters:
         - canvas: The tkinter Canvas object where the game will be displayed.
         - game_over: A callback function to be called when the game is over.
-        - score: The player's score.
-        - game_items: A list to store all the game items (spaceship, bullets, asteroids, aliens).
-        - ship: The player's spaceship object.
+        - clock: The simulation clock that drives the game.
+        - profiler: The Profiler to record the update and drawing phases into, or None.
+        - record_path: The path of the replay file to record the match into, or None.
+        - seed: The seed of the world, None for a random one.
+        - world: A world to show instead of a new one, created with the given seed and played by its owner,
+          not by the keyboard. The game_over and clock are then the world's own. None to create a new one.
         """
         super().__init__(canvas)
-        self.game_over = game_over
-        self.game_items.clear()
-        self.score = 0        
-        
-        self.ship = SpaceShip(self.game_items, 400, 500, 50, 50)
-        self.game_items.append(self.ship)
+        self.profiler = profiler
+        self.seed = seed if seed is not None else random.randrange(2 ** 63)
+        self.input_queue = InputQueue()
+        if world is None:
+            world = GameWorld(clock, game_over, seed=self.seed, profiler=profiler)
+            world.input_queue = self.input_queue
+        self.world = world
+        if record_path is not None:
+            self.recorder = ReplayRecorder(record_path, self.world, self.seed)
+        self.scene = Scene(canvas, SpriteCache(canvas))
 
 
     def draw(self):
         """
-        Draws the game items on the canvas. Specifically draws the score and lives.
-        """
-        if self.ship.is_alive():
-            for item in self.game_items:
-                if item.is_alive():
-                    item.draw(self.canvas)
+        Updates the canvas items of the game items on the canvas. Specifically draws the score and lives.
 
-            self.canvas.create_text(700, 50, text=f"Score: {self.score}", font=("Helvetica", 16))
-            self.canvas.create_text(700, 100, text=f"Lives: {self.ship.lives}", font=("Helvetica", 16))
+        The screen draws the latest snapshot published by the world, never the game items themselves,
+        which the simulation thread may be changing at the same time.
+        The canvas items are created once and then only moved, updated or deleted, see Scene.
+        The viewport of the world follows the width of the canvas, see BaseScreen.on_resize().
+        The entities are drawn at the level of detail chosen by the QualityGovernor, and only inside the canvas.
 
-    
-    def update(self):
+        The simulation ticks at its own rate, usually not the frame rate. So that the entities move
+        smoothly, they are drawn between their previous and current positions, by the part of a tick
+        that passed since the snapshot was published. The entities are shown up to one tick late.
+
+        The screen has no static content, every frame updates all of its canvas items, so it is never
+        left dirty after a frame, and MainFrame skips the frames until the next tick once it is settled.
         """
-        Updates the game state.
+        self.dirty = False
+        snapshot = self.world.snapshot
+        if snapshot.is_over():
+            self.scene.clear()
+            return
 
-        This method is called every frame to update the game state.
+        if self.follow_width and self.width > 1:
+            self.world.resize(self.width)
 
-        The method checks for collisions between game items, creates new game items and deletes the game items that are not alive.
-        The method also checks if the player has pressed the arrow keys or the space key and moves the spaceship accordingly.
+        if self.interpolate:
+            alpha = (time.perf_counter() - snapshot.published) / self.world.clock.tick_length
+            entities = snapshot.interpolate(alpha)
+            self.settled = alpha >= 1
+        else:
+            entities = snapshot.entities
 
-        The method also checks if the player's spaceship is alive and if not, calls the game over callback function.
-        """
-        x_speed = 2
-        y_speed = 2
+        width, height = (self.width, self.height) if self.width > 1 else (None, None)
+        profiler = self.profiler
+        if profiler is not None and profiler.enabled:
+            start = time.perf_counter()
+            self.scene.sync(entities, self.detail, width, height)
+            profiler.record("scene", start)
+        else:
+            self.scene.sync(entities, self.detail, width, height)
+
+        hud = self.hud(snapshot)
+        if self.score_text is None:
+            self.score_text = self.canvas.create_text(700, 50, text=hud[0], font=("Helvetica", 16))
+            self.lives_text = self.canvas.create_text(700, 100, text=hud[1], font=("Helvetica", 16))
+        elif hud != self.shown_hud:
+            self.canvas.itemconfigure(self.score_text, text=hud[0])
+            self.canvas.itemconfigure(self.lives_text, text=hud[1])
+        self.shown_hud = hud
 
-        if not self.ship.is_alive():
-            return
 
-        if self.up_pressed:
-            self.ship.y -= y_speed
-        if self.down_pressed:
-            self.ship.y += y_speed
-        if self.left_pressed:
-            self.ship.x -= x_speed
-        if self.right_pressed:
-            self.ship.x += x_speed
-
-        for item in self.game_items:
-            if not item.is_alive():
-                self.game_items.remove(item)
-            elif isinstance(item, Bullet) or isinstance(item, Asteroid):
-                if item.y < 0 or item.y > 600 or item.x < 0 or item.x > 800:
-                    self.game_items.remove(item)
-
-        for i in range(len(self.game_items)-1, -1, -1):
-            for j in range(i-1, -1, -1):
-                item1 = self.game_items[i]
-                item2 = self.game_items[j]
-                if not item1.is_alive() or not item2.is_alive():
-                    continue
-                distance = ((item1.center_x() - item2.center_x())**2 + (item1.center_y() - item2.center_y())**2)**0.5
-                if distance < 20:
-                    if isinstance(item1, SpaceShip) and (isinstance(item2, Asteroid) or isinstance(item2, TheirBullet)) or (isinstance(item1, Asteroid) or isinstance(item1, TheirBullet)) and isinstance(item2, SpaceShip):
-                        item1.kill()
-                        item2.kill()
-                        if self.ship.is_alive() == False:
-                            self.game_over(self.score)
-                    if isinstance(item1, OurBullet) and (isinstance(item2, Asteroid) or isinstance(item2, Alien)) or (isinstance(item1, Asteroid) or isinstance(item1, Alien)) and isinstance(item2, OurBullet):
-                        item1.kill()
-                        item2.kill()
-                        self.score += 10                        
-
-        for item in self.game_items:
-            if item.is_alive():
-                item.move()
-
-        if time.time() - self.bullet_created_time > 1:
-            for item in self.game_items:
-                if item.is_alive() and isinstance(item, Alien):
-                    item.attack()
-            self.bullet_created_time = time.time()
-
-        if time.time() - self.asteroid_created_time > 3:
-            asteroid = Asteroid(self.game_items, random.randint(0, self.canvas.winfo_width()), 0, 1)
-            self.game_items.append(asteroid)
-            self.asteroid_created_time = time.time()
-
-        if time.time() - self.alien_created_time > 5 and len([item for item in self.game_items if isinstance(item, Alien)]) < 5:
-            alien = Alien(self.game_items, random.randint(0, self.canvas.winfo_width()), 0, "Alien")
-            self.game_items.append(alien)
-            self.alien_created_time = time.time()
-
-
-    def on_arrow_press(self, event):
-        """
-        Handles the arrow key press events.
+    def hud(self, snapshot):
+        """
+        Returns the two lines of the head-up display, the score and the lives.
 
         Parameters:
-        - event: The key press event object.
+        - snapshot: The FrameState being drawn.
+
+        Returns:
+        - tuple: The text of the first and the second line.
+        """
+        return f"Score: {snapshot.score}", f"Lives: {snapshot.lives}"
+
+    
+    def update(self):
+        """
+        Updates the game state for one simulation tick, see GameWorld.update(), and records the tick.
         """
-        if event.keysym == "Up":
-            self.up_pressed = True
-        elif event.keysym == "Down":
-            self.down_pressed = True
-        elif event.keysym == "Left":
-            self.left_pressed = True
-        elif event.keysym == "Right":
-            self.right_pressed = True
+        self.world.update()
+        if self.recorder is not None:
+            self.recorder.record(self.world)
 
 
-    def on_arrow_release(self, event):
+    def on_key_press(self, event):
         """
-        Handles the arrow key release events.
+        Handles the key press events: pushes the press of an arrow key or of the space key into the input queue.
 
         Parameters:
-        - event: The key release event object.
+        - event: The key press event object.
         """
-        if event.keysym == "Up":
-            self.up_pressed = False
-        elif event.keysym == "Down":
-            self.down_pressed = False
-        elif event.keysym == "Left":
-            self.left_pressed = False
-        elif event.keysym == "Right":
-            self.right_pressed = False
+        self.input_queue.push_event(event, True)
 
 
-    def on_space_press(self, event):
+    def on_key_release(self, event):
         """
-        Handles the space key press event.
+        Handles the key release events: pushes the release of an arrow key or of the space key into the input queue.
 
         Parameters:
-        - event: The key press event object.
+        - event: The key release event object.
         """
-        if (self.ship.is_alive()):
-            self.ship.attack()
+        self.input_queue.push_event(event, False)
 
 
     def bind_keys(self):
         """
         Binds the keyboard events to the canvas.
         """
-        self.canvas.bind("<KeyPress>", self.on_arrow_press)
-        self.canvas.bind("<KeyRelease>", self.on_arrow_release)
-        self.canvas.bind("<space>", self.on_space_press)
+        self.canvas.bind("<KeyPress>", self.on_key_press)
+        self.canvas.bind("<KeyRelease>", self.on_key_release)
 
 
     def unbind_keys(self):
         """
-        Unbinds the keyboard events from the canvas.
+        Unbinds the keyboard events from the canvas. The screen is left, so the recording ends here.
         """
         self.canvas.unbind("<KeyPress>")
         self.canvas.unbind("<KeyRelease>")
-        self.canvas.unbind("<space>")
+        if self.recorder is not None:
+            self.recorder.close()
@@ -12,7 +12,7 @@ class HighScoresScreen(BaseScreen):
 
     Methods:
     - __init__(self, canvas, high_scores, back_to_welcome): Initializes a new instance of the HighScoresScreen class.
-    - draw(self): Draws the high scores screen on the canvas.
+    - draw_static(self): Draws the high scores screen on the canvas.
     - bind_keys(self): Binds the 'b' key to the back_to_welcome function.
     - unbind_keys(self): Unbinds the 'b' key from the back_to_welcome function.
     """
@@ -34,20 +34,20 @@ class HighScoresScreen(BaseScreen):
         self.back_to_welcome = back_to_welcome
 
 
-    def draw(self):
+    def draw_static(self):
         """
-        Draws the high scores screen on the canvas.
+        Draws the high scores screen on the canvas. The text is created once and kept until the canvas is resized.
         """
-        center_x = self.canvas.winfo_width() / 2
+        center_x = self.width / 2
         title_y = 100
         scores_y = 200
         scores_gap = 30
         scores_font_size = 15
-        self.canvas.create_text(center_x, title_y, text="High Scores", font=("Helvetica", 30))
+        self.canvas.create_text(center_x, title_y, text="High Scores", font=("Helvetica", 30), tags=self.TAG)
         for i, (name, score) in enumerate(self.high_scores):
-            self.canvas.create_text(center_x, scores_y + i * scores_gap, text=f"{name}: {score}", font=("Helvetica", scores_font_size))
+            self.canvas.create_text(center_x, scores_y + i * scores_gap, text=f"{name}: {score}", font=("Helvetica", scores_font_size), tags=self.TAG)
 
-        self.canvas.create_text(center_x, scores_y + 7 * scores_gap, text="Press 'b' to go back to welcome screen", font=("Helvetica", scores_font_size))
+        self.canvas.create_text(center_x, scores_y + 7 * scores_gap, text="Press 'b' to go back to welcome screen", font=("Helvetica", scores_font_size), tags=self.TAG)
 
 
     def bind_keys(self):
@@ -0,0 +1,84 @@
+from screens.GameScreen import GameScreen
+from engine.ReplayPlayer import ReplayPlayer
+
+class ReplayScreen(GameScreen):
+    """
+    Represents the screen that plays a recorded match back at normal speed.
+    Inherits from the GameScreen class, and draws the replayed world the same way.
+
+    The replayed world is played with the recorded keys, not with the keyboard, and keeps the recorded
+    viewport width. Pressing 'b' or reaching the end of the recording goes back.
+    The recording is read by the simulation thread, which closes it once it is over. Leaving the screen
+    closes it from the Tk thread, see ReplayPlayer.close().
+
+    Attributes:
+    - player: The ReplayPlayer that replays the recording.
+    - back: The function to be called to leave the replay.
+
+    Methods:
+    - __init__(self, canvas, path, back): Initializes the ReplayScreen object.
+    - draw(self): Draws the replayed world, or goes back once the recording is over.
+    - update(self): Replays one tick of the recording, and closes it at the end.
+    - on_back(self, event): Closes the recording and goes back.
+    - bind_keys(self): Binds the 'b' key to go back.
+    - unbind_keys(self): Unbinds the 'b' key and closes the recording.
+    """
+    player: ReplayPlayer
+    back = None
+    follow_width = False
+
+    def __init__(self, canvas, path: str, back):
+        """
+        Initializes the ReplayScreen object.
+
+        Parameters:
+        - canvas: The tkinter Canvas object where the replay will be displayed.
+        - path: The path of the replay file.
+        - back: The function to be called to leave the replay.
+        """
+        player = ReplayPlayer(path)
+        world = player.start()
+        super().__init__(canvas, None, world.clock, seed=player.seed, world=world)
+        self.back = back
+        self.player = player
+
+
+    def draw(self):
+        """
+        Draws the replayed world, or goes back once the recording is over.
+        """
+        if self.player.finished():
+            self.back()
+            return
+        super().draw()
+
+
+    def update(self):
+        """
+        Replays one tick of the recording, see ReplayPlayer.step(), and closes it at the end.
+        """
+        if not self.player.step():
+            self.player.close()
+
+
+    def on_back(self, event=None):
+        """
+        Handles the 'b' key: closes the recording and goes back.
+        """
+        self.player.close()
+        self.back()
+
+
+    def bind_keys(self):
+        """
+        Binds the 'b' key to go back.
+        """
+        self.canvas.bind_all("<b>", self.on_back)
+
+
+    def unbind_keys(self):
+        """
+        Unbinds the 'b' key and closes the recording, whichever way the screen is left.
+        """
+        self.canvas.unbind_all("<b>")
+        self.player.close()
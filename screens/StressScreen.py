@@ -0,0 +1,143 @@
+import time
+from screens.BaseScreeen import BaseScreen
+from screens.GameScreen import GameScreen
+from engine.Profiler import Profiler
+from engine.SimulationClock import SimulationClock
+from engine.StressTest import StressTest
+
+class StressScreen(GameScreen):
+    """
+    Represents the stress test mode, a game that ramps up the spawn rates until thousands of entities are alive.
+    Inherits from the GameScreen class, and draws the world the same way.
+
+    The StressTest measures the tick time of every tick and the draw time of every frame on the way.
+    When it is over, or when 'b' is pressed, its report is written and its summary is shown on the canvas,
+    until 'b' is pressed to go back.
+
+    Attributes:
+    - stress: The StressTest that drives the world and collects the measures.
+    - back: The function to be called to leave the stress test.
+    - report_path: The path of the JSON report.
+    - summary: The table of the results, shown once the test is over, None before.
+
+    Methods:
+    - __init__(self, canvas, back, clock, profiler, report_path, seed): Initializes the StressScreen object.
+    - draw(self): Draws the world and records the draw time, or the results once the test is over.
+    - draw_static(self): Draws the results of the test.
+    - hud(self, snapshot): Returns the level and the entity count.
+    - update(self): Runs and measures one tick, and moves the test to its next level when due.
+    - finish(self): Ends the test, writes the report and shows its summary.
+    - on_back(self, event): Ends the test, or goes back once its results are shown.
+    - bind_keys(self): Binds the 'b' key.
+    - unbind_keys(self): Unbinds the 'b' key.
+    """
+    stress: StressTest
+    back = None
+    report_path = None
+    summary = None
+
+    def __init__(self, canvas, back, clock: SimulationClock, profiler: Profiler = None, report_path: str = "stress-report.json", seed: int = None):
+        """
+        Initializes the StressScreen object.
+
+        Parameters:
+        - canvas: The tkinter Canvas object where the test will be displayed.
+        - back: The function to be called to leave the stress test.
+        - clock: The simulation clock that drives the test.
+        - profiler: The Profiler to record the update and drawing phases into, or None.
+        - report_path: The path to write the JSON report to.
+        - seed: The seed of the world, None for a random one.
+        """
+        super().__init__(canvas, None, clock, profiler, seed=seed)
+        self.back = back
+        self.report_path = report_path
+        self.stress = StressTest(self.world)
+
+
+    def draw(self):
+        """
+        Draws the world and records the time the drawing took, without the wait for the frame.
+        Once the test is over, draws its results instead.
+        """
+        if self.stress.finished and self.summary is None:
+            self.finish()
+        if self.summary is not None:
+            BaseScreen.draw(self)
+            return
+        start = time.perf_counter()
+        super().draw()
+        self.stress.record_frame(time.perf_counter() - start)
+
+
+    def draw_static(self):
+        """
+        Draws the results of the test: the table of the plateaus and where the report was written.
+        """
+        center_x = self.width / 2
+        self.canvas.create_text(center_x, 80, text="Stress Test", font=("Helvetica", 30), tags=self.TAG)
+        self.canvas.create_text(center_x, 130, text=f"Report written to {self.report_path}", font=("Helvetica", 15), tags=self.TAG)
+        self.canvas.create_text(center_x, 170, text=self.summary, font=("Courier", 12), anchor="n", tags=self.TAG)
+        self.canvas.create_text(center_x, self.height - 60, text="Press 'b' to go back to welcome screen", font=("Helvetica", 15), tags=self.TAG)
+
+
+    def hud(self, snapshot):
+        """
+        Returns the level of the test and the entity count, instead of the score and the lives.
+        """
+        return f"Level: {self.stress.level}", f"Entities: {len(snapshot.entities)}"
+
+
+    def update(self):
+        """
+        Runs one tick, records its time and moves the test to its next level when due.
+        """
+        if self.stress.finished:
+            return
+        start = time.perf_counter()
+        super().update()
+        self.stress.record_tick(time.perf_counter() - start)
+        self.stress.advance()
+
+
+    def finish(self) -> str:
+        """
+        Ends the test, writes the report and replaces the world on the canvas by the summary of the results.
+
+        Returns:
+        - str: The summary of the results, see StressTest.summary().
+        """
+        if self.summary is None:
+            self.stress.finished = True
+            self.stress.write_report(self.report_path)
+            self.summary = self.stress.summary()
+            self.scene.clear()
+            if self.score_text is not None:
+                self.canvas.delete(self.score_text)
+                self.canvas.delete(self.lives_text)
+            self.settled = True
+            self.invalidate()
+        return self.summary
+
+
+    def on_back(self, event=None):
+        """
+        Handles the 'b' key: ends the test and shows its results, or goes back once they are shown.
+        """
+        if self.summary is None:
+            self.finish()
+        else:
+            self.back()
+
+
+    def bind_keys(self):
+        """
+        Binds the 'b' key to end the test, then to go back.
+        """
+        self.canvas.bind_all("<b>", self.on_back)
+
+
+    def unbind_keys(self):
+        """
+        Unbinds the 'b' key.
+        """
+        self.canvas.unbind_all("<b>")
@@ -9,10 +9,11 @@ class WelcomeScreen(BaseScreen):
     - start_game (function): The function to be called when the 's' key is pressed.
     - show_high_scores (function): The function to be called when the 'h' key is pressed.
     - show_credits (function): The function to be called when the 'c' key is pressed.
+    - start_stress (function): The function to be called when the 't' key is pressed.
 
     Methods:
-    - __init__(self, canvas, start_game, show_high_scores, show_credits): Initializes a WelcomeScreen object.
-    - draw(self): Draws the welcome screen on the canvas.
+    - __init__(self, canvas, start_game, show_high_scores, show_credits, start_stress): Initializes a WelcomeScreen object.
+    - draw_static(self): Draws the welcome screen on the canvas.
     - bind_keys(self): Binds the keyboard keys to their respective functions.
     - unbind_keys(self): Unbinds the keyboard keys.
     """
@@ -20,8 +21,9 @@ class WelcomeScreen(BaseScreen):
     start_game = None
     show_high_scores = None
     show_credits = None
+    start_stress = None
 
-    def __init__(self, canvas, start_game, show_high_scores, show_credits):
+    def __init__(self, canvas, start_game, show_high_scores, show_credits, start_stress=None):
         """
         Initializes a WelcomeScreen object.
 
@@ -30,25 +32,29 @@ class WelcomeScreen(BaseScreen):
         - start_game (function): The function to be called when the 's' key is pressed.
         - show_high_scores (function): The function to be called when the 'h' key is pressed.
         - show_credits (function): The function to be called when the 'c' key is pressed.
+        - start_stress (function): The function to be called when the 't' key is pressed, or None for no stress test.
         """
         super().__init__(canvas)
         self.start_game = start_game
         self.show_high_scores = show_high_scores
         self.show_credits = show_credits
+        self.start_stress = start_stress
 
-    def draw(self):
+    def draw_static(self):
         """
-        Draws the welcome screen on the canvas.
+        Draws the welcome screen on the canvas. The text is created once and kept until the canvas is resized.
         """
-        center_x = self.canvas.winfo_width() / 2
+        center_x = self.width / 2
         welcome_y = 100
         keys_y = 200
         keys_gap = 30
         keys_font_size = 15
-        self.canvas.create_text(center_x, welcome_y, text="Welcome to Space Fighters", font=("Helvetica", 30))
-        self.canvas.create_text(center_x, keys_y + 0 * keys_gap, text="Press 's' to start the game", font=("Helvetica", keys_font_size))
-        self.canvas.create_text(center_x, keys_y + 1 * keys_gap, text="Press 'h' to see high scores", font=("Helvetica", keys_font_size))
-        self.canvas.create_text(center_x, keys_y + 2 * keys_gap, text="Press 'c' to see credits", font=("Helvetica", keys_font_size))
+        self.canvas.create_text(center_x, welcome_y, text="Welcome to Space Fighters", font=("Helvetica", 30), tags=self.TAG)
+        self.canvas.create_text(center_x, keys_y + 0 * keys_gap, text="Press 's' to start the game", font=("Helvetica", keys_font_size), tags=self.TAG)
+        self.canvas.create_text(center_x, keys_y + 1 * keys_gap, text="Press 'h' to see high scores", font=("Helvetica", keys_font_size), tags=self.TAG)
+        self.canvas.create_text(center_x, keys_y + 2 * keys_gap, text="Press 'c' to see credits", font=("Helvetica", keys_font_size), tags=self.TAG)
+        if self.start_stress is not None:
+            self.canvas.create_text(center_x, keys_y + 3 * keys_gap, text="Press 't' to run the stress test", font=("Helvetica", keys_font_size), tags=self.TAG)
 
     def bind_keys(self):
         """
@@ -57,6 +63,8 @@ class WelcomeScreen(BaseScreen):
         self.canvas.bind_all("<s>", self.start_game)
         self.canvas.bind_all("<h>", self.show_high_scores)
         self.canvas.bind_all("<c>", self.show_credits)
+        if self.start_stress is not None:
+            self.canvas.bind_all("<t>", self.start_stress)
     
     def unbind_keys(self):
         """
@@ -65,3 +73,4 @@ class WelcomeScreen(BaseScreen):
         self.canvas.unbind_all("<s>")
         self.canvas.unbind_all("<h>")
         self.canvas.unbind_all("<c>")
+        self.canvas.unbind_all("<t>")
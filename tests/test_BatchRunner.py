@@ -0,0 +1,32 @@
+import random
+
+from BatchRunner import run_game, split_seed
+
+
+def sequence(seed, count=20):
+    rng = random.Random(seed)
+    return [rng.random() for _ in range(count)]
+
+
+def test_split_seed_is_deterministic():
+    assert split_seed(12) == split_seed(12)
+
+
+def test_sibling_seeds_give_different_sequences():
+    world_seed, pilot_seed = split_seed(12)
+    assert world_seed != pilot_seed
+    assert sequence(world_seed) != sequence(pilot_seed)
+    assert sequence(world_seed) != sequence(12)
+    assert sequence(pilot_seed) != sequence(12)
+
+
+def test_neighbouring_jobs_get_unrelated_seeds():
+    seeds = [seed for job in range(100) for seed in split_seed(job)]
+    assert len(set(seeds)) == len(seeds)
+
+
+def test_run_game_only_depends_on_the_job():
+    job = {"game": 0, "seed": 3, "params": {}, "max_ticks": 300, "tick_length": 0.01}
+    first, second = run_game(job), run_game(dict(job))
+    for field in ("score", "kills", "ticks", "game_over", "peak_items"):
+        assert first[field] == second[field], field
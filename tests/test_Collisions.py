@@ -0,0 +1,139 @@
+import pickle
+
+import pytest
+
+from benchmarks.Benchmark import build_world
+from engine.GameWorld import GameWorld
+from items.Alien import Alien
+from items.Asteroid import Asteroid
+from items.Bullet import OurBullet, TheirBullet
+
+
+def brute_force_collide(world):
+    """
+    Checks every pair of game items against each other, the way the rules define the collisions.
+    """
+    store = world.store
+    items = world.game_items
+    scale = world.clock.scale
+    hits = []
+    for i, item1 in enumerate(items):
+        for j in range(i):
+            item2 = items[j]
+            if not item1.is_alive() or not item2.is_alive() or not item1.mask & item2.layer:
+                continue
+            toi = GameWorld.time_of_impact(
+                float(store.x[item1.row] + store.offset_x[item1.row]) - float(store.x[item2.row] + store.offset_x[item2.row]),
+                float(store.y[item1.row] + store.offset_y[item1.row]) - float(store.y[item2.row] + store.offset_y[item2.row]),
+                float(store.speed[item1.row] * scale) - float(store.speed[item2.row] * scale),
+                world.collision_reach[item1.kind][item2.kind])
+            if toi is not None:
+                hits.append((toi, -i, -j))
+    hits.sort()
+    for _, i, j in hits:
+        item1, item2 = items[-i], items[-j]
+        if item1.is_alive() and item2.is_alive():
+            world.collision_handlers[item1.kind, item2.kind](item1, item2)
+
+
+def outcome(world):
+    return world.score, world.kills, [item.lives for item in world.game_items]
+
+
+@pytest.mark.parametrize("size", [5, 20, 150, 600])
+@pytest.mark.parametrize("ticks", [1, 6])
+def test_collide_matches_a_pairwise_check(size, ticks):
+    world = build_world(size, size)
+    world.clock.tick_length *= ticks
+    expected = pickle.loads(pickle.dumps(world))
+
+    world.collide()
+    brute_force_collide(expected)
+
+    assert outcome(world) == outcome(expected)
+
+
+def test_fast_bullet_does_not_tunnel_through_an_asteroid():
+    world = build_world(1, 0)
+    asteroid = Asteroid(world.store, 300, 200, 0)
+    # The bullet starts 70 px below the center of the asteroid and moves 150 px up in the tick.
+    bullet = OurBullet(world.store, asteroid.center_x(), asteroid.center_y() + 70, 3, -150)
+    world.add(asteroid)
+    world.add(bullet)
+
+    world.collide()
+
+    assert not asteroid.is_alive()
+    assert not bullet.is_alive()
+    assert world.kills == 1
+
+
+def test_handlers_cover_exactly_the_kinds_that_collide():
+    world = build_world(1, 0)
+    kinds = range(len(world.ITEM_CLASSES))
+    colliding = {(kind1, kind2) for kind1 in kinds for kind2 in kinds
+                 if world.collision_masks[kind1] & world.collision_layers[kind2]}
+
+    assert set(world.collision_handlers) == colliding
+    assert {(kind2, kind1) for kind1, kind2 in colliding} == colliding
+    assert set(world.collision_pairs) == {pair for pair in colliding if pair[0] <= pair[1]}
+
+
+def overlapping(world, target, bullet_cls):
+    """
+    Adds the target and a bullet of bullet_cls on its center to the world, and returns the bullet.
+    """
+    bullet = bullet_cls(world.store, target.center_x(), target.center_y(), 3, 0)
+    if target is not world.ship:
+        world.add(target)
+    world.add(bullet)
+    return bullet
+
+
+@pytest.mark.parametrize("cls, args", [(Asteroid, (0,)), (Alien, ("Alien",))])
+def test_our_bullet_shoots_down_asteroids_and_aliens(cls, args):
+    world = build_world(1, 0)
+    target = cls(world.store, 300, 200, *args)
+    bullet = overlapping(world, target, OurBullet)
+
+    world.collide()
+
+    assert not target.is_alive() and not bullet.is_alive()
+    assert (world.score, world.kills) == (10, 1)
+
+
+def test_their_bullet_damages_the_spaceship():
+    world = build_world(1, 0)
+    lives = world.ship.lives
+    bullet = overlapping(world, world.ship, TheirBullet)
+
+    world.collide()
+
+    assert world.ship.lives == lives - 1 and not bullet.is_alive()
+    assert world.score == 0
+
+
+def test_kinds_without_a_handler_pass_through_each_other():
+    world = build_world(1, 0)
+    alien = Alien(world.store, 300, 200, "Alien")
+    bullet = overlapping(world, alien, TheirBullet)
+    asteroid = Asteroid(world.store, 300, 200, 0)
+    world.add(asteroid)
+
+    world.collide()
+
+    assert alien.is_alive() and bullet.is_alive() and asteroid.is_alive()
+
+
+@pytest.mark.parametrize("cls, args", [(Asteroid, (0,)), (Alien, ("Alien",))])
+def test_collision_radius_matches_the_drawn_size(cls, args):
+    for distance, hit in ((cls.collision_radius + 2, True), (cls.collision_radius + 4, False)):
+        world = build_world(1, 0)
+        item = cls(world.store, 300, 200, *args)
+        bullet = OurBullet(world.store, item.center_x() + distance, item.center_y(), 3, 0)
+        world.add(item)
+        world.add(bullet)
+
+        world.collide()
+
+        assert item.is_alive() != hit
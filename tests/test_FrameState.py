@@ -0,0 +1,56 @@
+import pytest
+
+from engine.FrameState import FrameState
+from engine.GameWorld import GameWorld
+from engine.SimulationClock import SimulationClock
+from items.Alien import Alien
+
+
+def position(entities, item):
+    for entity, x, y in entities:
+        if entity is item:
+            return x, y
+    raise AssertionError(f"{item} was not published")
+
+
+def test_interpolate_blends_steps_and_keeps_jumps():
+    near, far = object(), object()
+    state = FrameState(1, ((near, 12.0, 20.0), (far, 0.0, 20.0)), 0, 3, ((10.0, 20.0), (598.0, 20.0)), 0.0, 5.0)
+
+    entities = state.interpolate(0.5)
+
+    assert position(entities, near) == (11.0, 20.0)
+    assert position(entities, far) == (0.0, 20.0)
+    assert state.interpolate(1.0) is state.entities
+
+
+def test_wrapped_alien_is_drawn_at_its_current_position():
+    world = GameWorld(SimulationClock(), None, 800, 600, None, 1)
+    alien = Alien(world.store, 601, 100, "Alien")
+    alien.direction = 1
+    world.add(alien)
+
+    world.update()
+
+    snapshot = world.snapshot
+    assert alien.x < 10
+    for alpha in (0.0, 0.25, 0.5, 0.99):
+        assert position(snapshot.interpolate(alpha), alien) == (alien.x, alien.y)
+
+
+def test_teleported_ship_is_drawn_at_its_current_position():
+    world = GameWorld(SimulationClock(), None, 800, 600, None, 1)
+    world.update()
+    world.store.remember()
+    alien = Alien(world.store, 300, 100, "Alien")
+    alien.direction = 1
+    world.add(alien)
+    alien.x = 301
+    world.ship.x = 50
+    world.publish()
+
+    entities = world.snapshot.interpolate(0.5)
+
+    assert position(entities, world.ship) == (50, world.ship.y)
+    # A legitimate step is still blended.
+    assert position(entities, alien) == pytest.approx((300.5, 100))
@@ -0,0 +1,68 @@
+from engine.InputQueue import InputQueue
+from engine.InputSource import UP, LEFT, FIRE
+
+
+def test_press_and_release_in_one_tick_still_fires_once():
+    queue = InputQueue()
+    queue.push(FIRE, True, 1.0)
+    queue.push(FIRE, False, 1.001)
+    assert queue.drain(1.002) & FIRE
+    assert queue.drain(1.1) == 0
+
+
+def test_repeated_presses_of_a_held_key_are_dropped():
+    queue = InputQueue()
+    assert queue.push(UP, True, 1.0)
+    assert not queue.push(UP, True, 1.03)
+    assert not queue.push(LEFT, False, 1.04)
+    assert queue.drain(1.05) == UP
+
+
+def test_release_and_press_within_the_repeat_gap_keep_the_key_held():
+    queue = InputQueue(repeat_gap=0.005)
+    queue.push(UP, True, 1.0)
+    assert queue.drain(1.01) == UP
+    # X11 repeats a held key as a release and a press at the same time.
+    queue.push(UP, False, 1.5)
+    queue.push(UP, True, 1.5)
+    assert queue.drain(1.51) == UP
+
+
+def test_real_release_is_applied_once_the_repeat_gap_has_passed():
+    queue = InputQueue(repeat_gap=0.005)
+    queue.push(UP, True, 1.0)
+    queue.drain(1.001)
+    queue.push(UP, False, 1.002)
+    assert queue.drain(1.003) == UP
+    assert queue.drain(1.01) == 0
+
+
+def test_overflow_resyncs_to_the_keys_held_by_the_producer():
+    queue = InputQueue(capacity=2)
+    queue.push(UP, True, 1.0)
+    queue.push(LEFT, True, 1.0)
+    queue.push(UP, False, 1.0)
+    assert queue.dropped == 1
+    assert queue.drain(2.0) == LEFT
+    assert queue.drain(2.01) == LEFT
+
+
+def test_held_space_key_fires_again_after_the_delay_then_at_the_interval():
+    queue = InputQueue(fire_delay=5, fire_interval=2)
+    queue.push(FIRE, True, 1.0)
+    fired = [bool(queue.drain(1.0 + tick * 0.01) & FIRE) for tick in range(12)]
+    assert [tick for tick, fire in enumerate(fired) if fire] == [0, 5, 7, 9, 11]
+
+    queue.push(FIRE, False, 2.0)
+    assert [bool(queue.drain(2.0 + tick * 0.01) & FIRE) for tick in range(1, 10)] == [False] * 9
+
+
+def test_new_press_restarts_the_fire_delay():
+    queue = InputQueue(fire_delay=5, fire_interval=2)
+    queue.push(FIRE, True, 1.0)
+    queue.drain(1.0)
+    queue.push(FIRE, False, 1.001)
+    queue.drain(1.01)
+    queue.push(FIRE, True, 1.02)
+    fired = [bool(queue.drain(1.02 + tick * 0.01) & FIRE) for tick in range(7)]
+    assert [tick for tick, fire in enumerate(fired) if fire] == [0, 5]
@@ -0,0 +1,60 @@
+import pytest
+
+from Leaderboard import Leaderboard
+from ScoreWriter import ScoreWriter
+
+
+@pytest.fixture(params=[False, True], ids=["inline", "writer"])
+def leaderboard(request, tmp_path):
+    board = Leaderboard(str(tmp_path / "scores.db"), writer=ScoreWriter() if request.param else None)
+    yield board
+    board.close()
+
+
+def flush(board):
+    board.save()
+    if board.writer is not None:
+        board.writer.flush()
+
+
+def test_best_keeps_the_highest_score_of_every_player(leaderboard):
+    for name, score in [("ann", 30), ("bob", 50), ("ann", 80), ("ann", 40), ("bob", 50), ("cid", 10)]:
+        leaderboard.add_score(name, score)
+    flush(leaderboard)
+
+    assert leaderboard.best("ann") == 80
+    assert leaderboard.best("bob") == 50
+    assert leaderboard.best("dan") is None
+    assert leaderboard.players() == 3
+    assert leaderboard.count() == 6
+    assert leaderboard.top(2) == [("ann", 80), ("bob", 50)]
+
+
+def test_lower_or_equal_score_does_not_touch_the_best(leaderboard):
+    leaderboard.add_score("ann", 80)
+    flush(leaderboard)
+    best_time = leaderboard.connection.execute("SELECT time FROM bests WHERE name = 'ann'").fetchone()[0]
+
+    leaderboard.add_score("ann", 80)
+    leaderboard.add_score("ann", 20)
+    flush(leaderboard)
+
+    row = leaderboard.connection.execute("SELECT score, time FROM bests WHERE name = 'ann'").fetchone()
+    assert row == (80, best_time)
+    assert sorted(score for _, score, _ in leaderboard.history("ann")) == [20, 80, 80]
+
+
+def test_add_scores_matches_one_by_one(leaderboard, tmp_path):
+    scores = [("ann", 30), ("bob", 50), ("ann", 80), ("cid", -5), ("bob", 70)]
+    leaderboard.add_scores(scores)
+    leaderboard.load()
+
+    single = Leaderboard(str(tmp_path / "single.db"))
+    try:
+        for name, score in scores:
+            single.add_score(name, score)
+        single.save()
+        assert leaderboard.top(10) == single.top(10) == [("ann", 80), ("bob", 70), ("cid", -5)]
+        assert leaderboard.rank(70) == 2
+    finally:
+        single.close()
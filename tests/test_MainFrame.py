@@ -0,0 +1,73 @@
+from MainFrame import MainFrame
+from benchmarks.RecordingCanvas import RecordingCanvas, RecordingImage
+from engine.FramePacer import FramePacer
+from engine.Profiler import Profiler
+from engine.QualityGovernor import QualityGovernor
+from engine.Scene import Scene
+from engine.SimulationClock import SimulationClock
+from engine.SpriteCache import SpriteCache
+from screens.GameScreen import GameScreen
+
+
+def make_frame(screen, canvas, clock):
+    """
+    Builds a MainFrame without a Tk window, with what its draw() uses.
+    """
+    frame = MainFrame.__new__(MainFrame)
+    frame.canvas = canvas
+    frame.clock = clock
+    frame.profiler = Profiler()
+    frame.pacer = FramePacer()
+    frame.governor = QualityGovernor(frame.pacer.interval)
+    frame.after = lambda delay, callback: None
+    frame.screen = screen
+    return frame
+
+
+def make_game_screen(canvas, clock):
+    screen = GameScreen(canvas, lambda score: None, clock, seed=1)
+    screen.scene = Scene(canvas, SpriteCache(canvas, RecordingImage))
+    return screen
+
+
+def test_game_screen_is_not_dirty_after_draw():
+    canvas = RecordingCanvas()
+    screen = make_game_screen(canvas, SimulationClock())
+    assert screen.dirty
+    screen.draw()
+    assert not screen.dirty
+
+
+def test_settled_game_screen_skips_frames_until_the_next_tick():
+    canvas = RecordingCanvas()
+    # Ticks this short make every frame settled: a whole tick has passed since the snapshot was published.
+    clock = SimulationClock(1e-9)
+    screen = make_game_screen(canvas, clock)
+    frame = make_frame(screen, canvas, clock)
+
+    frame.draw()
+    assert frame.pacer.skipped == 0
+    calls = canvas.total()
+
+    frame.draw()
+    assert frame.pacer.skipped == 1
+    assert canvas.total() == calls
+
+    screen.update()
+    clock.tick()
+    frame.draw()
+    assert frame.pacer.skipped == 1
+
+
+def test_invalidated_screen_is_drawn_again():
+    canvas = RecordingCanvas()
+    clock = SimulationClock(1e-9)
+    screen = make_game_screen(canvas, clock)
+    frame = make_frame(screen, canvas, clock)
+
+    frame.draw()
+    screen.invalidate()
+    frame.draw()
+    assert frame.pacer.skipped == 0
+    frame.draw()
+    assert frame.pacer.skipped == 1
@@ -0,0 +1,149 @@
+from benchmarks.RecordingCanvas import RecordingCanvas
+from engine.GameWorld import GameWorld
+from engine.InputSource import RandomInput
+from engine.ReplayPlayer import ReplayPlayer
+from engine.ReplayRecorder import ReplayRecorder
+from engine.SimulationClock import SimulationClock
+from screens.ReplayScreen import ReplayScreen
+
+COLUMNS = ("x", "y", "previous_x", "previous_y", "speed", "lives", "kind", "offset_x", "offset_y")
+TICKS = 1200
+KEYFRAME_INTERVAL = 100
+
+
+def state(world):
+    """
+    Returns everything the next ticks of a world depend on, in a form that can be compared.
+    """
+    store = world.store
+    rows = store.count
+    return (world.clock.ticks, world.score, world.kills, world.ship.lives, world.width, world.keys,
+            world.rng.getstate(), sorted(store.free),
+            tuple(getattr(store, name)[:rows].tobytes() for name in COLUMNS))
+
+
+def record(path):
+    """
+    Records a match played by a random pilot, as GameScreen does, and returns the state of the world
+    at the start of every tick a keyframe is written for, by tick.
+    """
+    clock = SimulationClock()
+    clock.ticks = 50
+    world = GameWorld(clock, None, 800, 600, None, 42)
+    recorder = ReplayRecorder(str(path), world, 42, keyframe_interval=KEYFRAME_INTERVAL)
+    # The simulation thread may tick the clock before the first update of a new world.
+    for _ in range(37):
+        clock.tick()
+    pilot = RandomInput(7)
+    states = {0: None}
+    tick = 0
+    while tick < TICKS and not world.is_over():
+        if tick == 250:
+            world.resize(900)
+        world.apply_input(pilot.poll(tick))
+        world.update()
+        recorder.record(world)
+        clock.tick()
+        tick += 1
+        if tick % KEYFRAME_INTERVAL == 0:
+            states[tick] = state(world)
+    recorder.close()
+    states["end"] = state(world)
+    states["ticks"] = tick
+    return states
+
+
+def test_replay_matches_the_recording_at_every_keyframe(tmp_path):
+    path = tmp_path / "match.sfr"
+    states = record(path)
+    player = ReplayPlayer(str(path))
+    try:
+        assert player.end == states["ticks"]
+        assert [tick for tick, _ in player.index] == [tick for tick in states if isinstance(tick, int) and tick > 0]
+
+        player.start(0)
+        checked = 0
+        while player.step():
+            if player.tick % KEYFRAME_INTERVAL == 0:
+                assert state(player.world) == states[player.tick], player.tick
+                checked += 1
+        assert checked == len(player.index)
+        assert state(player.world) == states["end"]
+    finally:
+        player.close()
+
+
+def test_seeking_to_a_keyframe_restores_the_recorded_state(tmp_path):
+    path = tmp_path / "match.sfr"
+    states = record(path)
+    player = ReplayPlayer(str(path))
+    try:
+        for tick, _ in player.index:
+            player.start(tick)
+            assert player.tick == tick
+            assert state(player.world) == states[tick], tick
+        player.start(KEYFRAME_INTERVAL + 33)
+        player.run()
+        assert state(player.world) == states["end"]
+    finally:
+        player.close()
+
+
+class KeyCanvas(RecordingCanvas):
+    """
+    A RecordingCanvas that keeps the key bindings of the screens.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.bindings = {}
+
+    def bind_all(self, sequence, callback):
+        self.bindings[sequence] = callback
+
+    def unbind_all(self, sequence):
+        self.bindings.pop(sequence, None)
+
+
+def test_replay_screen_plays_the_recorded_world(tmp_path):
+    path = tmp_path / "match.sfr"
+    states = record(path)
+    screen = ReplayScreen(KeyCanvas(), str(path), lambda: None)
+    try:
+        assert screen.world is screen.player.world
+        assert screen.world.input_queue is None
+        for _ in range(KEYFRAME_INTERVAL):
+            screen.update()
+        assert state(screen.world) == states[KEYFRAME_INTERVAL]
+    finally:
+        screen.player.close()
+
+
+def test_replay_screen_closes_the_recording_when_left(tmp_path):
+    path = tmp_path / "match.sfr"
+    record(path)
+    backs = []
+    canvas = KeyCanvas()
+    screen = ReplayScreen(canvas, str(path), lambda: backs.append(True))
+    screen.bind_keys()
+    screen.update()
+
+    canvas.bindings["<b>"](None)
+    assert backs == [True]
+    assert screen.player.file is None
+    tick = screen.player.tick
+    screen.update()
+    assert screen.player.tick == tick
+
+    screen.unbind_keys()
+    assert "<b>" not in canvas.bindings
+    assert screen.player.file is None
+
+
+def test_replay_screen_closes_the_recording_when_unbound(tmp_path):
+    path = tmp_path / "match.sfr"
+    record(path)
+    screen = ReplayScreen(KeyCanvas(), str(path), lambda: None)
+    screen.bind_keys()
+    screen.unbind_keys()
+    assert screen.player.file is None
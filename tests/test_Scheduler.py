@@ -0,0 +1,50 @@
+from engine.Scheduler import Scheduler
+
+
+def test_events_run_by_due_time_then_in_scheduling_order():
+    scheduler = Scheduler()
+    ran = []
+    for due, name in [(3.0, "c"), (1.0, "a"), (2.0, "b1"), (2.0, "b2"), (5.0, "late")]:
+        scheduler.schedule(due, ran.append, name)
+
+    assert scheduler.run(4.0) == 4
+    assert ran == ["a", "b1", "b2", "c"]
+    assert len(scheduler) == 1
+
+
+def test_event_due_now_waits_for_the_next_run():
+    scheduler = Scheduler()
+    ran = []
+    scheduler.schedule(1.0, ran.append, "due")
+    assert scheduler.run(1.0) == 0
+    assert scheduler.run(1.01) == 1
+    assert ran == ["due"]
+
+
+def test_cancelled_event_never_runs():
+    scheduler = Scheduler()
+    ran = []
+    scheduler.schedule(1.0, ran.append, "kept")
+    dropped = scheduler.schedule(1.0, ran.append, "dropped")
+    scheduler.cancel(dropped)
+
+    assert scheduler.run(2.0) == 1
+    assert ran == ["kept"]
+    assert len(scheduler) == 0
+
+
+def test_recurring_event_runs_once_per_interval():
+    scheduler = Scheduler()
+    times = []
+
+    def volley(due):
+        times.append(due)
+        scheduler.schedule(due + 1.0, volley, due + 1.0)
+
+    scheduler.schedule(1.0, volley, 1.0)
+    for tick in range(1, 551):
+        scheduler.run(tick * 0.01)
+    # A run catches up on every interval that passed, not only the first one.
+    scheduler.run(8.5)
+
+    assert times == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0]
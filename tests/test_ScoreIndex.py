@@ -0,0 +1,70 @@
+import math
+import random
+
+import pytest
+
+from ScoreIndex import ScoreIndex
+
+
+def brute_rank(scores, score):
+    return 1 + sum(1 for s in scores if s > score)
+
+
+def brute_percentile(scores, score):
+    if not scores:
+        return 100.0
+    return 100.0 * sum(1 for s in scores if s < score) / len(scores)
+
+
+def brute_score_at(scores, percentile):
+    ordered = sorted(scores)
+    target = max(1, math.ceil(percentile * len(ordered) / 100))
+    return ordered[target - 1]
+
+
+def test_rank_matches_a_sorted_list():
+    rng = random.Random(7)
+    # Few distinct values, so most scores are duplicates, and values past the first tree size, so it grows.
+    scores = [rng.choice([0, 0, 3, 5, 5, 5, 40, 1000, 70000]) for _ in range(500)]
+    index = ScoreIndex()
+    for score in scores:
+        index.add(score)
+
+    assert len(index) == len(scores)
+    for score in sorted(set(scores)) + [-10, -1, 1, 4, 6, 999, 1001, 10 ** 6]:
+        assert index.rank(score) == brute_rank(scores, score), score
+        assert index.percentile(score) == pytest.approx(brute_percentile(scores, score)), score
+    for percentile in (0, 1, 25, 50, 75, 99, 100):
+        assert index.score_at(percentile) == brute_score_at(scores, percentile), percentile
+
+
+def test_counts_constructor_matches_adds():
+    rng = random.Random(3)
+    scores = [rng.randrange(0, 300) for _ in range(200)]
+    counts = {}
+    for score in scores:
+        counts[score] = counts.get(score, 0) + 1
+    built = ScoreIndex(counts)
+    added = ScoreIndex()
+    for score in scores:
+        added.add(score)
+
+    assert list(built.items()) == list(added.items())
+    for score in range(-2, 305):
+        assert built.rank(score) == added.rank(score) == brute_rank(scores, score)
+
+
+def test_empty_index():
+    index = ScoreIndex()
+    assert index.rank(10) == 1
+    assert index.percentile(10) == 100.0
+    assert index.score_at(50) is None
+
+
+def test_negative_scores_are_rejected():
+    index = ScoreIndex()
+    with pytest.raises(ValueError):
+        index.add(-5)
+    with pytest.raises(ValueError):
+        ScoreIndex({3: 1, -1: 2})
+    assert len(index) == 0
@@ -0,0 +1,44 @@
+import pytest
+
+from engine.SimulationClock import SimulationClock
+
+
+def test_first_advance_only_starts_the_clock():
+    clock = SimulationClock(0.01)
+    assert clock.advance(100.0) == 0
+    assert clock.remaining() == pytest.approx(0.01)
+
+
+def test_ticks_follow_the_wall_time_and_keep_the_remainder():
+    clock = SimulationClock(0.01)
+    clock.advance(0.0)
+    assert clock.advance(0.025) == 2
+    assert clock.accumulator == pytest.approx(0.005)
+    assert clock.remaining() == pytest.approx(0.005)
+    assert clock.advance(0.031) == 1
+    assert clock.advance(0.032) == 0
+
+
+def test_catch_up_is_capped_and_the_backlog_dropped():
+    clock = SimulationClock(0.01, max_catch_up=5)
+    clock.advance(0.0)
+    # A stall of a second would be 100 ticks: only max_catch_up run, the rest is dropped.
+    assert clock.advance(1.0) == 5
+    assert clock.accumulator == 0.0
+    assert clock.advance(1.012) == 1
+
+
+def test_backlog_up_to_the_cap_is_caught_up_in_full():
+    clock = SimulationClock(0.01, max_catch_up=5)
+    clock.advance(0.0)
+    assert clock.advance(0.0501) == 5
+    assert clock.accumulator == pytest.approx(0.0001)
+
+
+def test_time_and_scale_follow_the_tick_length():
+    clock = SimulationClock(0.02)
+    for _ in range(3):
+        clock.tick()
+    assert clock.ticks == 3
+    assert clock.time == pytest.approx(0.06)
+    assert clock.scale == pytest.approx(2.0)
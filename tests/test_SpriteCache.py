@@ -0,0 +1,25 @@
+from benchmarks.RecordingCanvas import RecordingCanvas, RecordingImage
+from engine.SpriteCache import SpriteCache
+
+
+class ColorCanvas(RecordingCanvas):
+    """
+    A RecordingCanvas that knows the RGB value of one color name, as Tk would.
+    """
+
+    def __init__(self, name, rgb):
+        super().__init__()
+        self.colors = {name: rgb}
+
+    def winfo_rgb(self, color):
+        return self.colors[color]
+
+
+def test_colors_asked_from_tk_stay_in_their_cache():
+    first = SpriteCache(ColorCanvas("mint", (0xbd00, 0xfc00, 0xc900)), RecordingImage)
+    second = SpriteCache(ColorCanvas("mint", (0x3e00, 0xb400, 0x8900)), RecordingImage)
+
+    assert first.rgb("mint") == "#bdfcc9"
+    assert second.rgb("mint") == "#3eb489"
+    assert "mint" not in SpriteCache.COLORS
+    assert first.rgb("red") == SpriteCache.COLORS["red"]